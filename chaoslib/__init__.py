@@ -1,11 +1,14 @@
+import contextvars
 import decimal
 import hashlib
 import json
 import logging
 import os.path
+import threading
 import uuid
-from collections import ChainMap
-from collections.abc import Mapping
+from collections import ChainMap, OrderedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
 from importlib.metadata import PackageNotFoundError, version
 from json.decoder import JSONDecodeError
@@ -13,9 +16,6 @@ from json.encoder import JSONEncoder
 from string import Template
 from typing import Any
 
-import yaml
-from charset_normalizer import detect
-
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import (
     Configuration,
@@ -26,14 +26,22 @@ from chaoslib.types import (
 )
 
 __all__ = [
+    "ContextThreadPoolExecutor",
     "PayloadEncoder",
+    "SubstitutionPlan",
     "__version__",
     "canonical_json",
+    "clear_encoding_cache",
+    "clear_substitution_plans",
+    "compile_substitution",
     "convert_vars",
     "decode_bytes",
+    "detect_encoding",
     "experiment_hash",
     "merge_vars",
     "substitute",
+    "substitute_with_plan",
+    "use_substitution_plans",
 ]
 logger = logging.getLogger("chaostoolkit-lib")
 
@@ -149,16 +157,287 @@ def substitute_in_sequence(
     return new_value
 
 
-def decode_bytes(data: bytes, default_encoding: str = "utf-8") -> str:
+class SubstitutionPlan:
+    """
+    The result of compiling a payload for substitution. It remembers the
+    path of every string leaf that contains a pattern, along with its
+    template, so that applying the plan does not need to walk the payload
+    again.
+
+    Applying the plan returns a copy of the containers of the payload, as
+    `substitute` does, so the value it returns may be freely modified.
+    """
+
+    __slots__ = ("data", "templates")
+
+    def __init__(self, data: Any, templates: dict[tuple, "TypedTemplate"]):
+        self.data = data
+        self.templates = templates
+
+    @property
+    def is_static(self) -> bool:
+        return not self.templates
+
+    def apply(self, configuration: Configuration, secrets: Secrets) -> Any:
+        data = self.data
+        if not isinstance(data, (dict, list, tuple)):
+            template = self.templates.get(())
+            if template is None:
+                return data
+            return template.safe_substitute(
+                _substitution_mapping(configuration, secrets)
+            )
+
+        root = _copy_containers(data)
+        if not self.templates:
+            return root
+
+        mapping = _substitution_mapping(configuration, secrets)
+        for path, template in self.templates.items():
+            parent = root
+            for key in path[:-1]:
+                parent = parent[key]
+            parent[path[-1]] = template.safe_substitute(mapping)
+
+        return root
+
+
+def compile_substitution(data: Any) -> SubstitutionPlan:
+    """
+    Walk `data` once and record the leaves which `substitute` would actually
+    change.
+    """
+    templates = {}
+    _collect_templates(data, (), templates)
+    return SubstitutionPlan(data, templates)
+
+
+class SubstitutionPlanCache:
+    """
+    Plans compiled from the payloads of activities, such as their arguments,
+    so that running the same activity many times does not compile them
+    again.
+
+    Plans are looked up by the identity of the payload, which each plan
+    holds on to. They do not depend on the configuration or secrets they
+    are applied with.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, data: Any) -> SubstitutionPlan:
+        with self._lock:
+            plan = self._plans.get(id(data))
+            if plan is not None and plan.data is data:
+                self._plans.move_to_end(id(data))
+                return plan
+
+        plan = compile_substitution(data)
+        with self._lock:
+            self._plans[id(data)] = plan
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+
+# used outside of a run, each run gets its own, see `use_substitution_plans`
+substitution_plans = SubstitutionPlanCache()
+run_substitution_plans = contextvars.ContextVar(
+    "substitution_plans", default=None
+)
+
+
+def substitute_with_plan(
+    data: None | str | dict[str, Any] | list,
+    configuration: Configuration,
+    secrets: Secrets,
+) -> Any:
+    """
+    Same as `substitute` but relies on a cached plan of `data`, meant for
+    payloads that live as long as the experiment does and which are
+    substituted many times, like the arguments of an activity.
+
+    Unlike `substitute`, a new container is always returned, even when
+    nothing was substituted.
+    """
+    if data is None:
+        return data
+
+    plans = get_substitution_plans()
+    return plans.get(data).apply(configuration, secrets)
+
+
+def get_substitution_plans() -> SubstitutionPlanCache:
+    """
+    The substitution plans of the current run, or the ones shared outside
+    of any run.
+    """
+    return run_substitution_plans.get() or substitution_plans
+
+
+def use_substitution_plans(
+    plans: SubstitutionPlanCache,
+) -> contextvars.Token:
+    """
+    Use the given plans in the current context, until the returned token is
+    passed to `run_substitution_plans.reset()`. This lets concurrent runs
+    keep their plans apart rather than evicting each other's.
+    """
+    return run_substitution_plans.set(plans)
+
+
+def clear_substitution_plans() -> None:
+    """
+    Drop all the cached substitution plans of the current context.
+    """
+    get_substitution_plans().clear()
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool running each task in a copy of the context it was submitted
+    from.
+
+    The state of a run, such as its settings, its activities cache or its
+    controls, lives in context variables. Threads do not inherit them, this
+    pool makes sure the activities of a run see the same state as the run
+    itself, even when many runs share a process.
+    """
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future:
+        ctx = contextvars.copy_context()
+        return super().submit(ctx.run, fn, *args, **kwargs)
+
+
+def _substitution_mapping(
+    configuration: Configuration, secrets: Secrets
+) -> Mapping[str, Any]:
+    secrets = secrets.values() if secrets else []
+    return ChainMap(configuration or {}, *secrets)
+
+
+def _copy_containers(data: dict | list | tuple) -> dict | list:
+    # tuples become lists, as with `substitute`
+    if isinstance(data, dict):
+        return {
+            k: _copy_containers(v) if isinstance(v, (dict, list, tuple)) else v
+            for k, v in data.items()
+        }
+    return [
+        _copy_containers(v) if isinstance(v, (dict, list, tuple)) else v
+        for v in data
+    ]
+
+
+def _has_pattern(data: str) -> bool:
+    if "$" not in data:
+        return False
+
+    for m in TypedTemplate.pattern.finditer(data):
+        if m.group("named") or m.group("braced") or m.group("escaped"):
+            return True
+    return False
+
+
+def _collect_templates(
+    data: Any, path: tuple, templates: dict[tuple, TypedTemplate]
+) -> None:
+    if isinstance(data, str):
+        if _has_pattern(data):
+            templates[path] = TypedTemplate(data)
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            _collect_templates(value, path + (key,), templates)
+    elif isinstance(data, (list, tuple)):
+        for index, value in enumerate(data):
+            _collect_templates(value, path + (index,), templates)
+
+
+DETECTION_SAMPLE_SIZE = 64 * 1024
+MAX_CACHED_ENCODINGS = 1024
+_detected_encodings: OrderedDict = OrderedDict()
+_detected_encodings_lock = threading.Lock()
+
+
+def decode_bytes(
+    data: bytes,
+    default_encoding: str = "utf-8",
+    cache_key: Any = None,
+) -> str:
     """
     Decode the given bytes and return the decoded unicode string or raises
     `ActivityFailed`.
 
-    We try to detect the encoding and use that instead of the default one
-    (when the confidence is greater or equal than 50%).
+    The bytes are first decoded as strict UTF-8. When that fails, we try to
+    detect the encoding from a sample of, at most, `DETECTION_SAMPLE_SIZE`
+    bytes and use it instead of the default one (when the confidence is
+    greater or equal than 50%).
+
+    When a `cache_key` is given, such as an activity and stream, the
+    encoding detected for it is remembered so that later payloads with the
+    same key skip detection.
+    """
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+
+    if cache_key is not None:
+        with _detected_encodings_lock:
+            encoding = _detected_encodings.get(cache_key)
+        if encoding:
+            try:
+                return data.decode(encoding)
+            except UnicodeDecodeError:
+                logger.debug(
+                    f"Cached encoding '{encoding}' does not apply anymore"
+                )
+
+    encoding = detect_encoding(data, default_encoding)
+    try:
+        text = data.decode(encoding)
+    except UnicodeDecodeError:
+        raise ActivityFailed(
+            f"Failed to decode bytes using encoding '{encoding}'"
+        )
+
+    if cache_key is not None:
+        with _detected_encodings_lock:
+            _detected_encodings[cache_key] = encoding
+            _detected_encodings.move_to_end(cache_key)
+            while len(_detected_encodings) > MAX_CACHED_ENCODINGS:
+                _detected_encodings.popitem(last=False)
+
+    return text
+
+
+def detect(data: bytes) -> dict[str, Any]:
+    """
+    Guess the encoding of the given bytes with `charset_normalizer`, which is
+    only imported the first time an encoding must be detected.
+    """
+    from charset_normalizer import detect as charset_detect
+
+    return charset_detect(data)
+
+
+def detect_encoding(data: bytes, default_encoding: str = "utf-8") -> str:
+    """
+    Detect the encoding of the given bytes from a sample of their first
+    `DETECTION_SAMPLE_SIZE` bytes, falling back to `default_encoding` when
+    the confidence is lower than 50%.
     """
     encoding = default_encoding
-    detected = detect(data) or {}
+    detected = detect(data[:DETECTION_SAMPLE_SIZE]) or {}
     confidence = detected.get("confidence") or 0
     if confidence >= 0.5:
         encoding = detected["encoding"]
@@ -166,13 +445,15 @@ def decode_bytes(data: bytes, default_encoding: str = "utf-8") -> str:
             f"Data encoding detected as '{encoding}' "
             f"with a confidence of {confidence}"
         )
+    return encoding
 
-    try:
-        return data.decode(encoding)
-    except UnicodeDecodeError:
-        raise ActivityFailed(
-            f"Failed to decode bytes using encoding '{encoding}'"
-        )
+
+def clear_encoding_cache() -> None:
+    """
+    Forget the encodings detected per cache key by :func:`decode_bytes`.
+    """
+    with _detected_encodings_lock:
+        _detected_encodings.clear()
 
 
 def merge_vars(
@@ -220,6 +501,8 @@ def merge_vars(
             data = None
             _, ext = os.path.splitext(var_file)
             if ext in (".yaml", ".yml"):
+                import yaml
+
                 try:
                     data = yaml.safe_load(content)
                 except yaml.YAMLError as y:
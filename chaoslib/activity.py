@@ -3,23 +3,19 @@ import numbers
 import time
 import traceback
 from collections.abc import Iterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from chaoslib import substitute
+from chaoslib import ContextThreadPoolExecutor, substitute
 from chaoslib.caching import lookup_activity
 from chaoslib.control import controls
-from chaoslib.exceptions import ActivityFailed, InvalidActivity
-from chaoslib.provider.http import run_http_activity, validate_http_activity
-from chaoslib.provider.process import (
-    run_process_activity,
-    validate_process_activity,
-)
-from chaoslib.provider.python import (
-    run_python_activity,
-    validate_python_activity,
+from chaoslib.exceptions import (
+    ActivityFailed,
+    InvalidActivity,
+    InvalidExperiment,
 )
+from chaoslib.payload import log_payload
 from chaoslib.types import (
     Activity,
     Configuration,
@@ -34,8 +30,11 @@ if TYPE_CHECKING:
 
 __all__ = [
     "ensure_activity_is_valid",
+    "ensure_method_dependencies_are_valid",
     "get_all_activities_in_experiment",
+    "has_activity_dependencies",
     "run_activities",
+    "run_activities_graph",
 ]
 logger = logging.getLogger("chaostoolkit")
 
@@ -123,11 +122,25 @@ def ensure_activity_is_valid(activity: Activity):
     ):
         raise InvalidActivity("activity background must be a boolean")
 
+    after = activity.get("after")
+    if after is not None and not (
+        isinstance(after, list) and all(isinstance(a, str) and a for a in after)
+    ):
+        raise InvalidActivity("activity after must be a list of activity names")
+
+    # providers are imported on first use so that, for instance, validating
+    # an experiment without HTTP activities never imports requests
     if provider_type == "python":
+        from chaoslib.provider.python import validate_python_activity
+
         validate_python_activity(activity)
     elif provider_type == "process":
+        from chaoslib.provider.process import validate_process_activity
+
         validate_process_activity(activity)
     elif provider_type == "http":
+        from chaoslib.provider.http import validate_http_activity
+
         validate_http_activity(activity)
 
 
@@ -175,9 +188,163 @@ def run_activities(
             )
 
 
+def run_activities_graph(
+    experiment: Experiment,
+    configuration: Configuration,
+    secrets: Secrets,
+    pool: ThreadPoolExecutor,
+    dry: Dry = None,
+    event_registry: "EventHandlerRegistry" = None,
+    runs: list[Run] | None = None,
+) -> Iterator[Run]:
+    """
+    Internal generator that executes the method as a graph. Each activity
+    is submitted to the `pool` as soon as all the activities named in its
+    `after` property have completed, whether they succeeded or not.
+    Activities without an `after` property are started right away.
+
+    Yields the result of each run as it completes. When the generator is
+    closed early, no more activities are submitted and those still queued
+    in the pool are cancelled.
+    """
+    method = experiment.get("method", [])
+
+    if not method:
+        logger.info("No declared activities, let's move on.")
+        return
+
+    dependencies = get_method_dependencies(method)
+    dependents = {index: [] for index in range(len(method))}
+    for index, deps in enumerate(dependencies):
+        for dep in deps:
+            dependents[dep].append(index)
+    remaining = {index: set(deps) for index, deps in enumerate(dependencies)}
+
+    own_pool = pool is None
+    if own_pool:
+        pool = ContextThreadPoolExecutor()
+
+    futures = {}
+
+    def submit_ready_activities():
+        for index in [i for i, deps in remaining.items() if not deps]:
+            del remaining[index]
+            activity = method[index]
+            logger.debug(
+                "activity '{}' is ready to run".format(
+                    activity.get("name") or activity.get("ref")
+                )
+            )
+            f = pool.submit(
+                execute_activity,
+                experiment=experiment,
+                activity=activity,
+                configuration=configuration,
+                secrets=secrets,
+                dry=dry,
+                event_registry=event_registry,
+                runs=runs,
+            )
+            futures[f] = index
+
+    try:
+        submit_ready_activities()
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for f in done:
+                index = futures.pop(f)
+                for dependent in dependents[index]:
+                    remaining[dependent].discard(index)
+                yield f.result()
+            submit_ready_activities()
+
+        if remaining:
+            raise InvalidExperiment(
+                "the method activities have circular dependencies"
+            )
+    finally:
+        for f in futures:
+            f.cancel()
+        if own_pool:
+            pool.shutdown(wait=True)
+
+
+def has_activity_dependencies(experiment: Experiment) -> bool:
+    """
+    Tell if any activity of the method declares an `after` property, in
+    which case the method is run as a graph.
+    """
+    return any(
+        activity.get("after") for activity in experiment.get("method", [])
+    )
+
+
+def ensure_method_dependencies_are_valid(experiment: Experiment):
+    """
+    Validate the `after` properties of the method's activities: they must
+    name activities of the method and must not form a cycle.
+
+    Raises :exc:`InvalidExperiment` otherwise.
+    """
+    method = experiment.get("method") or []
+    dependencies = get_method_dependencies(method)
+
+    # Kahn's algorithm, whatever is left could never be scheduled
+    remaining = {index: set(deps) for index, deps in enumerate(dependencies)}
+    ready = [index for index, deps in remaining.items() if not deps]
+    while ready:
+        index = ready.pop()
+        del remaining[index]
+        for other, deps in remaining.items():
+            if index in deps:
+                deps.discard(index)
+                if not deps:
+                    ready.append(other)
+
+    if remaining:
+        names = sorted(
+            {
+                method[index].get("name") or method[index].get("ref")
+                for index in remaining
+            }
+        )
+        raise InvalidExperiment(
+            "the method activities have circular dependencies: {}".format(
+                ", ".join(names)
+            )
+        )
+
+
 ###############################################################################
 # Internal functions
 ###############################################################################
+def get_method_dependencies(method: list[Activity]) -> list[set[int]]:
+    """
+    Resolve the `after` property of each activity into the indices of the
+    activities it depends on. An activity referencing another one is known
+    by the name of the activity it references.
+    """
+    indices = {}
+    for index, activity in enumerate(method):
+        name = activity.get("name") or activity.get("ref")
+        if name:
+            indices.setdefault(name, []).append(index)
+
+    dependencies = []
+    for index, activity in enumerate(method):
+        deps = set()
+        for name in activity.get("after") or []:
+            if name not in indices:
+                raise InvalidExperiment(
+                    f"activity depends on '{name}' which is not declared "
+                    "in the method"
+                )
+            deps.update(i for i in indices[name] if i != index)
+        dependencies.append(deps)
+
+    return dependencies
+
+
 def execute_activity(
     experiment: Experiment,
     activity: Activity,
@@ -258,7 +425,7 @@ def execute_activity(
             run["output"] = result
             run["status"] = "succeeded"
             if result is not None:
-                logger.debug(f"  => succeeded with '{result}'")
+                logger.debug("  => succeeded with '%s'", log_payload(result))
             else:
                 logger.debug("  => succeeded without any result value")
         except ActivityFailed as x:
@@ -266,7 +433,7 @@ def execute_activity(
             run["status"] = "failed"
             run["output"] = result
             run["exception"] = traceback.format_exception(type(x), x, None)
-            logger.error(f"  => failed: {error_msg}")
+            logger.error("  => failed: %s", log_payload(error_msg))
         finally:
             # capture the end time before we pause
             end = datetime.now(UTC)
@@ -308,10 +475,16 @@ def run_activity(
         provider = activity["provider"]
         activity_type = provider["type"]
         if activity_type == "python":
+            from chaoslib.provider.python import run_python_activity
+
             result = run_python_activity(activity, configuration, secrets)
         elif activity_type == "process":
+            from chaoslib.provider.process import run_process_activity
+
             result = run_process_activity(activity, configuration, secrets)
         elif activity_type == "http":
+            from chaoslib.provider.http import run_http_activity
+
             result = run_http_activity(activity, configuration, secrets)
     except Exception:
         # just make sure we have a full traceback
@@ -0,0 +1,278 @@
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import UTC, datetime
+from typing import Any
+
+from chaoslib import PayloadEncoder
+from chaoslib.control import load_global_controls
+from chaoslib.experiment import ensure_experiment_is_valid, run_experiment
+from chaoslib.loader import load_experiment
+from chaoslib.settings import get_loaded_settings
+from chaoslib.types import Experiment, Schedule, Settings, Strategy
+
+__all__ = ["BatchJob", "iter_batch", "run_batch"]
+logger = logging.getLogger("chaostoolkit")
+
+
+class BatchJob:
+    """
+    An experiment to run as part of a batch, with its own settings and
+    experiment variables.
+
+    The `source` is either an experiment or anything `load_experiment`
+    accepts, in which case it is loaded by the worker. When `settings` is
+    `None`, the settings given to the batch are used. The global controls
+    declared in the settings are loaded before the run.
+
+    Jobs are sent to worker processes, so everything they hold must be
+    picklable.
+    """
+
+    __slots__ = (
+        "experiment_vars",
+        "schedule",
+        "settings",
+        "source",
+        "strategy",
+        "validate",
+    )
+
+    def __init__(
+        self,
+        source: str | Experiment,
+        settings: Settings = None,
+        experiment_vars: dict[str, Any] | None = None,
+        strategy: Strategy = Strategy.DEFAULT,
+        schedule: Schedule = None,
+        validate: bool = False,
+    ):
+        self.source = source
+        self.settings = settings
+        self.experiment_vars = experiment_vars
+        self.strategy = strategy
+        self.schedule = schedule
+        self.validate = validate
+
+
+def iter_batch(
+    jobs: list[BatchJob | str | Experiment],
+    settings: Settings = None,
+    max_workers: int | None = None,
+    warm_imports: list[str] | None = None,
+    mp_context: str = "spawn",
+) -> Iterator[dict[str, Any]]:
+    """
+    Run the jobs on a pool of `max_workers` processes and yield the result
+    of each as soon as it completes, so not in the order of `jobs`.
+
+    Each worker imports `warm_imports`, such as the modules of the
+    extensions the experiments rely on, when it starts. Those imports, and
+    the caches of the worker, such as the resolved Python functions and the
+    HTTP sessions, are then shared by all the jobs it runs.
+
+    Workers are started with the `mp_context` start method. The default,
+    `"spawn"`, does not inherit the threads and locks of the parent but
+    requires the main module to be importable, as usual with
+    multiprocessing.
+
+    A result is a mapping with the following keys:
+
+    - `"index"`: the position of the job in `jobs`
+    - `"source"`: the source of the job, or the experiment's title
+    - `"status"`: the status of the journal or `"error"` when the job did
+      not produce one
+    - `"deviated"`: whether the steady-state hypothesis deviated
+    - `"journal"`: the journal, as it would be serialized to JSON, or `None`
+    - `"error"`: `None` or a mapping with the `"type"` and `"message"` of the
+      exception raised while loading, validating or running the experiment
+    - `"pid"`: the worker process which ran the job
+    - `"start"`, `"end"`: UTC ISO dates of when the job ran
+    - `"duration"`: how long the job took in the worker, in seconds
+    """
+    settings = settings if settings is not None else get_loaded_settings()
+    ctx = multiprocessing.get_context(mp_context) if mp_context else None
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=ctx,
+        initializer=warm_worker,
+        initargs=(list(warm_imports or []),),
+    ) as pool:
+        futures = {}
+        for index, job in enumerate(jobs):
+            job = as_batch_job(job, settings)
+            futures[pool.submit(run_batch_job, index, job)] = (index, job)
+
+        for future in as_completed(futures):
+            index, job = futures[future]
+            try:
+                result = future.result()
+            except Exception as x:
+                # the worker died or the job could not be sent to it
+                logger.debug(f"Batch job {index} failed", exc_info=True)
+                result = failed_result(index, job, x)
+
+            if result["journal"] is not None:
+                result["journal"] = json.loads(result["journal"])
+            yield result
+
+
+def run_batch(
+    jobs: list[BatchJob | str | Experiment],
+    settings: Settings = None,
+    max_workers: int | None = None,
+    warm_imports: list[str] | None = None,
+    mp_context: str = "spawn",
+    on_result: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Run the jobs with :func:`iter_batch` and aggregate their results.
+
+    `on_result` is called in this process with each result as soon as its
+    job completes, for instance to persist its journal.
+
+    Returns a mapping with the following keys:
+
+    - `"results"`: the results of the jobs, in the order of `jobs`
+    - `"total"`: the number of jobs
+    - `"statuses"`: the number of jobs per status
+    - `"deviated"`: the number of runs which deviated
+    - `"duration"`: how long the whole batch took, in seconds
+    - `"durations"`: the `"total"`, `"min"`, `"max"` and `"mean"` durations
+      of the jobs, in seconds
+    """
+    started = time.monotonic()
+    results = [None] * len(jobs)
+    for result in iter_batch(
+        jobs, settings, max_workers, warm_imports, mp_context
+    ):
+        results[result["index"]] = result
+        if on_result:
+            try:
+                on_result(result)
+            except Exception:
+                logger.debug("Batch result callback failed", exc_info=True)
+
+    statuses = {}
+    for result in results:
+        statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+
+    durations = [r["duration"] for r in results]
+    total = sum(durations)
+    summary = {
+        "results": results,
+        "total": len(results),
+        "statuses": statuses,
+        "deviated": len([r for r in results if r["deviated"]]),
+        "duration": time.monotonic() - started,
+        "durations": {
+            "total": total,
+            "min": min(durations, default=0.0),
+            "max": max(durations, default=0.0),
+            "mean": total / len(durations) if durations else 0.0,
+        },
+    }
+    logger.info(
+        f"Ran {summary['total']} experiments in {summary['duration']:.2f}s: "
+        f"{statuses}"
+    )
+    return summary
+
+
+###############################################################################
+# Internals
+###############################################################################
+def as_batch_job(
+    job: BatchJob | str | Experiment, settings: Settings
+) -> BatchJob:
+    if not isinstance(job, BatchJob):
+        job = BatchJob(job)
+    if job.settings is None:
+        job = BatchJob(
+            job.source,
+            settings,
+            job.experiment_vars,
+            job.strategy,
+            job.schedule,
+            job.validate,
+        )
+    return job
+
+
+def warm_worker(modules: list[str]) -> None:
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            logger.debug(f"Failed to import '{name}'", exc_info=True)
+
+
+def run_batch_job(index: int, job: BatchJob) -> dict[str, Any]:
+    settings = job.settings or {}
+    result = {
+        "index": index,
+        "source": job.source,
+        "status": "error",
+        "deviated": False,
+        "journal": None,
+        "error": None,
+        "pid": os.getpid(),
+        "start": datetime.now(UTC).isoformat(),
+    }
+    started = time.monotonic()
+    try:
+        if isinstance(job.source, dict):
+            result["source"] = job.source.get("title")
+            experiment = job.source
+        else:
+            experiment = load_experiment(job.source, settings)
+
+        if job.validate:
+            ensure_experiment_is_valid(experiment, settings)
+
+        load_global_controls(settings)
+        journal = run_experiment(
+            experiment,
+            settings=settings,
+            experiment_vars=job.experiment_vars,
+            strategy=job.strategy,
+            schedule=job.schedule,
+        )
+        result["status"] = journal.get("status")
+        result["deviated"] = journal.get("deviated", False)
+        # serialized here so that any output of the activities can be sent
+        # back to the parent process
+        result["journal"] = json.dumps(journal, cls=PayloadEncoder)
+    except Exception as x:
+        logger.debug(f"Experiment '{result['source']}' failed", exc_info=True)
+        result["error"] = {"type": x.__class__.__name__, "message": str(x)}
+    finally:
+        result["end"] = datetime.now(UTC).isoformat()
+        result["duration"] = time.monotonic() - started
+    return result
+
+
+def failed_result(
+    index: int, job: BatchJob, error: Exception
+) -> dict[str, Any]:
+    source = job.source
+    if isinstance(source, dict):
+        source = source.get("title")
+    now = datetime.now(UTC).isoformat()
+    return {
+        "index": index,
+        "source": source,
+        "status": "error",
+        "deviated": False,
+        "journal": None,
+        "error": {"type": error.__class__.__name__, "message": str(error)},
+        "pid": None,
+        "start": now,
+        "end": now,
+        "duration": 0.0,
+    }
@@ -1,5 +1,6 @@
 # Builds an in-memory cache of all declared activities so they can be
 # referenced from other places in the experiment
+import contextvars
 import inspect
 import logging
 from functools import wraps
@@ -11,9 +12,9 @@ from chaoslib.types import Activity, Experiment, Schedule, Settings, Strategy
 __all__ = ["cache_activities", "clear_cache", "lookup_activity", "with_cache"]
 
 
-# global objects are frown upon but as we write to it once
-# (from a single place) and we only read afterwards, that's likely okay.
-_cache = {}
+# scoped to the current context so that experiments running concurrently,
+# in threads or asyncio tasks, each see their own activities
+_cache = contextvars.ContextVar("activities_cache", default=None)
 logger = logging.getLogger("chaostoolkit")
 
 
@@ -27,12 +28,17 @@ def cache_activities(experiment: Experiment) -> list[Activity]:
         "steady-state-hypothesis", {}
     ).get("probes", [])
 
+    cache = _cache.get()
+    if cache is None:
+        cache = {}
+        _cache.set(cache)
+
     for activity in lot:
         name = activity.get("name")
         if name:
-            _cache[name] = activity
+            cache[name] = activity
 
-    logger.debug(f"Cached {len(_cache)} activities")
+    logger.debug(f"Cached {len(cache)} activities")
 
 
 def clear_cache():
@@ -40,13 +46,19 @@ def clear_cache():
     Clear the cache
     """
     logger.debug("Clearing activities cache")
-    _cache.clear()
+    cache = _cache.get()
+    if cache is not None:
+        cache.clear()
 
 
 def with_cache(f):
     """
     Ensure the activities cache is populated before calling the wrapped
     function.
+
+    The wrapped function gets a cache of its own, which is dropped when it
+    returns, so concurrent or nested calls do not see each other's
+    activities.
     """
 
     @wraps(f)
@@ -58,6 +70,7 @@ def with_cache(f):
         schedule: Schedule = None,
         event_handlers: list[chaoslib.run.RunEventHandler] | None = None,
     ):
+        token = _cache.set({})
         try:
             if experiment:
                 cache_activities(experiment)
@@ -78,6 +91,7 @@ def with_cache(f):
             return f(**arguments)
         finally:
             clear_cache()
+            _cache.reset(token)
 
     return wrapped
 
@@ -86,7 +100,7 @@ def lookup_activity(ref: str) -> Activity | None:
     """
     Lookup an activity by name and return it or `None`.
     """
-    activity = _cache.get(ref)
+    activity = (_cache.get() or {}).get(ref)
     if not activity:
         logger.debug(f"cache miss for '{ref}'")
     return activity
@@ -1,15 +1,20 @@
 import logging
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from copy import deepcopy
+from datetime import UTC, datetime
+from string import Template
 from typing import Any
 
-from chaoslib import convert_to_type
+from chaoslib import ContextThreadPoolExecutor, convert_to_type
 from chaoslib.exceptions import InvalidExperiment
 from chaoslib.types import Configuration, Secrets
 
 __all__ = ["load_configuration", "load_dynamic_configuration"]
 
 logger = logging.getLogger("chaostoolkit")
+DYNAMIC_CONFIGURATION_WORKERS = 8
 
 
 def load_configuration(
@@ -100,7 +105,10 @@ def load_configuration(
 
 
 def load_dynamic_configuration(
-    config: Configuration, secrets: Secrets = None
+    config: Configuration,
+    secrets: Secrets = None,
+    max_workers: int | None = DYNAMIC_CONFIGURATION_WORKERS,
+    report: dict[str, dict[str, Any]] | None = None,
 ) -> Configuration:
     """
     This is for loading a dynamic configuration if exists.
@@ -147,54 +155,203 @@ def load_dynamic_configuration(
     For `http` probes, the `body` value is stored.
     For `python` probes, the output of the function will be stored.
 
+    Probes run concurrently on a pool of `max_workers` threads. A probe
+    referencing, with `${...}`, the key of a probe declared before it only
+    runs once that key is loaded. A Python probe whose function takes the
+    `configuration` may read any key, it therefore waits for all the probes
+    declared before it. Each probe is given the keys declared before it,
+    static ones and those it waited for.
+
     We do not stop on errors but log a debug message and do not include the
     key into the result dictionary.
-    """
-    # we delay this so that the configuration module can be imported leanly
-    # from elsewhere
-    from chaoslib.activity import run_activity
 
-    conf = {}
+    When `report` is set, it is filled, per dynamic key, with the
+    `"status"` of its probe (`"succeeded"` or `"failed"`), its `"error"`,
+    the keys it `"depends_on"`, and its `"start"`, `"end"` and `"duration"`.
+    """
     secrets = secrets or {}
+    report = report if report is not None else {}
 
-    had_errors = False
     logger.debug("Loading dynamic configuration...")
+    static = {}
+    probes = {}
     for key, value in config.items():
-        if not (isinstance(value, dict) and value.get("type") == "probe"):
-            conf[key] = config.get(key, value)
-            continue
-
-        # we have a dynamic config
-        name = value.get("name")
-        provider_type = value["provider"]["type"]
-        value["provider"]["secrets"] = deepcopy(secrets)
-        try:
-            output = run_activity(value, conf, secrets)
-        except Exception:
-            had_errors = True
-            logger.debug(
-                f"Failed to load configuration '{name}'", exc_info=True
+        if isinstance(value, dict) and value.get("type") == "probe":
+            probes[key] = value
+        else:
+            static[key] = config.get(key, value)
+
+    # only keys declared before a probe were ever visible to it
+    visible = {}
+    dependencies = {}
+    preceding = []
+    for key, value in config.items():
+        if key in probes:
+            visible[key] = {k: static[k] for k in preceding if k in static}
+            if reads_configuration(value):
+                dependencies[key] = [k for k in preceding if k in probes]
+            else:
+                dependencies[key] = [
+                    k
+                    for k in referenced_keys(value)
+                    if k in probes and k in preceding
+                ]
+        preceding.append(key)
+
+    loaded = {}
+    if probes:
+        run_dynamic_probes(
+            probes, dependencies, visible, secrets, max_workers, loaded, report
+        )
+
+    if any(r["status"] == "failed" for r in report.values()):
+        logger.warning(
+            "Some of the dynamic configuration failed to be loaded."
+            "Please review the log file for understanding what happened."
+        )
+
+    conf = {}
+    for key in config:
+        if key in static:
+            conf[key] = static[key]
+        elif key in loaded:
+            conf[key] = loaded[key]
+    return conf
+
+
+###############################################################################
+# Internals
+###############################################################################
+def referenced_keys(data: Any) -> list[str]:
+    """
+    Names referenced by the `${...}` and `$...` placeholders found in the
+    strings of `data`, in the order they are found.
+    """
+    names = []
+    if isinstance(data, str):
+        for m in Template.pattern.finditer(data):
+            name = m.group("named") or m.group("braced")
+            if name and name not in names:
+                names.append(name)
+    elif isinstance(data, dict):
+        for value in data.values():
+            names.extend(n for n in referenced_keys(value) if n not in names)
+    elif isinstance(data, list | tuple):
+        for value in data:
+            names.extend(n for n in referenced_keys(value) if n not in names)
+    return names
+
+
+def reads_configuration(probe: dict[str, Any]) -> bool:
+    """
+    Whether the probe may read keys of the configuration it does not
+    reference, that is a Python function taking the `configuration`.
+    """
+    provider = probe.get("provider") or {}
+    if provider.get("type") != "python":
+        return False
+
+    # we delay this so that the configuration module can be imported leanly
+    # from elsewhere
+    from chaoslib.provider.python import resolve_callable
+
+    try:
+        resolved = resolve_callable(provider["module"], provider["func"])
+    except Exception:  # noqa: BLE001 - reported once the probe runs
+        # the probe will fail anyway, keep it in declaration order
+        return True
+    return resolved.accepts_configuration
+
+
+def run_dynamic_probes(
+    probes: dict[str, dict[str, Any]],
+    dependencies: dict[str, list[str]],
+    visible: dict[str, Configuration],
+    secrets: Secrets,
+    max_workers: int | None,
+    loaded: dict[str, Any],
+    report: dict[str, dict[str, Any]],
+) -> None:
+    remaining = dict(dependencies)
+    futures = {}
+
+    def submit_ready(pool: ThreadPoolExecutor) -> None:
+        for key in list(remaining):
+            deps = remaining[key]
+            if any(d in remaining or d in futures.values() for d in deps):
+                continue
+
+            del remaining[key]
+            conf = dict(visible[key])
+            for d in deps:
+                if d in loaded:
+                    conf[d] = loaded[d]
+            f = pool.submit(
+                load_dynamic_key, key, probes[key], conf, secrets, deps
             )
-            continue
+            futures[f] = key
+
+    workers = max(min(max_workers or len(probes), len(probes)), 1)
+    with ContextThreadPoolExecutor(max_workers=workers) as pool:
+        submit_ready(pool)
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for f in done:
+                key = futures.pop(f)
+                found, value, entry = f.result()
+                report[key] = entry
+                if found:
+                    loaded[key] = value
+            submit_ready(pool)
+
+
+def load_dynamic_key(
+    key: str,
+    probe: dict[str, Any],
+    conf: Configuration,
+    secrets: Secrets,
+    deps: list[str],
+) -> tuple[bool, Any, dict[str, Any]]:
+    # we delay this so that the configuration module can be imported leanly
+    # from elsewhere
+    from chaoslib.activity import run_activity
+
+    name = probe.get("name")
+    provider_type = probe["provider"]["type"]
+    probe["provider"]["secrets"] = deepcopy(secrets)
+
+    entry = {
+        "status": "failed",
+        "error": None,
+        "depends_on": deps,
+        "start": datetime.now(UTC).isoformat(),
+    }
+    started = time.monotonic()
+    found = False
+    value = None
+    try:
+        output = run_activity(probe, conf, secrets)
 
         if provider_type == "python":
-            conf[key] = output
+            found, value = True, output
         elif provider_type == "process":
             if output["status"] != 0:
-                had_errors = True
+                entry["error"] = output["stderr"]
                 logger.debug(
                     f"Failed to load configuration dynamically "
                     f"from probe '{name}': {output['stderr']}"
                 )
             else:
-                conf[key] = output.get("stdout", "").strip()
+                found, value = True, output.get("stdout", "").strip()
         elif provider_type == "http":
-            conf[key] = output.get("body")
+            found, value = True, output.get("body")
+    except Exception as x:
+        entry["error"] = str(x)
+        logger.debug(f"Failed to load configuration '{name}'", exc_info=True)
+    finally:
+        entry["end"] = datetime.now(UTC).isoformat()
+        entry["duration"] = time.monotonic() - started
 
-    if had_errors:
-        logger.warning(
-            "Some of the dynamic configuration failed to be loaded."
-            "Please review the log file for understanding what happened."
-        )
-
-    return conf
+    if found:
+        entry["status"] = "succeeded"
+    return found, value, entry
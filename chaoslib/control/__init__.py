@@ -1,18 +1,20 @@
+import contextvars
 import json
 import logging
 import os.path
+import threading
 from contextlib import contextmanager
 from copy import copy, deepcopy
 from json.decoder import JSONDecodeError
 from typing import TYPE_CHECKING
 
-import yaml
-
 from chaoslib.control.python import (
+    ResolvedControl,
     apply_python_control,
     cleanup_control,
     import_control,
     initialize_control,
+    resolve_python_control,
     validate_python_control,
 )
 from chaoslib.exceptions import InterruptExecution, InvalidControl
@@ -34,8 +36,11 @@ if TYPE_CHECKING:
 
 __all__ = [
     "Control",
+    "ControlDispatchTable",
+    "build_control_dispatch_table",
     "cleanup_controls",
     "cleanup_global_controls",
+    "clear_control_dispatch_table",
     "controls",
     "initialize_controls",
     "initialize_global_controls",
@@ -44,10 +49,15 @@ __all__ = [
 ]
 logger = logging.getLogger("chaostoolkit")
 
-# Should this be protected in some fashion? chaoslib isn't meant to be used
-# concurrently so there is little promise we can support several instances
-# at once. When the day comes...
-global_controls = []
+# scoped to the current context so that experiments running concurrently,
+# in threads or asyncio tasks, do not share their controls. A context which
+# never loaded any, such as the one of a thread started afterwards, sees
+# those loaded last in the process
+global_controls = contextvars.ContextVar("global_controls", default=None)
+_loaded_global_controls: tuple[ControlType, ...] = ()
+control_dispatch_table = contextvars.ContextVar(
+    "control_dispatch_table", default=None
+)
 
 
 def initialize_controls(
@@ -208,6 +218,10 @@ def load_global_controls(
     so the loaders controls have a chance to be applied. It does not perform
     any specific initialization yet, it only tries to load the controls
     declared in the settings.
+
+    The controls apply to the runs of the current context, and of any context
+    which has not loaded its own, in whichever thread they start, until
+    others are loaded or :func:`unload_global_controls` is called.
     """
     controls = []
     for name, control in settings.get("controls", {}).items():
@@ -232,6 +246,8 @@ def load_global_controls(
 
         _, ext = os.path.splitext(control_file)
         if ext in (".yaml", ".yml"):
+            import yaml
+
             try:
                 ctrls = yaml.safe_load(content)
             except yaml.YAMLError as y:
@@ -259,6 +275,8 @@ def load_global_controls(
 
             controls.append(control)
 
+    global _loaded_global_controls
+    _loaded_global_controls = tuple(controls)
     set_global_controls(controls)
 
 
@@ -286,9 +304,144 @@ def cleanup_global_controls():
 
 def get_global_controls() -> list[ControlType]:
     """
-    All the controls loaded from the settings.
+    All the controls loaded from the settings, by the current context or,
+    when it did not load any, by the process.
+    """
+    controls = global_controls.get()
+    if controls is None:
+        controls = _loaded_global_controls
+    return list(controls)
+
+
+class ControlEntry:
+    """
+    A control applicable at a given level, with the function to call for
+    each scope, or `None` when the control has nothing to run there.
     """
-    return global_controls[:]
+
+    __slots__ = ("after", "before", "control", "name", "scope")
+
+    def __init__(
+        self,
+        control: ControlType,
+        before: ResolvedControl | None = None,
+        after: ResolvedControl | None = None,
+    ):
+        self.control = control
+        self.name = control.get("name")
+        self.scope = control.get("scope")
+        self.before = before
+        self.after = after
+
+
+class ControlDispatchTable:
+    """
+    The effective controls of each level and context of an experiment,
+    resolved once so that applying them is a loop over prebuilt entries.
+
+    :meth:`build` resolves the experiment, hypothesis, method, rollback and
+    activity levels ahead of the run. Any other context is resolved the
+    first time it is met and kept for the rest of the run.
+
+    Controls added to, or removed from, the experiment once the table is
+    built are not seen until it is built again.
+    """
+
+    def __init__(self, experiment: Experiment):
+        self.experiment = experiment
+        self._entries = {}
+        self._funcs = {}
+        self._lock = threading.Lock()
+
+    def build(self) -> "ControlDispatchTable":
+        experiment = self.experiment
+        self.get("experiment", experiment)
+        self.get("method", experiment)
+        self.get("rollback", experiment)
+
+        hypothesis = experiment.get("steady-state-hypothesis")
+        if hypothesis:
+            self.get("hypothesis", hypothesis)
+
+        for activity in get_all_activities(experiment):
+            if "ref" not in activity:
+                self.get("activity", activity)
+
+        return self
+
+    def get(
+        self, level: str, context: Activity | Hypothesis | Experiment
+    ) -> list[ControlEntry]:
+        key = (level, id(context))
+        with self._lock:
+            found = self._entries.get(key)
+        # the context is kept with its entries so its identifier is not
+        # reused by another object
+        if found and found[0] is context:
+            return found[1]
+
+        entries = [
+            ControlEntry(
+                control,
+                before=self._resolve(control, f"{level}-before"),
+                after=self._resolve(control, f"{level}-after"),
+            )
+            for control in get_context_controls(level, self.experiment, context)
+        ]
+
+        with self._lock:
+            self._entries[key] = (context, entries)
+        return entries
+
+    def _resolve(
+        self, control: ControlType, level: str
+    ) -> ResolvedControl | None:
+        scope = control.get("scope")
+        if scope and not level.endswith(f"-{scope}"):
+            return None
+
+        provider = control.get("provider") or {}
+        if provider.get("type") != "python":
+            return None
+
+        key = (provider.get("module"), level)
+        with self._lock:
+            if key in self._funcs:
+                return self._funcs[key]
+
+        try:
+            resolved = resolve_python_control(control, level)
+        except Exception:
+            logger.debug(
+                f"Control '{control.get('name')}' could not be resolved",
+                exc_info=True,
+            )
+            resolved = None
+
+        with self._lock:
+            self._funcs[key] = resolved
+        return resolved
+
+
+def build_control_dispatch_table(
+    experiment: Experiment,
+) -> ControlDispatchTable:
+    """
+    Resolve the controls of the experiment once, for the whole run, and use
+    them whenever controls are applied to that experiment.
+
+    Call this once the controls have been initialized.
+    """
+    table = ControlDispatchTable(experiment).build()
+    control_dispatch_table.set(table)
+    return table
+
+
+def clear_control_dispatch_table():
+    """
+    Drop the controls resolved by :func:`build_control_dispatch_table`.
+    """
+    control_dispatch_table.set(None)
 
 
 class Control:
@@ -382,15 +535,25 @@ def set_global_controls(controls: list[ControlType]):
     """
     Set the controls loaded from the settings.
     """
-    global_controls.clear()
-    global_controls.extend(controls)
+    global_controls.set(tuple(controls))
 
 
 def reset_global_controls():
     """
-    Invalidate all loaded global controls.
+    Invalidate the global controls of the current context. Those loaded for
+    the whole process are left alone, see :func:`unload_global_controls`.
     """
-    global_controls.clear()
+    global_controls.set(())
+
+
+def unload_global_controls():
+    """
+    Forget the global controls loaded for the whole process and by the
+    current context.
+    """
+    global _loaded_global_controls
+    _loaded_global_controls = ()
+    global_controls.set(None)
 
 
 def get_context_controls(
@@ -463,24 +626,43 @@ def apply_controls(
     `"after"` scope.
     """
     settings = get_loaded_settings() or None
-    controls = get_context_controls(level, experiment, context)
-    if not controls:
+
+    table = control_dispatch_table.get()
+    prebuilt = bool(experiment and table and table.experiment is experiment)
+    if prebuilt:
+        entries = table.get(level, context)
+    else:
+        entries = [
+            ControlEntry(c)
+            for c in get_context_controls(level, experiment, context)
+        ]
+
+    if not entries:
         logger.debug(f"No controls to apply on '{level}'")
         return
 
-    for control in controls:
-        control_name = control.get("name")
-        target_scope = control.get("scope")
+    for entry in entries:
+        control_name = entry.name
+        target_scope = entry.scope
 
         if target_scope and target_scope != scope:
             continue
 
         logger.debug(f"Applying {scope}-control '{control_name}' on '{level}'")
+        control = entry.control
         provider = control.get("provider", {})
         provider_type = provider.get("type")
 
         try:
             if provider_type == "python":
+                resolved = entry.before if scope == "before" else entry.after
+                if resolved is None and not prebuilt:
+                    resolved = resolve_python_control(
+                        control, f"{level}-{scope}"
+                    )
+                if resolved is None:
+                    continue
+
                 apply_python_control(
                     level=f"{level}-{scope}",
                     control=control,
@@ -490,6 +672,7 @@ def apply_controls(
                     configuration=configuration,
                     secrets=secrets,
                     settings=settings,
+                    resolved=resolved,
                 )
         except InterruptExecution:
             logger.debug(
@@ -19,10 +19,12 @@ from chaoslib.types import (
 )
 
 __all__ = [
+    "ResolvedControl",
     "apply_python_control",
     "cleanup_control",
     "import_control",
     "initialize_control",
+    "resolve_python_control",
     "validate_python_control",
 ]
 logger = logging.getLogger("chaostoolkit")
@@ -40,6 +42,30 @@ _level_mapping = {
     "loader-before": "before_loading_experiment_control",
     "loader-after": "after_loading_experiment_control",
 }
+_optional_arguments = (
+    "secrets",
+    "configuration",
+    "state",
+    "experiment",
+    "extensions",
+    "settings",
+)
+
+
+class ResolvedControl:
+    """
+    A control function along with the optional arguments its signature
+    accepts, so that applying it does not inspect it again.
+    """
+
+    __slots__ = ("accepts", "func")
+
+    def __init__(self, func: Callable):
+        self.func = func
+        parameters = inspect.signature(func).parameters
+        self.accepts = frozenset(
+            name for name in _optional_arguments if name in parameters
+        )
 
 
 def import_control(control: Control) -> Any | None:
@@ -133,6 +159,19 @@ def validate_python_control(control: Control):
     func(control)
 
 
+def resolve_python_control(
+    control: Control, level: str
+) -> ResolvedControl | None:
+    """
+    Load the function of the control matching the given level, such as
+    `"activity-before"`, or `None` when the control does not declare it.
+    """
+    func = load_func(control, _level_mapping.get(level))
+    if not func:
+        return None
+    return ResolvedControl(func)
+
+
 def apply_python_control(
     level: str,
     control: Control,
@@ -142,42 +181,46 @@ def apply_python_control(
     configuration: Configuration = None,
     secrets: Secrets = None,
     settings: Settings = None,
+    resolved: ResolvedControl | None = None,
 ):
     """
     Apply a control by calling a function matching the given level.
+
+    The function is loaded unless it was already `resolved` by
+    :func:`resolve_python_control`.
     """
-    provider = control["provider"]
-    func_name = _level_mapping.get(level)
-    func = load_func(control, func_name)
-    if not func:
-        return
+    if resolved is None:
+        resolved = resolve_python_control(control, level)
+        if not resolved:
+            return
 
-    arguments = deepcopy(provider.get("arguments", {}))
+    provider = control["provider"]
+    arguments = provider.get("arguments")
+    arguments = deepcopy(arguments) if arguments else {}
 
-    if configuration or secrets:
+    if arguments and (configuration or secrets):
         arguments = substitute(arguments, configuration, secrets)
 
-    sig = inspect.signature(func)
-
-    if "secrets" in sig.parameters:
+    accepts = resolved.accepts
+    if "secrets" in accepts:
         arguments["secrets"] = secrets
 
-    if "configuration" in sig.parameters:
+    if "configuration" in accepts:
         arguments["configuration"] = configuration
 
-    if "state" in sig.parameters:
+    if "state" in accepts:
         arguments["state"] = state
 
-    if "experiment" in sig.parameters:
+    if "experiment" in accepts:
         arguments["experiment"] = experiment
 
-    if "extensions" in sig.parameters:
+    if "extensions" in accepts:
         arguments["extensions"] = experiment.get("extensions")
 
-    if "settings" in sig.parameters:
+    if "settings" in accepts:
         arguments["settings"] = settings
 
-    func(context=context, **arguments)
+    resolved.func(context=context, **arguments)
 
 
 ###############################################################################
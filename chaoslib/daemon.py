@@ -0,0 +1,319 @@
+"""
+A long-lived process running experiments on behalf of its clients, so that
+the interpreter startup, the imports of chaostoolkit and its extensions, the
+HTTP connections and the resolved Python functions are paid for once rather
+than on every run.
+
+The daemon listens on a Unix socket. A client sends a request as a single
+JSON line and reads back JSON lines until the connection is closed:
+
+```python
+from chaoslib.daemon import submit_experiment
+
+for record in submit_experiment("/run/chaostoolkit.sock", experiment):
+    print(record["type"])
+```
+
+WARNING: Only available on Unix/Linux systems.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+from chaoslib import PayloadEncoder
+from chaoslib.batch import warm_worker
+from chaoslib.control import load_global_controls
+from chaoslib.experiment import run_experiment
+from chaoslib.loader import load_experiment
+from chaoslib.run import RunEventHandler, enter_run, leave_run
+from chaoslib.types import (
+    Activity,
+    Experiment,
+    Journal,
+    Run,
+    Settings,
+    Strategy,
+)
+
+__all__ = ["RunnerDaemon", "serve", "submit_experiment"]
+logger = logging.getLogger("chaostoolkit")
+
+
+class RunnerDaemon(socketserver.ThreadingUnixStreamServer):
+    """
+    Server running the experiments it receives on its Unix socket, each in
+    its own thread.
+
+    A request is a JSON object on a single line with the following keys:
+
+    - `"experiment"`: the experiment to run, or `"source"`: anything
+      :func:`load_experiment` accepts
+    - `"experiment_vars"`: optional, a mapping with `"configuration"` and
+      `"secrets"` variables
+    - `"strategy"`: optional, the value of a :class:`Strategy`
+    - `"settings"`: optional, used instead of the settings of the daemon
+
+    The response is a stream of JSON lines, each with a `"type"`:
+
+    - `"event"`: an event of the run, named by `"event"`
+    - `"journal"`: the journal of the run, always the last record
+    - `"error"`: the request could not be run, with the `"type"` and
+      `"message"` of the exception
+
+    The socket is only accessible to the user running the daemon.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: str,
+        settings: Settings = None,
+        warm_imports: list[str] | None = None,
+    ):
+        self.path = path
+        self.settings = settings or {}
+        self._closed = False
+        self._close_lock = threading.Lock()
+        remove_stale_socket(path)
+        warm_worker(list(warm_imports or []))
+
+        # keeps the HTTP session pool open between runs, until closed
+        enter_run()
+
+        # the socket must never be reachable by other users, even briefly
+        umask = os.umask(0o177)
+        try:
+            super().__init__(path, RunRequestHandler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        leave_run()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def serve(
+    path: str,
+    settings: Settings = None,
+    warm_imports: list[str] | None = None,
+) -> None:
+    """
+    Run a :class:`RunnerDaemon` on the socket at `path` until interrupted.
+    """
+    with RunnerDaemon(path, settings, warm_imports) as daemon:
+        logger.info(f"Waiting for experiments on '{path}'")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Stopping the runner daemon")
+
+
+def submit_experiment(
+    path: str,
+    experiment: Experiment | None = None,
+    source: str | None = None,
+    experiment_vars: dict[str, Any] | None = None,
+    strategy: Strategy = Strategy.DEFAULT,
+    settings: Settings = None,
+    timeout: float | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Send an experiment, or the `source` to load it from, to the daemon
+    listening on `path` and yield the records it streams back, see
+    :class:`RunnerDaemon`.
+    """
+    request = {"strategy": strategy.value}
+    if experiment is not None:
+        request["experiment"] = experiment
+    else:
+        request["source"] = source
+    if experiment_vars:
+        request["experiment_vars"] = experiment_vars
+    if settings is not None:
+        request["settings"] = settings
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        with sock.makefile("rwb") as f:
+            f.write(encode_record(request))
+            f.flush()
+            sock.shutdown(socket.SHUT_WR)
+            for line in f:
+                yield json.loads(line)
+
+
+###############################################################################
+# Internals
+###############################################################################
+class RunRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        streamer = EventStreamer(self.wfile)
+        try:
+            request = json.loads(self.rfile.readline())
+            journal = self.run(request, streamer)
+        except Exception as x:
+            logger.debug("Failed to run requested experiment", exc_info=True)
+            streamer.send(
+                {
+                    "type": "error",
+                    "error": {"type": x.__class__.__name__, "message": str(x)},
+                }
+            )
+            return
+
+        streamer.send({"type": "journal", "journal": journal})
+
+    def run(
+        self, request: dict[str, Any], streamer: "EventStreamer"
+    ) -> Journal:
+        settings = request.get("settings")
+        if settings is None:
+            settings = self.server.settings
+
+        experiment = request.get("experiment")
+        if experiment is None:
+            experiment = load_experiment(request["source"], settings)
+
+        experiment_vars = None
+        variables = request.get("experiment_vars")
+        if variables:
+            experiment_vars = (
+                variables.get("configuration"),
+                variables.get("secrets"),
+            )
+
+        strategy = Strategy(request.get("strategy", Strategy.DEFAULT.value))
+
+        load_global_controls(settings)
+        return run_experiment(
+            experiment,
+            settings=settings,
+            experiment_vars=experiment_vars,
+            strategy=strategy,
+            event_handlers=[streamer],
+        )
+
+
+class EventStreamer(RunEventHandler):
+    """
+    Send the events of a run to the client as they happen. Once the client
+    has gone away, events are dropped but the run carries on.
+    """
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+        self._lock = threading.Lock()
+        self._gone = False
+
+    def send(self, record: dict[str, Any]) -> None:
+        data = encode_record(record)
+        with self._lock:
+            if self._gone:
+                return
+            try:
+                self.wfile.write(data)
+                self.wfile.flush()
+            except OSError:
+                logger.debug("Client went away, dropping events")
+                self._gone = True
+
+    def event(self, name: str, **payload: Any) -> None:
+        self.send({"type": "event", "event": name, **payload})
+
+    def started(self, experiment: Experiment, journal: Journal) -> None:
+        self.event("started", title=experiment.get("title"))
+
+    def start_hypothesis_before(self, experiment: Experiment) -> None:
+        self.event("start_hypothesis_before")
+
+    def hypothesis_before_completed(
+        self, experiment: Experiment, state: dict[str, Any], journal: Journal
+    ) -> None:
+        self.event("hypothesis_before_completed", state=state)
+
+    def continuous_hypothesis_iteration(
+        self, iteration_index: int, state: Any
+    ) -> None:
+        self.event(
+            "continuous_hypothesis_iteration",
+            iteration=iteration_index,
+            state=state,
+        )
+
+    def start_method(self, experiment: Experiment) -> None:
+        self.event("start_method")
+
+    def method_completed(self, experiment: Experiment, state: Any) -> None:
+        self.event("method_completed")
+
+    def start_hypothesis_after(self, experiment: Experiment) -> None:
+        self.event("start_hypothesis_after")
+
+    def hypothesis_after_completed(
+        self, experiment: Experiment, state: dict[str, Any], journal: Journal
+    ) -> None:
+        self.event("hypothesis_after_completed", state=state)
+
+    def start_rollbacks(self, experiment: Experiment) -> None:
+        self.event("start_rollbacks")
+
+    def rollbacks_completed(
+        self, experiment: Experiment, journal: Journal
+    ) -> None:
+        self.event("rollbacks_completed")
+
+    def start_activity(self, activity: Activity) -> None:
+        self.event("start_activity", name=activity.get("name"))
+
+    def activity_completed(self, activity: Activity, run: Run) -> None:
+        self.event("activity_completed", run=run)
+
+    def interrupted(self, experiment: Experiment, journal: Journal) -> None:
+        self.event("interrupted")
+
+
+def encode_record(record: dict[str, Any]) -> bytes:
+    try:
+        line = json.dumps(record, cls=PayloadEncoder)
+    except TypeError:
+        line = json.dumps(record, default=str)
+    return line.encode("utf-8") + b"\n"
+
+
+def remove_stale_socket(path: str) -> None:
+    # left behind by a daemon which did not shut down cleanly, refuse to
+    # take over a socket another daemon is still listening on
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"'{path}' exists and is not a socket")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            os.remove(path)
+            return
+
+    raise FileExistsError(f"a daemon is already listening on '{path}'")
@@ -46,6 +46,7 @@ import logging
 import os
 import platform
 import signal
+import threading
 from contextlib import contextmanager
 from types import FrameType
 
@@ -71,8 +72,16 @@ def exit_signals():
     Generally speaking using signals this way is a bit of an overkill but
     the Python VM has no other mechanism to interrupt blocking calls.
 
+    Signal handlers can only be set from the main thread, runs started from
+    other threads are left without them and the handlers in place are kept.
+
     WARNING: SIGUSR1 and SIGUSR2 are only available on Unix/Linux systems.
     """
+    if threading.current_thread() is not threading.main_thread():
+        logger.debug("Not running in the main thread, signals are not handled")
+        yield
+        return
+
     sigterm_handler = signal.signal(signal.SIGTERM, _terminate_now)
 
     if hasattr(signal, "SIGUSR1") and hasattr(signal, "SIGUSR2"):
@@ -1,9 +1,15 @@
 import logging
+import time
 from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from typing import Any
 
-from chaoslib.activity import ensure_activity_is_valid
-from chaoslib.caching import lookup_activity, with_cache
+from chaoslib import ContextThreadPoolExecutor
+from chaoslib.activity import (
+    ensure_activity_is_valid,
+    ensure_method_dependencies_are_valid,
+)
+from chaoslib.caching import with_cache
 from chaoslib.configuration import load_configuration
 from chaoslib.control import validate_controls
 from chaoslib.deprecation import (
@@ -19,6 +25,7 @@ from chaoslib.run import apply_activities as apply_act
 from chaoslib.run import apply_rollbacks as apply_roll
 from chaoslib.run import initialize_run_journal as init_journal
 from chaoslib.secret import load_secrets
+from chaoslib.settings import get_loaded_settings
 from chaoslib.types import (
     Configuration,
     Dry,
@@ -30,14 +37,21 @@ from chaoslib.types import (
     Settings,
     Strategy,
 )
+from chaoslib.validation import get_validation_cache
 
-__all__ = ["ensure_experiment_is_valid", "load_experiment"]
+__all__ = [
+    "ensure_experiment_is_valid",
+    "load_experiment",
+    "validate_experiments",
+]
 
 logger = logging.getLogger("chaostoolkit")
 
 
 @with_cache
-def ensure_experiment_is_valid(experiment: Experiment):
+def ensure_experiment_is_valid(
+    experiment: Experiment, settings: Settings = None
+):
     """
     A chaos experiment consists of a method made of activities to carry
     sequentially.
@@ -55,12 +69,52 @@ def ensure_experiment_is_valid(experiment: Experiment):
 
     This function raises :exc:`InvalidExperiment`, :exc:`InvalidProbe` or
     :exc:`InvalidAction` depending on where it fails.
+
+    When the `runtime.validation.cache` settings entry is set, the
+    structure of an experiment already found valid in the same environment
+    is not validated again, see :class:`chaoslib.validation.ValidationCache`.
+    Its configuration, secrets and controls, which depend on more than the
+    experiment, are always validated, so a cache hit still loads secrets,
+    including from Vault.
     """
     logger.info("Validating the experiment's syntax")
 
     if not experiment:
         raise InvalidExperiment("an empty experiment is not an experiment")
 
+    settings = settings if settings is not None else get_loaded_settings()
+    cache = get_validation_cache(settings)
+    cache_key = None
+    cached = False
+    if cache:
+        cache_key = cache.key(experiment)
+        cached = cache.is_valid(cache_key)
+
+    if cached:
+        logger.debug("Experiment structure unchanged since validated")
+    else:
+        ensure_experiment_structure_is_valid(experiment)
+
+    config = load_configuration(experiment.get("configuration", {}))
+    load_secrets(experiment.get("secrets", {}), config)
+
+    warn_about_deprecated_features(experiment)
+
+    validate_controls(experiment)
+
+    if cache_key and not cached:
+        cache.mark_valid(cache_key)
+
+    logger.info("Experiment looks valid")
+
+
+def ensure_experiment_structure_is_valid(experiment: Experiment) -> None:
+    """
+    Validate the experiment itself: its title, description and tags, its
+    extensions, hypothesis, method and rollbacks.
+
+    This should be considered as a private function.
+    """
     if not experiment.get("title"):
         raise InvalidExperiment("experiment requires a title")
 
@@ -73,9 +127,6 @@ def ensure_experiment_is_valid(experiment: Experiment):
 
     validate_extensions(experiment)
 
-    config = load_configuration(experiment.get("configuration", {}))
-    load_secrets(experiment.get("secrets", {}), config)
-
     ensure_hypothesis_is_valid(experiment)
 
     method = experiment.get("method")
@@ -87,26 +138,95 @@ def ensure_experiment_is_valid(experiment: Experiment):
             "which can be empty for only checking steady state hypothesis "
         )
 
+    # names which can be referenced, read from the experiment itself rather
+    # than the activities cache so experiments can be validated concurrently
+    declared = {
+        a.get("name")
+        for a in method
+        + experiment.get("steady-state-hypothesis", {}).get("probes", [])
+    }
     for activity in method:
         ensure_activity_is_valid(activity)
 
         # let's see if a ref is indeed found in the experiment
         ref = activity.get("ref")
-        if ref and not lookup_activity(ref):
+        if ref and ref not in declared:
             raise InvalidActivity(
                 f"referenced activity '{ref}' could not be "
                 "found in the experiment"
             )
 
+    ensure_method_dependencies_are_valid(experiment)
+
     rollbacks = experiment.get("rollbacks", [])
     for activity in rollbacks:
         ensure_activity_is_valid(activity)
 
-    warn_about_deprecated_features(experiment)
 
-    validate_controls(experiment)
-
-    logger.info("Experiment looks valid")
+def validate_experiments(
+    sources: list[str | Experiment],
+    settings: Settings = None,
+    max_workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Load and validate many experiments on a pool of `max_workers` threads.
+
+    Each source is either an experiment or anything :func:`load_experiment`
+    accepts. Experiments share the caches of the process, such as imported
+    modules, resolved Python functions and executables, so each is only
+    paid for once.
+
+    Validation does not stop at the first invalid experiment. A result is
+    returned for each source, in the same order, with the following keys:
+
+    - `"source"`: the source as given, or the experiment's title
+    - `"valid"`: whether the experiment was loaded and found valid
+    - `"error"`: `None` or a mapping with the `"type"` and `"message"` of the
+      exception raised while loading or validating the experiment
+    - `"start"`, `"end"`: UTC ISO dates of when the source was processed
+    - `"load_duration"`, `"validation_duration"`, `"duration"`: timings,
+      in seconds
+    """
+    settings = settings if settings is not None else get_loaded_settings()
+
+    def validate(source: str | Experiment) -> dict[str, Any]:
+        result = {
+            "source": source,
+            "valid": False,
+            "error": None,
+            "start": datetime.now(UTC).isoformat(),
+            "load_duration": 0.0,
+            "validation_duration": 0.0,
+        }
+        started = time.monotonic()
+        try:
+            if isinstance(source, dict):
+                result["source"] = source.get("title")
+                experiment = source
+            else:
+                experiment = load_experiment(source, settings)
+            loaded = time.monotonic()
+            result["load_duration"] = loaded - started
+
+            ensure_experiment_is_valid(experiment, settings)
+            result["validation_duration"] = time.monotonic() - loaded
+            result["valid"] = True
+        except Exception as x:
+            logger.debug(
+                f"Experiment '{result['source']}' is invalid", exc_info=True
+            )
+            result["error"] = {"type": x.__class__.__name__, "message": str(x)}
+        finally:
+            result["end"] = datetime.now(UTC).isoformat()
+            result["duration"] = time.monotonic() - started
+        return result
+
+    with ContextThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(validate, sources))
+
+    invalid = len([r for r in results if not r["valid"]])
+    logger.info(f"Validated {len(results)} experiments, {invalid} invalid")
+    return results
 
 
 @with_cache
@@ -1,19 +1,18 @@
+import importlib.util
 import json
 import logging
 import re
+import threading
+from concurrent.futures import as_completed
 from decimal import Decimal, InvalidOperation
 from functools import singledispatch
 from numbers import Number
 from typing import TYPE_CHECKING, Any
 
-try:
-    from jsonpath2.path import Path as JSONPath
+# jsonpath2 is slow to import, it is only imported by JSON path tolerances
+HAS_JSONPATH = importlib.util.find_spec("jsonpath2") is not None
 
-    HAS_JSONPATH = True
-except ImportError:
-    HAS_JSONPATH = False
-
-from chaoslib import substitute
+from chaoslib import ContextThreadPoolExecutor, substitute
 from chaoslib.activity import (
     ensure_activity_is_valid,
     execute_activity,
@@ -25,7 +24,16 @@ from chaoslib.exceptions import (
     InvalidActivity,
     InvalidExperiment,
 )
-from chaoslib.types import Configuration, Dry, Experiment, Secrets, Tolerance
+from chaoslib.payload import log_payload
+from chaoslib.types import (
+    Activity,
+    Configuration,
+    Dry,
+    Experiment,
+    Run,
+    Secrets,
+    Tolerance,
+)
 
 if TYPE_CHECKING:
     from chaoslib.run import EventHandlerRegistry
@@ -139,6 +147,8 @@ def check_json_path(tolerance: Tolerance):
             raise InvalidActivity(
                 "hypothesis probe tolerance JSON path cannot be empty"
             )
+        from jsonpath2.path import Path as JSONPath
+
         JSONPath.parse_str(path)
     except ValueError:
         raise InvalidActivity(
@@ -186,10 +196,18 @@ def run_steady_state_hypothesis(
     secrets: Secrets,
     dry: Dry,
     event_registry: "EventHandlerRegistry",
+    max_workers: int = 1,
 ) -> dict[str, Any]:
     """
     Run all probes in the hypothesis and fail the experiment as soon as any of
     the probe fails or is outside the tolerance zone.
+
+    When `max_workers` is greater than one, up to that many probes are run
+    concurrently. As soon as one of them is not within its tolerance, the
+    probes which have not started yet are cancelled. The probes are still
+    recorded in the order they were declared, up to the first one which
+    failed, so the state looks the same as if they had been run one after
+    the other.
     """
     state = {"steady_state_met": None, "probes": []}
     hypo = experiment.get("steady-state-hypothesis")
@@ -209,47 +227,25 @@ def run_steady_state_hypothesis(
         probes = hypo.get("probes", [])
         control.with_state(state)
 
-        for activity in probes:
-            run = execute_activity(
-                experiment=experiment,
-                activity=activity,
-                configuration=configuration,
-                secrets=secrets,
-                dry=dry,
-                event_registry=event_registry,
+        if max_workers and max_workers > 1 and len(probes) > 1:
+            runs = run_probes_concurrently(
+                experiment,
+                probes,
+                configuration,
+                secrets,
+                dry,
+                event_registry,
+                max_workers,
             )
-
-            state["probes"].append(run)
-
-            if run["status"] == "failed":
-                run["tolerance_met"] = False
-                state["steady_state_met"] = False
-                logger.warning(
-                    "Probe terminated unexpectedly, "
-                    "so its tolerance could not be validated"
-                )
-                return state
-
-            run["tolerance_met"] = True
-
-            if dry in (Dry.PROBES, Dry.ACTIVITIES):
-                # do not check for tolerance when dry mode is on
-                continue
-
-            tolerance = activity.get("tolerance")
-            if isinstance(tolerance, str):
-                tolerance = substitute(tolerance, configuration, secrets)
-            logger.debug(f"allowed tolerance is {tolerance!s}")
-            checked = within_tolerance(
-                tolerance,
-                run["output"],
-                configuration=configuration,
-                secrets=secrets,
+        else:
+            runs = run_probes_sequentially(
+                experiment, probes, configuration, secrets, dry, event_registry
             )
-            if not checked:
-                run["tolerance_met"] = False
-                state["steady_state_met"] = False
-                return state
+
+        state["probes"].extend(runs)
+        if runs and not runs[-1]["tolerance_met"]:
+            state["steady_state_met"] = False
+            return state
 
         state["steady_state_met"] = True
         logger.info("Steady state hypothesis is met!")
@@ -257,6 +253,141 @@ def run_steady_state_hypothesis(
     return state
 
 
+def run_probes_sequentially(
+    experiment: Experiment,
+    probes: list[Activity],
+    configuration: Configuration,
+    secrets: Secrets,
+    dry: Dry,
+    event_registry: "EventHandlerRegistry",
+) -> list[Run]:
+    """
+    Run the probes one after the other and stop at the first one not within
+    its tolerance.
+    """
+    runs = []
+    for activity in probes:
+        run = run_hypothesis_probe(
+            experiment, activity, configuration, secrets, dry, event_registry
+        )
+        runs.append(run)
+        if not run["tolerance_met"]:
+            break
+    return runs
+
+
+def run_probes_concurrently(
+    experiment: Experiment,
+    probes: list[Activity],
+    configuration: Configuration,
+    secrets: Secrets,
+    dry: Dry,
+    event_registry: "EventHandlerRegistry",
+    max_workers: int,
+) -> list[Run]:
+    """
+    Run the probes on a pool of `max_workers` threads. Pending probes are
+    cancelled as soon as one is not within its tolerance, running ones are
+    waited for.
+
+    Runs are returned in declaration order up to the first probe not within
+    its tolerance.
+    """
+    max_workers = min(max_workers, len(probes))
+    logger.debug(f"Running hypothesis probes with {max_workers} workers")
+
+    deviated = threading.Event()
+    runs = [None] * len(probes)
+
+    def probe(activity: Activity) -> Run | None:
+        if deviated.is_set():
+            return None
+        run = run_hypothesis_probe(
+            experiment, activity, configuration, secrets, dry, event_registry
+        )
+        if not run["tolerance_met"]:
+            deviated.set()
+        return run
+
+    with ContextThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(probe, activity): index
+            for index, activity in enumerate(probes)
+        }
+        try:
+            for f in as_completed(futures):
+                if f.cancelled():
+                    continue
+                run = f.result()
+                runs[futures[f]] = run
+                if deviated.is_set():
+                    for other in futures:
+                        other.cancel()
+        finally:
+            for other in futures:
+                other.cancel()
+
+    ordered = []
+    for run in runs:
+        if run is None:
+            continue
+        ordered.append(run)
+        if not run["tolerance_met"]:
+            break
+    return ordered
+
+
+def run_hypothesis_probe(
+    experiment: Experiment,
+    activity: Activity,
+    configuration: Configuration,
+    secrets: Secrets,
+    dry: Dry,
+    event_registry: "EventHandlerRegistry",
+) -> Run:
+    """
+    Execute a single probe of the hypothesis and flag its run with whether
+    its tolerance was met.
+    """
+    run = execute_activity(
+        experiment=experiment,
+        activity=activity,
+        configuration=configuration,
+        secrets=secrets,
+        dry=dry,
+        event_registry=event_registry,
+    )
+
+    if run["status"] == "failed":
+        run["tolerance_met"] = False
+        logger.warning(
+            "Probe terminated unexpectedly, "
+            "so its tolerance could not be validated"
+        )
+        return run
+
+    run["tolerance_met"] = True
+
+    if dry in (Dry.PROBES, Dry.ACTIVITIES):
+        # do not check for tolerance when dry mode is on
+        return run
+
+    tolerance = activity.get("tolerance")
+    if isinstance(tolerance, str):
+        tolerance = substitute(tolerance, configuration, secrets)
+    logger.debug(f"allowed tolerance is {tolerance!s}")
+    checked = within_tolerance(
+        tolerance,
+        run["output"],
+        configuration=configuration,
+        secrets=secrets,
+    )
+    if not checked:
+        run["tolerance_met"] = False
+
+    return run
+
+
 @singledispatch
 def within_tolerance(
     tolerance: Any,
@@ -358,6 +489,8 @@ def _(
         count_value = tolerance.get("count", None)
         path = substitute(path, configuration, secrets)
         logger.debug(f"Applied jsonpath is: {path}")
+        from jsonpath2.path import Path as JSONPath
+
         px = JSONPath.parse_str(path)
 
         if target:
@@ -389,10 +522,12 @@ def _(
         if result is False:
             if expect:
                 logger.debug(
-                    f"jsonpath found '{values!s}' but expected '{expect!s}'"
+                    "jsonpath found '%s' but expected '%s'",
+                    log_payload(values),
+                    log_payload(expect),
                 )
             else:
-                logger.debug(f"jsonpath found '{values!s}'")
+                logger.debug("jsonpath found '%s'", log_payload(values))
 
         return result
     elif tolerance_type == "range":
@@ -0,0 +1,311 @@
+import json
+import logging
+import os
+import threading
+from datetime import UTC, datetime
+from typing import Any, TextIO
+
+from chaoslib import PayloadEncoder
+from chaoslib.run import RunEventHandler
+from chaoslib.types import (
+    Activity,
+    Configuration,
+    Experiment,
+    Journal,
+    Run,
+    Schedule,
+    Secrets,
+    Settings,
+)
+
+__all__ = ["JournalStreamWriter", "rebuild_journal"]
+logger = logging.getLogger("chaostoolkit")
+
+
+class JournalStreamWriter(RunEventHandler):
+    """
+    Event handler appending the journal of a run to a JSON Lines file as it
+    is being built, rather than waiting for the run to complete.
+
+    Each line is a record with a `"type"` key:
+
+    * `"started"`: the initial journal, without any run
+    * `"run"`: an activity run, tagged with its `"phase"` (one of
+      `"method"`, `"rollbacks"` or `"hypothesis"`)
+    * `"hypothesis"`: a steady-state hypothesis state, tagged with its
+      `"phase"` (one of `"before"`, `"during"` or `"after"`)
+    * `"status"`: the journal status changed
+    * `"finished"`: the final journal entries, such as the end date and
+      duration, without the runs and states already written
+
+    Records are written in batches of `batch_size`, or whenever the status
+    changes or the run completes. Set `fsync` to also sync the file to disk
+    when a batch is written.
+
+    In memory, the handler only keeps the compact `summary` of the run: its
+    status, the number of runs per status and the number of hypothesis
+    iterations and deviations. It never modifies the journal, which remains
+    owned by the run. The writer alone therefore does not bound the memory
+    of a run: the states of the continuous hypothesis stop growing the
+    journal only when running with a :class:`~chaoslib.types.Schedule`
+    whose `history_size` is `0`, they are then only found in the file. Runs
+    of the method and rollbacks are always kept in the journal. Use
+    :func:`rebuild_journal` to read the complete journal back from the file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 64,
+        fsync: bool = False,
+    ):
+        self.path = path
+        self.batch_size = max(batch_size, 1)
+        self.fsync = fsync
+        self.summary = {
+            "status": None,
+            "runs": {},
+            "hypothesis_iterations": 0,
+            "hypothesis_deviations": 0,
+        }
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._file: TextIO | None = None
+        self._journal: Journal | None = None
+        self._phase = None
+        self._hypothesis_probes = set()
+        self._method_activities = set()
+
+    def started(self, experiment: Experiment, journal: Journal) -> None:
+        self._journal = journal
+        # kept open until the run finishes
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+
+        probes = experiment.get("steady-state-hypothesis", {}).get("probes", [])
+        self._hypothesis_probes = {id(p) for p in probes}
+        method = experiment.get("method", [])
+        activities = method + experiment.get("rollbacks", [])
+        # steps referring to another activity run that activity, resolved by
+        # name as the activities cache does
+        named = {a["name"]: a for a in method + probes if a.get("name")}
+        self._method_activities = {
+            id(named.get(a["ref"], a)) if a.get("ref") else id(a)
+            for a in activities
+        }
+
+        initial = {
+            k: v
+            for k, v in journal.items()
+            if k not in ("run", "rollbacks", "steady_states")
+        }
+        self._write({"type": "started", "journal": initial}, flush=True)
+
+    def running(
+        self,
+        experiment: Experiment,
+        journal: Journal,
+        configuration: Configuration,
+        secrets: Secrets,
+        schedule: Schedule,
+        settings: Settings,
+    ) -> None:
+        self._journal = journal
+
+    def start_hypothesis_before(self, experiment: Experiment) -> None:
+        self._phase = "before"
+
+    def hypothesis_before_completed(
+        self, experiment: Experiment, state: dict[str, Any], journal: Journal
+    ) -> None:
+        self._write_state("before", state)
+        self._phase = None
+
+    def continuous_hypothesis_iteration(
+        self, iteration_index: int, state: Any
+    ) -> None:
+        self._write_state("during", state, iteration=iteration_index)
+
+    def start_method(self, experiment: Experiment) -> None:
+        self._phase = "method"
+
+    def method_completed(self, experiment: Experiment, state: Any) -> None:
+        self._phase = None
+        self._write_status()
+
+    def start_hypothesis_after(self, experiment: Experiment) -> None:
+        self._phase = "after"
+
+    def hypothesis_after_completed(
+        self, experiment: Experiment, state: dict[str, Any], journal: Journal
+    ) -> None:
+        self._write_state("after", state)
+        self._phase = None
+
+    def start_rollbacks(self, experiment: Experiment) -> None:
+        self._phase = "rollbacks"
+
+    def rollbacks_completed(
+        self, experiment: Experiment, journal: Journal
+    ) -> None:
+        self._phase = None
+        self._write_status()
+
+    def activity_completed(self, activity: Activity, run: Run) -> None:
+        phase = self._phase
+        # probes of the continuous hypothesis complete during the method
+        if phase in ("before", "after") or self._is_hypothesis_run(
+            activity, run
+        ):
+            phase = "hypothesis"
+
+        status = run.get("status")
+        with self._lock:
+            runs = self.summary["runs"]
+            runs[status] = runs.get(status, 0) + 1
+
+        self._write({"type": "run", "phase": phase or "method", "run": run})
+
+    def interrupted(self, experiment: Experiment, journal: Journal) -> None:
+        self._write_status()
+
+    def signal_exit(self) -> None:
+        self._write_status()
+
+    def finish(self, journal: Journal) -> None:
+        try:
+            self._write_status()
+            final = {
+                k: v
+                for k, v in journal.items()
+                if k not in ("run", "rollbacks", "steady_states", "experiment")
+            }
+            self._write({"type": "finished", "journal": final}, flush=True)
+        finally:
+            with self._lock:
+                if self._file:
+                    self._file.close()
+                    self._file = None
+            self._journal = None
+
+    ###########################################################################
+    # Internals
+    ###########################################################################
+    def _is_hypothesis_run(self, activity: Activity, run: Run) -> bool:
+        if id(activity) not in self._hypothesis_probes:
+            return False
+
+        if id(activity) not in self._method_activities or self._journal is None:
+            return True
+
+        # the activity is declared in the hypothesis and in the method or
+        # rollbacks, whose runs are added to the journal as they start
+        journal = self._journal
+        for runs in (journal.get("run") or [], journal.get("rollbacks") or []):
+            if any(r is run for r in reversed(runs)):
+                return False
+        return True
+
+    def _write_state(
+        self, phase: str, state: dict[str, Any] | None, **extra: Any
+    ) -> None:
+        if phase == "during":
+            with self._lock:
+                self.summary["hypothesis_iterations"] += 1
+                if state is not None and not state["steady_state_met"]:
+                    self.summary["hypothesis_deviations"] += 1
+
+        record = {"type": "hypothesis", "phase": phase, "state": state}
+        record.update(extra)
+        self._write(record)
+        self._write_status()
+
+    def _write_status(self) -> None:
+        if self._journal is None:
+            return
+
+        status = self._journal.get("status")
+        with self._lock:
+            if status == self.summary["status"]:
+                return
+            self.summary["status"] = status
+
+        self._write({"type": "status", "status": status}, flush=True)
+
+    def _write(self, record: dict[str, Any], flush: bool = False) -> None:
+        record["ts"] = datetime.now(UTC).isoformat()
+        try:
+            line = json.dumps(record, cls=PayloadEncoder)
+        except TypeError:
+            line = json.dumps(record, default=str)
+
+        with self._lock:
+            if self._file is None:
+                return
+
+            self._buffer.append(line)
+            if flush or len(self._buffer) >= self.batch_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        self._file.write("\n".join(self._buffer))
+        self._file.write("\n")
+        self._buffer.clear()
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+
+def rebuild_journal(path: str) -> Journal:
+    """
+    Read back a JSON Lines file written by :class:`JournalStreamWriter` and
+    return the journal as it would have been returned by the run.
+
+    When the file holds several runs, the last one is returned.
+    """
+    journal = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            record = json.loads(line)
+            record_type = record.get("type")
+            if record_type == "started":
+                journal = record["journal"]
+                journal["steady_states"] = {
+                    "before": None,
+                    "after": None,
+                    "during": [],
+                }
+                journal["run"] = []
+                journal["rollbacks"] = []
+            elif journal is None:
+                logger.debug(f"Skipping record without a run: {line}")
+            elif record_type == "run":
+                if record["phase"] == "method":
+                    journal["run"].append(record["run"])
+                elif record["phase"] == "rollbacks":
+                    journal["rollbacks"].append(record["run"])
+            elif record_type == "hypothesis":
+                phase = record["phase"]
+                if phase == "during":
+                    journal["steady_states"]["during"].append(record["state"])
+                else:
+                    journal["steady_states"][phase] = record["state"]
+            elif record_type == "status":
+                journal["status"] = record["status"]
+            elif record_type == "finished":
+                journal.update(record["journal"])
+
+    if journal is None:
+        return None
+
+    # runs are written when they complete but the journal lists them in the
+    # order they started
+    journal["run"].sort(key=lambda r: r.get("start") or "")
+    journal["rollbacks"].sort(key=lambda r: r.get("start") or "")
+    return journal
@@ -1,60 +1,202 @@
+import hashlib
 import json
 import logging
+import marshal
 import os.path
+import tempfile
+import time
 from json.decoder import JSONDecodeError
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-import requests
-import yaml
-
 from chaoslib.control import controls
 from chaoslib.exceptions import InvalidExperiment, InvalidSource
+from chaoslib.payload import log_payload
+from chaoslib.provider.http import get_session_pool
 from chaoslib.types import Experiment, Settings
 
+if TYPE_CHECKING:
+    import requests
+
 __all__ = ["load_experiment"]
 
 logger = logging.getLogger("chaostoolkit")
+EXPERIMENT_CACHE_DIR = os.path.abspath(
+    os.path.expanduser("~/.chaostoolkit/cache/experiments")
+)
+EXPERIMENT_CACHE_VERSION = 1
+HTTP_CACHE_DIR = os.path.abspath(
+    os.path.expanduser("~/.chaostoolkit/cache/http")
+)
+
 
+def yaml_safe_load(content: str | bytes) -> Any:
+    """
+    Same as `yaml.safe_load` but through libyaml when it is available.
 
-def parse_experiment_from_file(path: str) -> Experiment:
+    `yaml` is only imported the first time a document is parsed.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
+def parse_experiment_from_file(
+    path: str, cache_dir: str | None = None
+) -> Experiment:
     """
     Parse the given experiment from `path` and return it.
+
+    When `cache_dir` is set, the parsed experiment is stored there, in
+    binary form, and reused as long as the file keeps the same modification
+    time, size and content.
     """
-    with open(path) as f:
+    with open(path, "rb") as f:
         _, ext = os.path.splitext(path)
-        if ext in (".yaml", ".yml"):
-            try:
-                return yaml.safe_load(f)
-            except yaml.YAMLError as ye:
-                raise InvalidSource(f"Failed parsing YAML experiment: {ye!s}")
-        elif ext == ".json":
-            return json.load(f)
+        if ext not in (".yaml", ".yml", ".json"):
+            raise InvalidExperiment(
+                "only files with json, yaml or yml extensions are supported"
+            )
 
-    raise InvalidExperiment(
-        "only files with json, yaml or yml extensions are supported"
-    )
+        stat = os.fstat(f.fileno())
+        content = f.read()
+
+    key = cache_path = None
+    if cache_dir:
+        abs_path = os.path.abspath(path)
+        key = (
+            EXPERIMENT_CACHE_VERSION,
+            marshal.version,
+            abs_path,
+            stat.st_mtime_ns,
+            stat.st_size,
+            hashlib.sha256(content).hexdigest(),
+        )
+        cache_path = get_cache_path(cache_dir, abs_path)
+        cached = read_cached_experiment(cache_path, key)
+        if cached is not None:
+            return cached
+
+    if ext == ".json":
+        experiment = json.loads(content)
+    else:
+        import yaml
+
+        try:
+            experiment = yaml_safe_load(content)
+        except yaml.YAMLError as ye:
+            raise InvalidSource(f"Failed parsing YAML experiment: {ye!s}")
+
+    if key:
+        write_cached_experiment(cache_path, key, experiment)
 
+    return experiment
 
-def parse_experiment_from_http(response: requests.Response) -> Experiment:
+
+def get_experiment_cache_dir(settings: Settings = None) -> str | None:
+    """
+    Directory of the parsed experiments cache, as set by the
+    `runtime.loader.cache` settings, or `None` when it is disabled.
+
+    That entry may be `true` to use the default directory or the path to
+    a directory.
+    """
+    if not settings:
+        return None
+
+    cache = settings.get("runtime", {}).get("loader", {}).get("cache")
+    if not cache:
+        return None
+
+    if cache is True:
+        return EXPERIMENT_CACHE_DIR
+
+    return os.path.abspath(os.path.expanduser(cache))
+
+
+def read_cached_experiment(cache_path: str, key: tuple) -> Experiment | None:
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, experiment = marshal.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.debug(f"Ignoring unreadable cache '{cache_path}'", exc_info=True)
+        return None
+
+    if tuple(cached_key) != key:
+        return None
+
+    logger.debug(f"Experiment loaded from cache '{cache_path}'")
+    return experiment
+
+
+def write_cached_experiment(
+    cache_path: str, key: tuple, experiment: Experiment
+) -> None:
+    try:
+        data = marshal.dumps((key, experiment))
+    except ValueError:
+        # YAML may hold values, such as dates, which marshal does not
+        # support, such experiments are simply not cached
+        logger.debug("Experiment cannot be cached", exc_info=True)
+        return
+
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        logger.debug(f"Failed to write cache '{cache_path}'", exc_info=True)
+
+
+def get_cache_path(cache_dir: str, path: str) -> str:
+    digest = hashlib.sha256(path.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.bin")
+
+
+def parse_experiment_from_http(response: "requests.Response") -> Experiment:
     """
     Parse the given experiment from the request's `response`.
     """
-    content_type = response.headers.get("Content-Type")
+    return parse_experiment_from_content(
+        response.headers.get("Content-Type"), response.text
+    )
+
+
+def parse_experiment_from_content(
+    content_type: str, content: str
+) -> Experiment:
+    """
+    Parse the given experiment from a content fetched over HTTP.
+    """
+    content_type = content_type or ""
 
     if "application/json" in content_type:
-        return response.json()
+        return json.loads(content)
     elif "application/x-yaml" in content_type or "text/yaml" in content_type:
+        import yaml
+
         try:
-            return yaml.safe_load(response.text)
+            return yaml_safe_load(content)
         except yaml.YAMLError as ye:
             raise InvalidSource(f"Failed parsing YAML experiment: {ye!s}")
     elif "text/plain" in content_type:
-        content = response.text
         try:
             return json.loads(content)
         except JSONDecodeError:
+            import yaml
+
             try:
-                return yaml.safe_load(content)
+                return yaml_safe_load(content)
             except yaml.YAMLError:
                 pass
 
@@ -63,6 +205,172 @@ def parse_experiment_from_http(response: requests.Response) -> Experiment:
     )
 
 
+class HttpExperimentCache:
+    """
+    Local store of the experiments fetched over HTTP, along with the `ETag`
+    and `Last-Modified` headers of their response, so that they can be
+    fetched again with a conditional request and served from the store on a
+    `304 Not Modified` response.
+
+    An experiment fetched less than `max_age` seconds ago is served from the
+    store without any request at all, which also allows running offline.
+
+    Entries are keyed by URL and `Authorization` header so that an
+    experiment fetched with some credentials is never served for others.
+    """
+
+    def __init__(self, directory: str = HTTP_CACHE_DIR, max_age: float = 0):
+        self.directory = directory
+        self.max_age = max_age
+
+    def lookup(
+        self, url: str, headers: dict[str, str]
+    ) -> dict[str, Any] | None:
+        path = self._path(url, headers)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug(f"Ignoring unreadable cache '{path}'", exc_info=True)
+            return None
+
+        if entry.get("url") != url:
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        return time.time() - entry.get("fetched_at", 0) < self.max_age
+
+    def conditional_headers(self, entry: dict[str, Any]) -> dict[str, str]:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(
+        self,
+        url: str,
+        headers: dict[str, str],
+        response: "requests.Response",
+    ) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified or self.max_age):
+            return
+
+        self._write(
+            url,
+            headers,
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "content_type": response.headers.get("Content-Type"),
+                "content": response.text,
+                "fetched_at": time.time(),
+            },
+        )
+
+    def refresh(
+        self, url: str, headers: dict[str, str], entry: dict[str, Any]
+    ) -> None:
+        entry["fetched_at"] = time.time()
+        self._write(url, headers, entry)
+
+    def _write(
+        self, url: str, headers: dict[str, str], entry: dict[str, Any]
+    ) -> None:
+        path = self._path(url, headers)
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except OSError:
+            logger.debug(f"Failed to write cache '{path}'", exc_info=True)
+
+    def _path(self, url: str, headers: dict[str, str]) -> str:
+        key = f"{url}\0{headers.get('Authorization', '')}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+
+def get_http_experiment_cache(
+    settings: Settings = None,
+) -> HttpExperimentCache | None:
+    """
+    Cache of experiments fetched over HTTP, as set by the
+    `runtime.loader.http_cache` settings, or `None` when it is disabled.
+
+    That entry may be `true` to use the default directory, the path to a
+    directory or a mapping with optional `path` and `max_age` keys.
+    """
+    if not settings:
+        return None
+
+    http_cache = settings.get("runtime", {}).get("loader", {}).get("http_cache")
+    if not http_cache:
+        return None
+
+    if http_cache is True:
+        return HttpExperimentCache()
+
+    if isinstance(http_cache, str):
+        http_cache = {"path": http_cache}
+
+    path = http_cache.get("path")
+    return HttpExperimentCache(
+        os.path.abspath(os.path.expanduser(path)) if path else HTTP_CACHE_DIR,
+        max_age=float(http_cache.get("max_age", 0)),
+    )
+
+
+def fetch_experiment(
+    url: str,
+    headers: dict[str, str],
+    verify_tls: bool = True,
+    timeout: float | None = None,
+    cache: HttpExperimentCache | None = None,
+) -> tuple[str, str]:
+    """
+    Fetch the experiment at `url`, through the `cache` when one is given,
+    and return its content type and content.
+    """
+    entry = cache.lookup(url, headers) if cache else None
+    request_headers = headers
+    if entry:
+        if cache.is_fresh(entry):
+            logger.debug(f"Experiment served from cache: {url}")
+            return entry["content_type"], entry["content"]
+        request_headers = dict(headers, **cache.conditional_headers(entry))
+
+    with get_session_pool().session(url, verify_tls=verify_tls) as session:
+        r = session.get(
+            url, headers=request_headers, verify=verify_tls, timeout=timeout
+        )
+    if r.status_code == 304 and entry:
+        logger.debug(f"Experiment not modified since last fetched: {url}")
+        cache.refresh(url, headers, entry)
+        return entry["content_type"], entry["content"]
+
+    if r.status_code != 200:
+        raise InvalidSource(f"Failed to fetch the experiment: {r.text}")
+
+    logger.debug("Fetched experiment: \n%s", log_payload(r.text))
+    if cache:
+        cache.store(url, headers, r)
+    return r.headers.get("Content-Type"), r.text
+
+
 def load_experiment(
     experiment_source: str, settings: Settings = None, verify_tls: bool = True
 ) -> Experiment:
@@ -89,10 +397,19 @@ def load_experiment(
     Set `verify_tls` to `False` if the source is a over a self-signed
     certificate HTTP endpoint to instruct the loader to not verify the
     certificates.
+
+    Local files are parsed once and kept in a cache when the
+    `runtime.loader.cache` settings entry is set, see
+    :func:`get_experiment_cache_dir`. Remote experiments are fetched with
+    conditional requests when the `runtime.loader.http_cache` entry is set,
+    see :func:`get_http_experiment_cache`. The request times out after
+    `runtime.loader.timeout` seconds, 30 by default.
     """
     with controls(level="loader", context=experiment_source) as control:
         if os.path.exists(experiment_source):
-            parsed = parse_experiment_from_file(experiment_source)
+            parsed = parse_experiment_from_file(
+                experiment_source, get_experiment_cache_dir(settings)
+            )
             control.with_state(parsed)
             return parsed
 
@@ -119,11 +436,19 @@ def load_experiment(
                     )
                     break
 
-        r = requests.get(experiment_source, headers=headers, verify=verify_tls)
-        if r.status_code != 200:
-            raise InvalidSource(f"Failed to fetch the experiment: {r.text}")
-
-        logger.debug(f"Fetched experiment: \n{r.text}")
-        parsed = parse_experiment_from_http(r)
+        timeout = (
+            (settings or {})
+            .get("runtime", {})
+            .get("loader", {})
+            .get("timeout", 30)
+        )
+        content_type, content = fetch_experiment(
+            experiment_source,
+            headers,
+            verify_tls=verify_tls,
+            timeout=timeout,
+            cache=get_http_experiment_cache(settings),
+        )
+        parsed = parse_experiment_from_content(content_type, content)
         control.with_state(parsed)
         return parsed
@@ -3,17 +3,21 @@ try:
 except ImportError:
     curses = None
 
+import atexit
+import copy
 import decimal
 import logging
 import os
+import queue
 import sys
+import threading
 import uuid
 from contextlib import suppress
 from datetime import date, datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from types import ModuleType
 
-from pythonjsonlogger import jsonlogger
+from chaoslib.payload import set_payload_log_budget
 
 if os.name == "nt":
     from colorama import init as colorama_init
@@ -21,7 +25,7 @@ if os.name == "nt":
     colorama_init()
 
 
-__all__ = ["configure_logger"]
+__all__ = ["configure_logger", "flush_logger"]
 
 
 def encoder(o: object) -> str:
@@ -49,6 +53,8 @@ def configure_logger(
     logger_name: str = "chaostoolkit",
     context_id: str | None = None,
     override_logzero_if_present: bool = True,
+    queue_size: int | None = None,
+    payload_budget: int | None = None,
 ):
     """
     Configure the chaostoolkit logger.
@@ -61,10 +67,27 @@ def configure_logger(
 
     When `override_logzero_if_present` is set, we replace
     `sys.modules["logzero"]` with a fake module so that logzero is disabled.
+
+    When `queue_size` is set, records are put onto a queue holding at most
+    that many records and written to the console and the file by a
+    dedicated thread, so that the threads logging them do not wait on
+    I/O. They only block when the queue is full. The queue is flushed when
+    the process exits, including when interrupted, or by calling
+    :func:`flush_logger`.
+
+    `payload_budget` is the number of bytes an activity output, or any other
+    payload logged through :func:`chaoslib.payload.log_payload`, may take
+    in a record before it is truncated. `0` disables truncation. Payloads
+    are only rendered when a handler would write the record. Queued records
+    render them as they are logged, so that changing them afterwards does
+    not change what is written.
     """
     if override_logzero_if_present:
         override_logzero_module()
 
+    if payload_budget is not None:
+        set_payload_log_budget(payload_budget)
+
     log_level = logging.INFO
 
     # we define colors ourselves as critical is missing in default ones
@@ -87,6 +110,8 @@ def configure_logger(
         fmt=fmt, datefmt="%Y-%m-%d %H:%M:%S", colors=colors
     )
     if log_format == "json":
+        from pythonjsonlogger import jsonlogger
+
         fmt = (
             "%(process) %(asctime) %(levelname) %(module) %(lineno) %(message)"
         )
@@ -100,10 +125,11 @@ def configure_logger(
     logger.propagate = False
     logger.setLevel(log_level)
 
+    handlers = []
     handler = logging.StreamHandler()
     handler.setLevel(log_level)
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    handlers.append(handler)
 
     if context_id:
         logger.addFilter(ChaosToolkitContextFilter(logger_name, context_id))
@@ -122,12 +148,110 @@ def configure_logger(
         handler = RotatingFileHandler(log_file)
         handler.setLevel(log_file_level)
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        handlers.append(handler)
+
+    if queue_size:
+        logger.addHandler(
+            start_queue_listener(logger_name, handlers, queue_size)
+        )
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+
+
+def flush_logger(logger_name: str = "chaostoolkit") -> None:
+    """
+    Wait until the records queued so far, when the logger was configured
+    with a `queue_size`, have been written out.
+    """
+    with _listeners_lock:
+        listener = _listeners.get(logger_name)
+    if listener is not None:
+        listener.queue.join()
 
 
 ###############################################################################
 # Private function
 ###############################################################################
+_listeners: dict[str, QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Put records onto a bounded queue, waiting for room when it is full
+    rather than dropping them.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # only merge the arguments, which may be changed by the caller once
+        # logged, the formatting, including of the traceback, is left to
+        # the handlers in the listener's thread. Payloads are rendered here
+        # too, within budget, records no handler writes are not queued
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BoundedQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # the queue may be full, this thread's own records are still being
+        # handled so room is eventually made for the sentinel
+        self.queue.put(self._sentinel)
+
+
+def start_queue_listener(
+    logger_name: str, handlers: list[logging.Handler], queue_size: int
+) -> QueueHandler:
+    stop_queue_listener(logger_name)
+
+    records = queue.Queue(maxsize=queue_size)
+    listener = BoundedQueueListener(
+        records, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    with _listeners_lock:
+        _listeners[logger_name] = listener
+
+    # records no handler would write are not even queued
+    handler = BoundedQueueHandler(records)
+    handler.setLevel(min(h.level for h in handlers))
+    return handler
+
+
+def stop_queue_listener(logger_name: str) -> None:
+    with _listeners_lock:
+        listener = _listeners.pop(logger_name, None)
+    if listener is None:
+        return
+
+    # no record can be queued once the listener is gone, nothing would make
+    # room for them
+    logger = logging.getLogger(logger_name)
+    for handler in list(logger.handlers):
+        if isinstance(handler, BoundedQueueHandler) and (
+            handler.queue is listener.queue
+        ):
+            logger.removeHandler(handler)
+
+    # handles whatever is left in the queue before returning
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+
+
+@atexit.register
+def stop_queue_listeners() -> None:
+    with _listeners_lock:
+        names = list(_listeners)
+    for name in names:
+        stop_queue_listener(name)
+
+
 def override_logzero_module() -> None:
     """
     To remove our dependency on logzero, we need to make sure we
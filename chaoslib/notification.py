@@ -1,7 +1,11 @@
+import atexit
 import importlib
 import inspect
 import json
 import logging
+import threading
+import time
+from collections import deque
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
@@ -10,13 +14,16 @@ import requests
 from requests.exceptions import HTTPError
 
 from chaoslib import PayloadEncoder
+from chaoslib.provider.http import SessionPool
 from chaoslib.types import EventPayload, Settings
 
 __all__ = [
     "DiscoverFlowEvent",
     "InitFlowEvent",
+    "NotificationDispatcher",
     "RunFlowEvent",
     "ValidateFlowEvent",
+    "close_notification_dispatcher",
     "notify",
 ]
 
@@ -63,7 +70,9 @@ def notify(
     call them one by one. Only call those matching the current event.
 
     As this function is blocking, make sure none of your channels take too
-    long to run.
+    long to run. Alternatively, set `runtime.notifications.dispatch` to
+    `"async"` in the settings so that notifications are sent from a
+    background thread, see :class:`NotificationDispatcher`.
 
     Whenever an error happened in the notification, a debug message is logged
     into the chaostoolkit log for review but this should not impact the
@@ -143,11 +152,19 @@ def notify(
     elif event_class is ValidateFlowEvent:
         event_payload["phase"] = "validate"
 
-    for channel in notification_channels:
-        events = channel.get("events")
-        if events and event.value not in events:
-            continue
+    channels = [
+        channel
+        for channel in notification_channels
+        if not channel.get("events") or event.value in channel["events"]
+    ]
 
+    runtime = settings.get("runtime", {}).get("notifications", {})
+    if runtime.get("dispatch") == "async":
+        if channels:
+            get_notification_dispatcher(runtime).submit(channels, event_payload)
+        return
+
+    for channel in channels:
         channel_type = channel.get("type")
         if channel_type == "http":
             notify_with_http(channel, event_payload)
@@ -175,16 +192,12 @@ def notify_with_http(channel: dict[str, str], payload: EventPayload):
     if url:
         try:
             if forward_event_payload:
-                payload_encoded = json.loads(
-                    json.dumps(payload, cls=PayloadEncoder)
-                )
-
                 resp = requests.post(
                     url,
-                    headers=headers,
+                    headers=json_headers(headers),
                     verify=verify_tls,
                     timeout=(2, 5),
-                    json=payload_encoded,
+                    data=json.dumps(payload, cls=PayloadEncoder),
                 )
             else:
                 resp = requests.get(
@@ -236,3 +249,300 @@ def notify_via_plugin(channel: dict[str, str], payload: EventPayload):
                 f"could not find function '{func_name}' in plugin '{mod_name}' "
                 "for notification"
             )
+
+
+def json_headers(headers: dict[str, str] | None) -> dict[str, str]:
+    h = {"Content-Type": "application/json"}
+    h.update(headers or {})
+    return h
+
+
+class NotificationDispatcher:
+    """
+    Send notifications from a background thread so that raising an event
+    does not wait for the channels.
+
+    Each event payload is encoded to JSON once, whatever the number of HTTP
+    channels it goes to, and HTTP channels share sessions pooled per host.
+
+    Events pending for the same channel are sent together, in a single
+    request carrying a JSON array, up to the `batch_size` of that channel.
+    That is one event per request by default. Set `batch_interval` to wait
+    that many seconds, from the first pending event, for more events before
+    sending. At most `queue_size`
+    events are kept pending, the oldest ones are dropped beyond that.
+
+    HTTP requests failing with a connection error, a timeout or a 429/5xx
+    response are tried again up to `retries` times, waiting `backoff`
+    seconds, doubled on each attempt, in between.
+
+    When the process exits, pending events are sent for at most
+    `drain_timeout` seconds and dropped after that.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        queue_size: int = 1024,
+        retries: int = 2,
+        backoff: float = 0.5,
+        batch_interval: float = 0.0,
+        drain_timeout: float = 5.0,
+    ):
+        self.queue_size = max(queue_size, 1)
+        self.retries = max(retries, 0)
+        self.backoff = backoff
+        self.batch_interval = batch_interval
+        self.drain_timeout = drain_timeout
+        self.sessions = SessionPool()
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self._queue = deque()
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._deadline = None
+        self._closing = False
+        self._thread = threading.Thread(
+            target=self._run, name="chaostoolkit-notifications", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self, channels: list[dict[str, Any]], payload: EventPayload
+    ) -> None:
+        """
+        Queue the event payload for each of the given channels.
+        """
+        encoded = None
+        if any(c.get("type") == "http" for c in channels):
+            encoded = json.dumps(payload, cls=PayloadEncoder)
+
+        with self._cond:
+            if self._closing:
+                logger.debug("notification dispatcher closed, event dropped")
+                return
+
+            for channel in channels:
+                if len(self._queue) >= self.queue_size:
+                    self._queue.popleft()
+                    self._pending -= 1
+                    self.dropped += 1
+                self._queue.append((channel, payload, encoded))
+                self._pending += 1
+            self._cond.notify_all()
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Send the pending events, for at most `timeout` seconds, defaulting
+        to `drain_timeout`, and stop the background thread.
+        """
+        timeout = self.drain_timeout if timeout is None else timeout
+        with self._cond:
+            self._closing = True
+            self._deadline = time.monotonic() + timeout
+            self._cond.notify_all()
+
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.debug(
+                f"{self.stats()['pending']} notifications could not be sent "
+                "in time and were dropped"
+            )
+        else:
+            self.sessions.close()
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "pending": self._pending,
+                "sent": self.sent,
+                "failed": self.failed,
+                "dropped": self.dropped,
+            }
+
+    ###########################################################################
+    # Internals
+    ###########################################################################
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closing)
+                if not self._queue:
+                    return
+
+                if self.batch_interval and not self._closing:
+                    # the batch is sent once its interval elapsed, events
+                    # submitted meanwhile join it rather than send it early
+                    self._cond.wait_for(
+                        lambda: self._closing, timeout=self.batch_interval
+                    )
+
+                if self._expired():
+                    self._drop(len(self._queue))
+                    self._queue.clear()
+                    return
+
+                pending = list(self._queue)
+                self._queue.clear()
+
+            batches = {}
+            for channel, payload, encoded in pending:
+                batches.setdefault(id(channel), (channel, []))[1].append(
+                    (payload, encoded)
+                )
+
+            for channel, events in batches.values():
+                batch_size = max(channel.get("batch_size", 1), 1)
+                for index in range(0, len(events), batch_size):
+                    if self._expired():
+                        with self._cond:
+                            self._drop(len(events) - index)
+                        break
+                    self._deliver(channel, events[index : index + batch_size])
+
+    def _deliver(
+        self, channel: dict[str, Any], events: list[tuple[Any, str]]
+    ) -> None:
+        channel_type = channel.get("type")
+        try:
+            if channel_type == "http":
+                ok = self._send_http(channel, [e for _, e in events])
+            elif channel_type == "plugin":
+                for payload, _ in events:
+                    notify_via_plugin(channel, payload)
+                ok = True
+            else:
+                ok = True
+        except Exception as ex:
+            logger.debug("failed dispatching notification", exc_info=ex)
+            ok = False
+
+        with self._cond:
+            self._pending -= len(events)
+            if ok:
+                self.sent += len(events)
+            else:
+                self.failed += len(events)
+
+    def _drop(self, count: int) -> None:
+        # called with the condition held
+        self._pending -= count
+        self.dropped += count
+
+    def _send_http(self, channel: dict[str, Any], encoded: list[str]) -> bool:
+        url = channel.get("url")
+        if not url:
+            logger.debug("missing url in notification channel")
+            return False
+
+        verify_tls = channel.get("verify_tls", True)
+        headers = channel.get("headers")
+        if channel.get("forward_event_payload", True):
+            method = "POST"
+            headers = json_headers(headers)
+            if channel.get("batch_size", 1) > 1:
+                data = "[" + ",".join(encoded) + "]"
+            else:
+                data = encoded[0]
+        else:
+            method = "GET"
+            data = None
+
+        with self.sessions.session(url, verify_tls=verify_tls) as session:
+            for attempt in range(self.retries + 1):
+                last = attempt == self.retries
+                try:
+                    resp = session.request(
+                        method,
+                        url,
+                        headers=headers,
+                        data=data,
+                        verify=verify_tls,
+                        timeout=(2, 5),
+                    )
+                    if resp.status_code not in self.RETRY_STATUSES or last:
+                        resp.raise_for_status()
+                        return True
+                except HTTPError as ex:
+                    logger.debug(
+                        f"notification sent to {url} failed with: {ex}"
+                    )
+                    return False
+                except requests.exceptions.RequestException as ex:
+                    if last:
+                        logger.debug(
+                            "failed calling notification endpoint", exc_info=ex
+                        )
+                        return False
+
+                delay = self.backoff * (2**attempt)
+                if self._deadline is not None and (
+                    time.monotonic() + delay > self._deadline
+                ):
+                    logger.debug(f"no time left to retry notifying {url}")
+                    return False
+                time.sleep(delay)
+
+        return False
+
+    def _expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() > self._deadline
+
+
+_dispatcher: NotificationDispatcher | None = None
+_dispatcher_options: dict[str, Any] = {}
+_ignored_options: list[dict[str, Any]] = []
+_dispatcher_lock = threading.Lock()
+
+
+def get_notification_dispatcher(
+    runtime: dict[str, Any],
+) -> NotificationDispatcher:
+    """
+    Return the process-wide dispatcher, creating it from the
+    `runtime.notifications` settings when it does not exist yet. It is
+    closed when the process exits.
+
+    Later settings do not change a dispatcher already created, a warning is
+    logged when they differ.
+    """
+    global _dispatcher, _dispatcher_options
+    options = {
+        "queue_size": runtime.get("queue_size", 1024),
+        "retries": runtime.get("retries", 2),
+        "backoff": runtime.get("backoff", 0.5),
+        "batch_interval": runtime.get("batch_interval", 0.0),
+        "drain_timeout": runtime.get("drain_timeout", 5.0),
+    }
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = NotificationDispatcher(**options)
+            _dispatcher_options = options
+            _ignored_options.clear()
+        elif options != _dispatcher_options and options not in _ignored_options:
+            _ignored_options.append(options)
+            logger.warning(
+                "The notification dispatcher is already running with "
+                f"{_dispatcher_options}, ignoring these settings: {options}"
+            )
+        return _dispatcher
+
+
+def close_notification_dispatcher(timeout: float | None = None) -> None:
+    """
+    Send the events still pending, within the deadline of the dispatcher
+    unless a `timeout` is given, and stop it.
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        dispatcher = _dispatcher
+        _dispatcher = None
+
+    if dispatcher is not None:
+        dispatcher.close(timeout)
+        logger.debug(f"Notification dispatcher closed: {dispatcher.stats()}")
+
+
+atexit.register(close_notification_dispatcher)
@@ -0,0 +1,202 @@
+"""
+Log activity outputs, fetched documents and other payloads of any size
+without paying for them when the record is never written.
+
+Pass payloads as arguments of a `%`-style message rather than formatting
+them yourself:
+
+```python
+logger.debug("  => succeeded with '%s'", log_payload(result))
+```
+
+The payload is only rendered when a handler formats the record, and then
+only up to a budget of bytes, as set with :func:`set_payload_log_budget`.
+What does not fit is replaced by a truncation marker.
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+__all__ = [
+    "LoggedPayload",
+    "get_payload_log_budget",
+    "log_payload",
+    "render_payload",
+    "set_payload_log_budget",
+]
+DEFAULT_PAYLOAD_LOG_BUDGET = 4096
+TRUNCATION_MARKER = "... [truncated]"
+_budget = DEFAULT_PAYLOAD_LOG_BUDGET
+_budget_lock = threading.Lock()
+
+
+class LoggedPayload:
+    """
+    A payload rendered, within `budget` bytes, only once the log record
+    holding it is formatted. When `budget` is `None`, the budget in place at
+    that time is used.
+    """
+
+    __slots__ = ("budget", "value")
+
+    def __init__(self, value: Any, budget: int | None = None):
+        self.value = value
+        self.budget = budget
+
+    def __str__(self) -> str:
+        budget = self.budget
+        if budget is None:
+            budget = get_payload_log_budget()
+        return render_payload(self.value, budget)
+
+    __repr__ = __str__
+
+
+def log_payload(value: Any, budget: int | None = None) -> LoggedPayload:
+    """
+    Wrap `value` so that it is rendered lazily, and within budget, when
+    passed as the argument of a log record.
+    """
+    return LoggedPayload(value, budget)
+
+
+def get_payload_log_budget() -> int:
+    """
+    The maximum number of bytes a payload takes in a log record.
+    """
+    return _budget
+
+
+def set_payload_log_budget(budget: int | None) -> None:
+    """
+    Change the maximum number of bytes a payload takes in a log record. A
+    budget of `0` or lower means payloads are never truncated, `None`
+    restores the default.
+    """
+    global _budget
+    with _budget_lock:
+        if budget is None:
+            budget = DEFAULT_PAYLOAD_LOG_BUDGET
+        _budget = int(budget)
+
+
+def render_payload(value: Any, budget: int) -> str:
+    """
+    Render `value` as `str()` would, but stop once `budget` bytes, encoded
+    as UTF-8, have been written and end with a marker telling how much was
+    left out. Strings and containers are never rendered beyond that budget,
+    however large they are.
+    """
+    if budget <= 0:
+        return str(value)
+
+    out = PayloadWriter(budget)
+    try:
+        if isinstance(value, str):
+            out.write_text(value)
+        else:
+            write_value(out, value)
+    except PayloadBudgetExceeded:
+        pass
+    return out.getvalue()
+
+
+###############################################################################
+# Internals
+###############################################################################
+class PayloadBudgetExceeded(Exception):
+    pass
+
+
+class PayloadWriter:
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.size = 0
+        self.parts = []
+        self.truncated = None
+
+    def write(self, text: str) -> None:
+        # at most 4 bytes per character, only measure when it may not fit
+        if self.size + len(text) * 4 <= self.budget:
+            self.parts.append(text)
+            self.size += len(text.encode("utf-8"))
+            return
+
+        data = text.encode("utf-8")
+        room = self.budget - self.size
+        if len(data) <= room:
+            self.parts.append(text)
+            self.size += len(data)
+            return
+
+        self.parts.append(data[:room].decode("utf-8", errors="ignore"))
+        self.size = self.budget
+        self.truncated = TRUNCATION_MARKER
+        raise PayloadBudgetExceeded()
+
+    def write_text(self, text: str) -> None:
+        # never encode more of a large string than could fit
+        room = self.budget - self.size
+        if len(text) > room:
+            try:
+                self.write(text[:room])
+            except PayloadBudgetExceeded:
+                pass
+            self.truncated = f"... [truncated, {len(text)} characters]"
+            raise PayloadBudgetExceeded()
+        self.write(text)
+
+    def getvalue(self) -> str:
+        text = "".join(self.parts)
+        if self.truncated:
+            text = f"{text}{self.truncated}"
+        return text
+
+
+def write_value(
+    out: PayloadWriter, value: Any, seen: set[int] | None = None
+) -> None:
+    if isinstance(value, str | bytes | bytearray):
+        # a slice is enough to exhaust the budget, the rest of a large value
+        # is never rendered
+        room = out.budget - out.size
+        out.write(repr(value[: room + 1]))
+        return
+
+    if not isinstance(value, Mapping | list | tuple):
+        out.write(repr(value))
+        return
+
+    # the containers being rendered, a value holding one of them is
+    # rendered as `str()` does rather than recursing forever
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        out.write("{...}" if isinstance(value, Mapping) else "[...]")
+        return
+
+    seen.add(id(value))
+    try:
+        if isinstance(value, Mapping):
+            out.write("{")
+            for index, (k, v) in enumerate(value.items()):
+                if index:
+                    out.write(", ")
+                write_value(out, k, seen)
+                out.write(": ")
+                write_value(out, v, seen)
+            out.write("}")
+            return
+
+        opening, closing = ("[", "]") if isinstance(value, list) else ("(", ")")
+        out.write(opening)
+        for index, item in enumerate(value):
+            if index:
+                out.write(", ")
+            write_value(out, item, seen)
+        if isinstance(value, tuple) and len(value) == 1:
+            out.write(",")
+        out.write(closing)
+    finally:
+        seen.discard(id(value))
@@ -1,16 +1,214 @@
 import logging
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
+from http.cookiejar import DefaultCookiePolicy
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
-import requests
-import urllib3
-
-from chaoslib import substitute
+from chaoslib import substitute_with_plan
 from chaoslib.exceptions import ActivityFailed, InvalidActivity
 from chaoslib.types import Activity, Configuration, Secrets
 
-__all__ = ["run_http_activity", "validate_http_activity"]
+if TYPE_CHECKING:
+    import requests
+
+__all__ = [
+    "SessionPool",
+    "close_session_pool",
+    "configure_session_pool",
+    "get_session_pool",
+    "run_http_activity",
+    "validate_http_activity",
+]
 logger = logging.getLogger("chaostoolkit")
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+class SessionPool:
+    """
+    Keep `requests.Session` instances around so that activities calling the
+    same endpoint can reuse their connections rather than paying the TCP and
+    TLS handshakes on every call.
+
+    Sessions are keyed by scheme, host, TLS verification and retries. At most
+    `max_sessions` are kept, the least recently used one is closed when that
+    limit is reached. Sessions which have not been used for `idle_timeout`
+    seconds are closed on the next lookup. A session is never closed while
+    in use. `pool_maxsize` is the number of connections each session keeps
+    per host.
+
+    Pooled sessions never store cookies, a response setting one does not
+    change the requests made afterwards, as with a fresh session each time.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 32,
+        pool_maxsize: int = 10,
+        idle_timeout: float = 300.0,
+    ):
+        self.max_sessions = max_sessions
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(
+        self, url: str, verify_tls: bool = True, max_retries: int = 0
+    ) -> Iterator["requests.Session"]:
+        """
+        Hold a session suitable for calling `url`, creating it when none
+        exists yet, for the duration of the `with` block.
+        """
+        p = urlparse(url)
+        key = (p.scheme, p.netloc, verify_tls, max_retries)
+        entry = self._checkout(key)
+        try:
+            yield entry.session
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Close all pooled sessions. The counters are left untouched.
+        """
+        with self._lock:
+            entries = list(self._sessions.values())
+            self._sessions.clear()
+
+        for entry in entries:
+            entry.session.close()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Counters to confirm whether sessions are being reused.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "sessions": len(self._sessions),
+            }
+
+    ###########################################################################
+    # Internals
+    ###########################################################################
+    def _checkout(self, key: tuple) -> "PooledSession":
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            evicted.extend(self._evict_idle(now))
+
+            entry = self._sessions.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._sessions.move_to_end(key)
+            else:
+                self.misses += 1
+                entry = self._sessions[key] = PooledSession(
+                    self._create(key[3])
+                )
+
+            entry.in_use += 1
+            entry.last_used = now
+            evicted.extend(self._evict_least_recently_used())
+
+        for s in evicted:
+            s.close()
+        return entry
+
+    def _create(self, max_retries: int) -> "requests.Session":
+        requests = import_requests()
+        s = requests.Session()
+        s.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        a = requests.adapters.HTTPAdapter(
+            max_retries=max_retries, pool_maxsize=self.pool_maxsize
+        )
+        s.mount("http://", a)
+        s.mount("https://", a)
+        return s
+
+    def _evict_idle(self, now: float) -> list["requests.Session"]:
+        if not self.idle_timeout or self.idle_timeout <= 0:
+            return []
+
+        evicted = []
+        for key, entry in list(self._sessions.items()):
+            if not entry.in_use and now - entry.last_used >= self.idle_timeout:
+                del self._sessions[key]
+                self.evictions += 1
+                evicted.append(entry.session)
+        return evicted
+
+    def _evict_least_recently_used(self) -> list["requests.Session"]:
+        evicted = []
+        excess = len(self._sessions) - max(self.max_sessions, 1)
+        for key, entry in list(self._sessions.items()):
+            if excess <= 0:
+                break
+            if entry.in_use:
+                continue
+            del self._sessions[key]
+            self.evictions += 1
+            evicted.append(entry.session)
+            excess -= 1
+        return evicted
+
+
+class PooledSession:
+    __slots__ = ("in_use", "last_used", "session")
+
+    def __init__(self, session: "requests.Session"):
+        self.session = session
+        self.in_use = 0
+        self.last_used = 0.0
+
+
+# shared by all HTTP activities of this process
+_session_pool = SessionPool()
+
+
+def get_session_pool() -> SessionPool:
+    """
+    The process-wide pool of HTTP sessions.
+    """
+    return _session_pool
+
+
+def configure_session_pool(
+    max_sessions: int | None = None,
+    pool_maxsize: int | None = None,
+    idle_timeout: float | None = None,
+) -> None:
+    """
+    Change the limits of the session pool. New values only apply to sessions
+    created from now on, existing ones are kept until evicted or closed.
+    """
+    if max_sessions is not None:
+        _session_pool.max_sessions = int(max_sessions)
+    if pool_maxsize is not None:
+        _session_pool.pool_maxsize = int(pool_maxsize)
+    if idle_timeout is not None:
+        _session_pool.idle_timeout = float(idle_timeout)
+
+
+def close_session_pool() -> None:
+    """
+    Close all the pooled HTTP sessions and their connections.
+    """
+    logger.debug(f"Closing HTTP session pool: {_session_pool.stats()}")
+    _session_pool.close()
 
 
 def run_http_activity(
@@ -28,52 +226,58 @@ def run_http_activity(
     This should be considered as a private function.
     """
     provider = activity["provider"]
-    url = substitute(provider["url"], configuration, secrets)
+    url = substitute_with_plan(provider["url"], configuration, secrets)
     method = provider.get("method", "GET").upper()
-    headers = substitute(provider.get("headers", None), configuration, secrets)
-    timeout = substitute(provider.get("timeout", None), configuration, secrets)
+    headers = substitute_with_plan(
+        provider.get("headers", None), configuration, secrets
+    )
+    timeout = substitute_with_plan(
+        provider.get("timeout", None), configuration, secrets
+    )
     arguments = provider.get("arguments", None)
     verify_tls = provider.get("verify_tls", True)
     max_retries = provider.get("max_retries", 0)
 
     if arguments and (configuration or secrets):
-        arguments = substitute(arguments, configuration, secrets)
+        arguments = substitute_with_plan(arguments, configuration, secrets)
 
     if isinstance(timeout, list):
         timeout = tuple(timeout)
 
+    requests = import_requests()
+
     try:
-        s = requests.Session()
-        a = requests.adapters.HTTPAdapter(max_retries=max_retries)
-        s.mount("http://", a)
-        s.mount("https://", a)
-        if method == "GET":
-            r = s.get(
-                url,
-                params=arguments,
-                headers=headers,
-                timeout=timeout,
-                verify=verify_tls,
-            )
-        else:
-            if headers and headers.get("Content-Type") == "application/json":
-                r = s.request(
-                    method,
+        with _session_pool.session(url, verify_tls, max_retries) as s:
+            if method == "GET":
+                r = s.get(
                     url,
-                    json=arguments,
+                    params=arguments,
                     headers=headers,
                     timeout=timeout,
                     verify=verify_tls,
                 )
             else:
-                r = s.request(
-                    method,
-                    url,
-                    data=arguments,
-                    headers=headers,
-                    timeout=timeout,
-                    verify=verify_tls,
-                )
+                if (
+                    headers
+                    and headers.get("Content-Type") == "application/json"
+                ):
+                    r = s.request(
+                        method,
+                        url,
+                        json=arguments,
+                        headers=headers,
+                        timeout=timeout,
+                        verify=verify_tls,
+                    )
+                else:
+                    r = s.request(
+                        method,
+                        url,
+                        data=arguments,
+                        headers=headers,
+                        timeout=timeout,
+                        verify=verify_tls,
+                    )
 
         body = None
         if r.headers.get("Content-Type") == "application/json":
@@ -128,3 +332,17 @@ def validate_http_activity(activity: Activity):
     headers = provider.get("headers")
     if headers and not isinstance(headers, dict):
         raise InvalidActivity("a HTTP activities expect headers as a mapping")
+
+
+###############################################################################
+# Internals
+###############################################################################
+@cache
+def import_requests() -> ModuleType:
+    # requests and urllib3 take a while to import, they are only paid for by
+    # processes actually making HTTP calls
+    import requests
+    import urllib3
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return requests
@@ -4,15 +4,60 @@ import os
 import os.path
 import shutil
 import subprocess
-from typing import Any
+import tempfile
+import threading
+import time
+from typing import IO, Any
 
-from chaoslib import decode_bytes, substitute
+from chaoslib import decode_bytes, substitute_with_plan
 from chaoslib.exceptions import ActivityFailed, InvalidActivity
+from chaoslib.payload import log_payload
 from chaoslib.types import Activity, Configuration, Secrets
 
-__all__ = ["run_process_activity", "validate_process_activity"]
+__all__ = [
+    "OutputCapture",
+    "clear_executable_cache",
+    "resolve_executable",
+    "run_process_activity",
+    "validate_process_activity",
+]
 logger = logging.getLogger("chaostoolkit")
 
+READ_CHUNK_SIZE = 64 * 1024
+# how long the output is still read once the process has exited or was killed
+READER_GRACE_PERIOD = 2.0
+# the limits of the "capture" entry, overall or of a single stream
+CAPTURE_KEYS = frozenset(("max_bytes", "spill"))
+_executables = {}
+_executables_lock = threading.Lock()
+
+
+def resolve_executable(path: str) -> str | None:
+    """
+    Same as `shutil.which` but remembering the executables found for a
+    given `PATH`, so that looking up the same command again is cheap.
+    Commands which are not found are looked up again every time.
+    """
+    key = (path, os.environ.get("PATH"))
+    with _executables_lock:
+        resolved = _executables.get(key)
+    if resolved:
+        return resolved
+
+    resolved = shutil.which(path)
+    if resolved:
+        with _executables_lock:
+            _executables[key] = resolved
+    return resolved
+
+
+def clear_executable_cache() -> None:
+    """
+    Forget the executables found by :func:`resolve_executable`.
+    """
+    with _executables_lock:
+        _executables.clear()
+
 
 def run_process_activity(
     activity: Activity, configuration: Configuration, secrets: Secrets
@@ -27,6 +72,9 @@ def run_process_activity(
     timeout defined in the activity. There is no timeout by default so be
     careful when you do not explicitly provide one.
 
+    The whole output is kept in memory unless the provider declares a
+    `"capture"` mapping, see :func:`run_with_bounded_capture`.
+
     This should be considered as a private function.
     """
     provider = activity["provider"]
@@ -34,10 +82,10 @@ def run_process_activity(
     arguments = provider.get("arguments", [])
 
     if arguments and (configuration or secrets):
-        arguments = substitute(arguments, configuration, secrets)
+        arguments = substitute_with_plan(arguments, configuration, secrets)
 
     shell = False
-    path = shutil.which(os.path.expanduser(provider["path"]))
+    path = resolve_executable(os.path.expanduser(provider["path"]))
     if isinstance(arguments, str):
         shell = True
         arguments = f"{path} {arguments}"
@@ -48,8 +96,14 @@ def run_process_activity(
         arguments = [str(p) for p in arguments if p not in (None, "")]
         arguments.insert(0, path)
 
+    capture = provider.get("capture")
+    if capture:
+        return run_with_bounded_capture(
+            activity, arguments, timeout, shell, capture
+        )
+
     try:
-        logger.debug(f"Running: {arguments!s}")
+        logger.debug("Running: %s", log_payload(arguments))
         proc = subprocess.run(
             arguments,
             timeout=timeout,
@@ -61,22 +115,307 @@ def run_process_activity(
     except subprocess.TimeoutExpired:
         raise ActivityFailed("process activity took too long to complete")
 
+    warn_on_non_zero_exit(activity, proc.returncode)
+
+    stdout = decode_bytes(
+        proc.stdout, cache_key=encoding_cache_key(activity, "stdout")
+    )
+    stderr = decode_bytes(
+        proc.stderr, cache_key=encoding_cache_key(activity, "stderr")
+    )
+
+    return {"status": proc.returncode, "stdout": stdout, "stderr": stderr}
+
+
+def run_with_bounded_capture(
+    activity: Activity,
+    arguments: list[str] | str,
+    timeout: float | None,
+    shell: bool,
+    capture: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Run the process while keeping only the head and tail of its stdout and
+    stderr in memory, as configured by the `"capture"` entry of the provider.
+
+    The result has the same `"status"`, `"stdout"` and `"stderr"` keys as
+    when the output is fully captured, and for each stream, a
+    `"<stream>_truncated"` flag and a `"<stream>_file"` path to the complete
+    output when it was truncated and spilled to disk.
+
+    This should be considered as a private function.
+    """
+    captures = {
+        "stdout": OutputCapture(**get_stream_capture(capture, "stdout")),
+        "stderr": OutputCapture(**get_stream_capture(capture, "stderr")),
+    }
+
+    try:
+        logger.debug("Running: %s", log_payload(arguments))
+        proc = subprocess.Popen(
+            arguments,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=os.environ,
+            shell=shell,
+        )
+    except Exception:
+        for c in captures.values():
+            c.discard()
+        raise
+
+    readers = [
+        threading.Thread(
+            target=pump_stream,
+            args=(proc.stdout, captures["stdout"]),
+            daemon=True,
+        ),
+        threading.Thread(
+            target=pump_stream,
+            args=(proc.stderr, captures["stderr"]),
+            daemon=True,
+        ),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        kill_and_discard(proc, readers, captures)
+        raise ActivityFailed("process activity took too long to complete")
+    except BaseException:
+        # interrupted, for instance by an exit signal, as subprocess.run does
+        kill_and_discard(proc, readers, captures)
+        raise
+
+    join_readers(proc, readers, captures)
+
+    warn_on_non_zero_exit(activity, proc.returncode)
+
+    result = {"status": proc.returncode}
+    for name, c in captures.items():
+        c.close()
+        result[name] = c.text(cache_key=encoding_cache_key(activity, name))
+        result[f"{name}_truncated"] = c.truncated
+        result[f"{name}_file"] = c.spill_path
+
+    return result
+
+
+def encoding_cache_key(activity: Activity, stream: str) -> tuple:
+    # the same process activity tends to always output the same encoding
+    provider = activity["provider"]
+    return (activity.get("name"), provider.get("path"), stream)
+
+
+def warn_on_non_zero_exit(activity: Activity, returncode: int) -> None:
     # kind warning to the user that this process returned a non--zero
     # exit code, as traditionally used to indicate a failure,
     # but not during the hypothesis check because that could also be
     # exactly what the user want. This warning is helpful during the
     # method and rollbacks
-    if "tolerance" not in activity and proc.returncode > 0:
+    if "tolerance" not in activity and returncode > 0:
         logger.warning(
             "This process returned a non-zero exit code. "
             "This may indicate some error and not what you expected. "
             "Please have a look at the logs."
         )
 
-    stdout = decode_bytes(proc.stdout)
-    stderr = decode_bytes(proc.stderr)
 
-    return {"status": proc.returncode, "stdout": stdout, "stderr": stderr}
+def get_stream_capture(capture: dict[str, Any], stream: str) -> dict[str, Any]:
+    """
+    Return the capture limits of the given stream. Limits set directly on
+    the `"capture"` entry apply to both streams and can be overridden per
+    stream with a `"stdout"` or `"stderr"` entry.
+    """
+    limits = {
+        "max_bytes": capture.get("max_bytes", 1024 * 1024),
+        "spill": capture.get("spill", False),
+    }
+    limits.update(capture.get(stream) or {})
+    return limits
+
+
+def kill_and_discard(
+    proc: subprocess.Popen,
+    readers: list[threading.Thread],
+    captures: dict[str, "OutputCapture"],
+) -> None:
+    """
+    Kill the process, reap it and drop whatever output was captured so far.
+    """
+    proc.kill()
+    proc.wait()
+    join_readers(proc, readers, captures)
+    for c in captures.values():
+        c.discard()
+
+
+def join_readers(
+    proc: subprocess.Popen,
+    readers: list[threading.Thread],
+    captures: dict[str, "OutputCapture"],
+) -> None:
+    """
+    Wait for the output of the exited process to be read. A child it started
+    in the background may still hold its pipes open, in which case the rest
+    of the output is abandoned, and the capture marked as truncated, rather
+    than waiting for that child to exit.
+    """
+    deadline = time.monotonic() + READER_GRACE_PERIOD
+    for reader in readers:
+        reader.join(max(0.0, deadline - time.monotonic()))
+
+    streams = ((proc.stdout, "stdout"), (proc.stderr, "stderr"))
+    for reader, (stream, name) in zip(readers, streams, strict=True):
+        if reader.is_alive():
+            logger.debug(
+                "The %s of the process is still open, likely by one of its "
+                "children, it will not be read any further",
+                name,
+            )
+            captures[name].abandon()
+            # closing the buffered stream would wait for the pending read
+            stream.raw.close()
+
+
+def pump_stream(stream: IO[bytes], capture: "OutputCapture") -> None:
+    try:
+        for chunk in iter(lambda: stream.read1(READ_CHUNK_SIZE), b""):
+            capture.feed(chunk)
+    except (OSError, ValueError):
+        # the stream is closed under our feet once abandoned
+        if not capture.abandoned:
+            raise
+    finally:
+        stream.close()
+
+
+class OutputCapture:
+    """
+    Capture of a process stream holding at most `max_bytes` in memory: the
+    first half of that budget keeps the head of the output and the second
+    half a rolling window over its tail.
+
+    When `spill` is set, the complete output is also written to a temporary
+    file as it is read. That file is kept only when the output did not fit
+    in memory and its path is then available as `spill_path`. It is up to
+    the caller to delete it.
+
+    Bytes are decoded only when :meth:`text` is called, and only those held
+    in memory.
+
+    Once abandoned, further output is ignored and the capture is considered
+    truncated.
+    """
+
+    def __init__(self, max_bytes: int = 1024 * 1024, spill: bool = False):
+        self.head_size = max_bytes // 2
+        self.tail_size = max_bytes - self.head_size
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.total = 0
+        self.abandoned = False
+        self.spill_path = None
+        self._spill_file = None
+        self._lock = threading.Lock()
+        if spill:
+            # kept open until the process has completed
+            self._spill_file = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                prefix="chaostoolkit-", suffix=".out", delete=False
+            )
+            self.spill_path = self._spill_file.name
+
+    @property
+    def truncated(self) -> bool:
+        return self.abandoned or self.total > len(self.head) + len(self.tail)
+
+    def feed(self, chunk: bytes) -> None:
+        with self._lock:
+            if self.abandoned:
+                return
+
+            self.total += len(chunk)
+            if self._spill_file:
+                self._spill_file.write(chunk)
+
+            room = self.head_size - len(self.head)
+            if room > 0:
+                self.head += chunk[:room]
+                chunk = chunk[room:]
+
+            if chunk and self.tail_size:
+                self.tail += chunk[-self.tail_size :]
+                overflow = len(self.tail) - self.tail_size
+                if overflow > 0:
+                    del self.tail[:overflow]
+
+    def abandon(self) -> None:
+        """
+        Stop capturing, whatever is read from now on is ignored.
+        """
+        with self._lock:
+            self.abandoned = True
+
+    def close(self) -> None:
+        """
+        Close the spill file, and remove it when the whole output is
+        already held in memory.
+        """
+        with self._lock:
+            spill_file, self._spill_file = self._spill_file, None
+        if spill_file:
+            spill_file.close()
+            if not self.truncated:
+                self.discard()
+
+    def discard(self) -> None:
+        """
+        Close and remove the spill file, if any.
+        """
+        with self._lock:
+            spill_file, self._spill_file = self._spill_file, None
+        if spill_file:
+            spill_file.close()
+        if self.spill_path:
+            try:
+                os.remove(self.spill_path)
+            except OSError:
+                pass
+            self.spill_path = None
+
+    def text(self, cache_key: Any = None) -> str:
+        """
+        Decode the captured output. When it was truncated, the head and tail
+        are joined by a marker telling how many bytes were left out.
+        """
+        if not self.truncated:
+            return decode_bytes(
+                bytes(self.head + self.tail), cache_key=cache_key
+            )
+
+        skipped = self.total - len(self.head) - len(self.tail)
+        if skipped:
+            text = (
+                decode_partial_bytes(bytes(self.head))
+                + f"\n[... {skipped} bytes truncated ...]\n"
+                + decode_partial_bytes(bytes(self.tail))
+            )
+        else:
+            text = decode_partial_bytes(bytes(self.head + self.tail))
+        if self.abandoned:
+            text += "\n[... output still open when the process exited ...]\n"
+        return text
+
+
+def decode_partial_bytes(data: bytes) -> str:
+    # head and tail may be cut in the middle of a multi-byte character, do
+    # not let that decide of the encoding cached for the activity
+    try:
+        return decode_bytes(data)
+    except ActivityFailed:
+        return data.decode("utf-8", errors="replace")
 
 
 def validate_process_activity(activity: Activity):
@@ -88,6 +427,10 @@ def validate_process_activity(activity: Activity):
     * a `"path"` key which is an absolute path to an executable the current
       user can call
 
+    It may also declare a `"capture"` mapping bounding how much of the
+    output is kept in memory, with a `"max_bytes"` integer and a `"spill"`
+    flag, optionally overridden in `"stdout"` or `"stderr"` mappings.
+
     In all failing cases, raises :exc:`InvalidActivity`.
 
     This should be considered as a private function.
@@ -99,7 +442,7 @@ def validate_process_activity(activity: Activity):
     if not path:
         raise InvalidActivity("a process activity must have a path")
 
-    path = shutil.which(path)
+    path = resolve_executable(path)
     if not path:
         raise InvalidActivity(
             f"path '{raw_path}' cannot be found, in activity '{name}'"
@@ -109,3 +452,46 @@ def validate_process_activity(activity: Activity):
         raise InvalidActivity(
             f"no access permission to '{raw_path}', in activity '{name}'"
         )
+
+    capture = provider.get("capture")
+    if capture is not None:
+        validate_capture(name, capture)
+
+
+def validate_capture(name: str, capture: Any) -> None:
+    if not isinstance(capture, dict):
+        raise InvalidActivity(
+            f"the process capture must be a mapping, in activity '{name}'"
+        )
+
+    for limits, allowed in (
+        (capture, CAPTURE_KEYS | {"stdout", "stderr"}),
+        (capture.get("stdout"), CAPTURE_KEYS),
+        (capture.get("stderr"), CAPTURE_KEYS),
+    ):
+        if limits is None:
+            continue
+
+        if not isinstance(limits, dict):
+            raise InvalidActivity(
+                f"the process capture of a stream must be a mapping, "
+                f"in activity '{name}'"
+            )
+
+        unknown = sorted(set(limits) - allowed)
+        if unknown:
+            raise InvalidActivity(
+                f"unknown process capture key(s) {', '.join(unknown)}, "
+                f"in activity '{name}'"
+            )
+
+        max_bytes = limits.get("max_bytes")
+        if max_bytes is not None and (
+            not isinstance(max_bytes, int)
+            or isinstance(max_bytes, bool)
+            or max_bytes <= 0
+        ):
+            raise InvalidActivity(
+                f"the process capture 'max_bytes' must be a positive integer, "
+                f"in activity '{name}'"
+            )
@@ -2,17 +2,106 @@ import importlib
 import inspect
 import logging
 import sys
+import threading
 import traceback
+from collections.abc import Callable
 from typing import Any
 
-from chaoslib import substitute
+from chaoslib import substitute_with_plan
 from chaoslib.exceptions import ActivityFailed, InvalidActivity
 from chaoslib.types import Activity, Configuration, Secrets
 
-__all__ = ["run_python_activity", "validate_python_activity"]
+__all__ = [
+    "ResolvedCallable",
+    "clear_callable_cache",
+    "resolve_callable",
+    "run_python_activity",
+    "validate_python_activity",
+]
 logger = logging.getLogger("chaostoolkit")
 
 
+class ResolvedCallable:
+    """
+    A Python activity function that has been imported and inspected once
+    so that running it again does not pay for it.
+
+    `signature` is `None` when the callable cannot be introspected, as with
+    some builtins and C extension functions.
+    """
+
+    __slots__ = (
+        "accepts_configuration",
+        "accepts_secrets",
+        "filename",
+        "func",
+        "is_function",
+        "signature",
+    )
+
+    def __init__(self, func: Callable):
+        self.func = func
+        self.is_function = inspect.isfunction(func) or inspect.isbuiltin(func)
+        self.signature = None
+        if callable(func):
+            try:
+                self.signature = inspect.signature(func)
+            except (TypeError, ValueError):
+                pass
+        parameters = self.signature.parameters if self.signature else {}
+        self.accepts_configuration = "configuration" in parameters
+        self.accepts_secrets = "secrets" in parameters
+        try:
+            self.filename = inspect.getfile(func)
+        except TypeError:
+            self.filename = None
+
+
+_callables = {}
+_callables_lock = threading.Lock()
+
+
+def resolve_callable(mod_path: str, func_name: str) -> ResolvedCallable:
+    """
+    Import `func_name` from the `mod_path` module and inspect it. The result
+    is cached by `(mod_path, func_name)` and shared between the validation
+    and the execution of activities.
+
+    Raises :exc:`ImportError` when the module cannot be imported and
+    :exc:`AttributeError` when it does not expose `func_name`.
+    """
+    key = (mod_path, func_name)
+    resolved = _callables.get(key)
+    if resolved is not None:
+        return resolved
+
+    mod = importlib.import_module(mod_path)
+    resolved = ResolvedCallable(getattr(mod, func_name))
+    with _callables_lock:
+        return _callables.setdefault(key, resolved)
+
+
+def clear_callable_cache(
+    mod_path: str | None = None, func_name: str | None = None
+):
+    """
+    Forget resolved callables so they get imported and inspected again on
+    their next use. This is useful to long-lived processes when modules get
+    reloaded.
+
+    Without arguments, the whole cache is cleared. Otherwise only entries of
+    the `mod_path` module, or only its `func_name` function, are dropped.
+    """
+    with _callables_lock:
+        if mod_path is None:
+            _callables.clear()
+            return
+
+        for key in list(_callables):
+            if key[0] == mod_path and func_name in (None, key[1]):
+                del _callables[key]
+
+
 def run_python_activity(
     activity: Activity, configuration: Configuration, secrets: Secrets
 ) -> Any:
@@ -27,29 +116,28 @@ def run_python_activity(
     provider = activity["provider"]
     mod_path = provider["module"]
     func_name = provider["func"]
-    mod = importlib.import_module(mod_path)
-    func = getattr(mod, func_name)
-    try:
+    resolved = resolve_callable(mod_path, func_name)
+    func = resolved.func
+    if resolved.filename:
         logger.debug(
             "Activity '{}' loaded from '{}'".format(
-                activity.get("name"), inspect.getfile(func)
+                activity.get("name"), resolved.filename
             )
         )
-    except TypeError:
-        pass
 
-    arguments = provider.get("arguments", {}).copy()
+    arguments = provider.get("arguments", {})
 
     if configuration or secrets:
-        arguments = substitute(arguments, configuration, secrets)
+        arguments = substitute_with_plan(arguments, configuration, secrets)
+    else:
+        arguments = arguments.copy()
 
-    sig = inspect.signature(func)
-    if "secrets" in provider and "secrets" in sig.parameters:
+    if "secrets" in provider and resolved.accepts_secrets:
         arguments["secrets"] = {}
         for s in provider["secrets"]:
             arguments["secrets"].update(secrets.get(s, {}).copy())
 
-    if "configuration" in sig.parameters:
+    if resolved.accepts_configuration:
         arguments["configuration"] = configuration.copy()
 
     try:
@@ -87,60 +175,60 @@ def validate_python_activity(activity: Activity):
         raise InvalidActivity("a Python activity must have a function name")
 
     try:
-        mod = importlib.import_module(mod_name)
+        resolved = resolve_callable(mod_name, func)
     except ImportError:
         raise InvalidActivity(
             f"could not find Python module '{mod_name}' "
             f"in activity '{activity_name}'"
         )
+    except AttributeError:
+        resolved = None
 
-    found_func = False
-    arguments = provider.get("arguments", {})
-    candidates = set(inspect.getmembers(mod, inspect.isfunction)).union(
-        inspect.getmembers(mod, inspect.isbuiltin)
-    )
-    for name, cb in candidates:
-        if name == func:
-            found_func = True
+    found_func = resolved is not None and resolved.is_function
+    if found_func and resolved.signature is None:
+        raise InvalidActivity(
+            f"could not inspect the signature of function '{func}' "
+            f"in activity '{activity_name}'"
+        )
 
-            # let's try to bind the activity's arguments with the function
-            # signature see if they match
-            sig = inspect.signature(cb)
-            try:
-                # config and secrets are provided through specific parameters
-                # to an activity that needs them. However, they are declared
-                # out of band of the `arguments` mapping. Here, we simply
-                # ensure the signature of the activity is valid by injecting
-                # fake `configuration` and `secrets` arguments into the mapping
-                args = arguments.copy()
-
-                if "secrets" in sig.parameters:
-                    args["secrets"] = None
-
-                if "configuration" in sig.parameters:
-                    args["configuration"] = None
-
-                sig.bind(**args)
-            except TypeError as x:
-                # I dislike this sort of lookup but not sure we can
-                # differentiate them otherwise
-                msg = str(x)
-                if "missing" in msg:
-                    arg = msg.rsplit(":", 1)[1].strip()
-                    raise InvalidActivity(
-                        f"required argument {arg} is missing from "
-                        f"activity '{name}'"
-                    )
-                elif "unexpected" in msg:
-                    arg = msg.rsplit(" ", 1)[1].strip()
-                    raise InvalidActivity(
-                        f"argument {arg} is not part of the "
-                        f"function signature in activity '{name}'"
-                    )
-                else:
-                    # another error? let's fail fast
-                    raise
-            break
+    if found_func:
+        # let's try to bind the activity's arguments with the function
+        # signature see if they match
+        sig = resolved.signature
+        arguments = provider.get("arguments", {})
+        try:
+            # config and secrets are provided through specific parameters
+            # to an activity that needs them. However, they are declared
+            # out of band of the `arguments` mapping. Here, we simply
+            # ensure the signature of the activity is valid by injecting
+            # fake `configuration` and `secrets` arguments into the mapping
+            args = arguments.copy()
+
+            if resolved.accepts_secrets:
+                args["secrets"] = None
+
+            if resolved.accepts_configuration:
+                args["configuration"] = None
+
+            sig.bind(**args)
+        except TypeError as x:
+            # I dislike this sort of lookup but not sure we can
+            # differentiate them otherwise
+            msg = str(x)
+            if "missing" in msg:
+                arg = msg.rsplit(":", 1)[1].strip()
+                raise InvalidActivity(
+                    f"required argument {arg} is missing from activity '{func}'"
+                )
+            elif "unexpected" in msg:
+                arg = msg.rsplit(" ", 1)[1].strip()
+                raise InvalidActivity(
+                    f"argument {arg} is not part of the "
+                    f"function signature in activity '{func}'"
+                )
+            else:
+                # another error? let's fail fast
+                raise
 
     if not found_func:
         raise InvalidActivity(
@@ -1,5 +1,10 @@
+import contextvars
+import json
 import logging
+import math
 from abc import ABCMeta
+from collections import deque
+from collections.abc import Callable
 from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
 
 try:
@@ -15,17 +20,34 @@ from datetime import UTC, datetime
 from types import TracebackType
 from typing import Any, Self
 
-from chaoslib import __version__, substitute
-from chaoslib.activity import run_activities
+from chaoslib import (
+    ContextThreadPoolExecutor,
+    PayloadEncoder,
+    SubstitutionPlanCache,
+    __version__,
+    run_substitution_plans,
+    substitute,
+    use_substitution_plans,
+)
+from chaoslib.activity import (
+    has_activity_dependencies,
+    run_activities,
+    run_activities_graph,
+)
 from chaoslib.configuration import (
+    DYNAMIC_CONFIGURATION_WORKERS,
     load_configuration,
     load_dynamic_configuration,
 )
 from chaoslib.control import (
     Control,
+    build_control_dispatch_table,
     cleanup_controls,
     cleanup_global_controls,
+    clear_control_dispatch_table,
     controls,
+    get_global_controls,
+    global_controls,
     initialize_controls,
     initialize_global_controls,
 )
@@ -36,9 +58,10 @@ from chaoslib.exceptions import (
 )
 from chaoslib.exit import exit_signals
 from chaoslib.hypothesis import run_steady_state_hypothesis
+from chaoslib.provider.http import close_session_pool, configure_session_pool
 from chaoslib.rollback import run_rollbacks
 from chaoslib.secret import load_secrets
-from chaoslib.settings import get_loaded_settings
+from chaoslib.settings import get_loaded_settings, loaded_settings
 from chaoslib.types import (
     Activity,
     Configuration,
@@ -52,9 +75,16 @@ from chaoslib.types import (
     Strategy,
 )
 
-__all__ = ["RunEventHandler", "Runner"]
+__all__ = [
+    "AsyncEventHandlerRegistry",
+    "EventHandlerRegistry",
+    "RunEventHandler",
+    "Runner",
+]
 
 logger = logging.getLogger("chaostoolkit")
+_active_runs = 0
+_active_runs_lock = threading.Lock()
 
 
 class RunEventHandler(metaclass=ABCMeta):
@@ -155,13 +185,7 @@ class EventHandlerRegistry:
         self.handlers.append(handler)
 
     def started(self, experiment: Experiment, journal: Journal) -> None:
-        for h in self.handlers:
-            try:
-                h.started(experiment, journal)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("started", experiment, journal)
 
     def running(
         self,
@@ -172,67 +196,32 @@ class EventHandlerRegistry:
         schedule: Schedule,
         settings: Settings,
     ) -> None:
-        for h in self.handlers:
-            try:
-                h.running(
-                    experiment,
-                    journal,
-                    configuration,
-                    secrets,
-                    schedule,
-                    settings,
-                )
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch(
+            "running",
+            experiment,
+            journal,
+            configuration,
+            secrets,
+            schedule,
+            settings,
+        )
 
     def finish(self, journal: Journal) -> None:
-        for h in self.handlers:
-            try:
-                h.finish(journal)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("finish", journal)
 
     def interrupted(self, experiment: Experiment, journal: Journal) -> None:
-        for h in self.handlers:
-            try:
-                h.interrupted(experiment, journal)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("interrupted", experiment, journal)
 
     def signal_exit(self) -> None:
-        for h in self.handlers:
-            try:
-                h.signal_exit()
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("signal_exit")
 
     def start_continuous_hypothesis(self, frequency: int) -> None:
-        for h in self.handlers:
-            try:
-                h.start_continuous_hypothesis(frequency)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("start_continuous_hypothesis", frequency)
 
     def continuous_hypothesis_iteration(
         self, iteration_index: int, state: Any
     ) -> None:
-        for h in self.handlers:
-            try:
-                h.continuous_hypothesis_iteration(iteration_index, state)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("continuous_hypothesis_iteration", iteration_index, state)
 
     def continuous_hypothesis_completed(
         self,
@@ -240,131 +229,282 @@ class EventHandlerRegistry:
         journal: Journal,
         exception: Exception | None = None,
     ) -> None:
-        for h in self.handlers:
-            try:
-                h.continuous_hypothesis_completed(
-                    experiment, journal, exception
-                )
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch(
+            "continuous_hypothesis_completed", experiment, journal, exception
+        )
 
     def start_hypothesis_before(self, experiment: Experiment) -> None:
-        for h in self.handlers:
-            try:
-                h.start_hypothesis_before(experiment)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("start_hypothesis_before", experiment)
 
     def hypothesis_before_completed(
         self, experiment: Experiment, state: dict[str, Any], journal: Journal
     ) -> None:
-        for h in self.handlers:
-            try:
-                h.hypothesis_before_completed(experiment, state, journal)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("hypothesis_before_completed", experiment, state, journal)
 
     def start_hypothesis_after(self, experiment: Experiment) -> None:
-        for h in self.handlers:
-            try:
-                h.start_hypothesis_after(experiment)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("start_hypothesis_after", experiment)
 
     def hypothesis_after_completed(
         self, experiment: Experiment, state: dict[str, Any], journal: Journal
     ) -> None:
-        for h in self.handlers:
-            try:
-                h.hypothesis_after_completed(experiment, state, journal)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("hypothesis_after_completed", experiment, state, journal)
 
     def start_method(self, experiment: Experiment) -> None:
-        for h in self.handlers:
-            try:
-                h.start_method(experiment)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("start_method", experiment)
 
     def method_completed(
         self, experiment: Experiment, state: Any = None
     ) -> None:
-        for h in self.handlers:
-            try:
-                h.method_completed(experiment, state)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("method_completed", experiment, state)
 
     def start_rollbacks(self, experiment: Experiment) -> None:
-        for h in self.handlers:
-            try:
-                h.start_rollbacks(experiment)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("start_rollbacks", experiment)
 
     def rollbacks_completed(
         self, experiment: Experiment, journal: Journal
     ) -> None:
-        for h in self.handlers:
-            try:
-                h.rollbacks_completed(experiment, journal)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("rollbacks_completed", experiment, journal)
 
     def start_cooldown(self, duration: int) -> None:
-        for h in self.handlers:
-            try:
-                h.start_cooldown(duration)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("start_cooldown", duration)
 
     def cooldown_completed(self) -> None:
-        for h in self.handlers:
-            try:
-                h.cooldown_completed()
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("cooldown_completed")
 
     def start_activity(self, activity: Activity) -> None:
-        for h in self.handlers:
-            try:
-                h.start_activity(activity)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
-                )
+        self.dispatch("start_activity", activity)
 
     def activity_completed(self, activity: Activity, run: Run) -> None:
+        self.dispatch("activity_completed", activity, run)
+
+    def dispatch(self, event: str, *args: Any) -> None:
+        """
+        Call the method named after the event on each handler, in the order
+        they were registered. A failing handler does not prevent the others
+        from being called.
+        """
         for h in self.handlers:
-            try:
-                h.activity_completed(activity, run)
-            except Exception:
-                logger.debug(
-                    f"Handler {h.__class__.__name__} failed", exc_info=True
+            self.call_handler(h, event, args)
+
+    def call_handler(
+        self, handler: RunEventHandler, event: str, args: tuple
+    ) -> bool:
+        try:
+            getattr(handler, event)(*args)
+            return True
+        except Exception:
+            logger.debug(
+                f"Handler {handler.__class__.__name__} failed", exc_info=True
+            )
+            return False
+
+
+class AsyncEventHandlerRegistry(EventHandlerRegistry):
+    """
+    Registry handing events over to a bounded queue, drained by a dedicated
+    thread which calls the handlers. A slow handler therefore does not
+    delay the activity, or the run, which triggered the event.
+
+    Handlers are still called one event at a time, in the order the events
+    were emitted, but no longer on the thread that emitted them. They
+    receive the objects as they are when the handler gets called, not when
+    the event was emitted, as the run keeps going in the meantime.
+
+    When the queue is full, the `overflow` policy applies:
+
+    * `"block"`: wait for the queue to make room for the event
+    * `"drop-oldest"`: discard the oldest pending event
+    * `"coalesce"`: replace a pending event of the same kind, when it is
+      one of `COALESCABLE_EVENTS`, by the new one. Otherwise, block.
+
+    Events dispatched by a handler, from the draining thread, are handled
+    right away rather than queued, as that thread could not make room for
+    them.
+
+    The `finish` event flushes the queue and stops the thread, waiting at
+    most `CLOSE_TIMEOUT` seconds. The time spent in each handler is
+    available from :meth:`stats`.
+    """
+
+    CLOSE_TIMEOUT = 30.0
+    COALESCABLE_EVENTS = ("continuous_hypothesis_iteration",)
+    OVERFLOW_POLICIES = ("block", "drop-oldest", "coalesce")
+
+    def __init__(self, queue_size: int = 1024, overflow: str = "block"):
+        super().__init__()
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(
+                f"unknown event overflow policy '{overflow}', must be one "
+                f"of {', '.join(self.OVERFLOW_POLICIES)}"
+            )
+
+        self.queue_size = max(queue_size, 1)
+        self.overflow = overflow
+        self.dropped = 0
+        self.coalesced = 0
+        self.metrics = {}
+        self._queue = deque()
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closing = None
+        self._local = threading.local()
+
+    def finish(self, journal: Journal) -> None:
+        self.dispatch("finish", journal)
+        self.close()
+        logger.debug(f"Event handlers stats: {self.stats()}")
+
+    def dispatch(self, event: str, *args: Any) -> None:
+        if not self.handlers:
+            return
+
+        if getattr(self._local, "draining", False):
+            # waiting for room in the queue would never end, only this thread
+            # empties it
+            self._handle(event, args)
+            return
+
+        with self._cond:
+            if self._thread is None:
+                self._closing = threading.Event()
+                self._thread = threading.Thread(
+                    target=contextvars.copy_context().run,
+                    args=(self._drain, self._closing),
+                    name="chaostoolkit-events",
+                    daemon=True,
                 )
+                self._thread.start()
+
+            while len(self._queue) >= self.queue_size:
+                if self.overflow == "drop-oldest":
+                    dropped, _ = self._queue.popleft()
+                    self._pending -= 1
+                    self.dropped += 1
+                    logger.debug(f"Event queue full, dropped '{dropped}'")
+                    continue
+
+                if (
+                    self.overflow == "coalesce"
+                    and event in self.COALESCABLE_EVENTS
+                    and self._coalesce(event)
+                ):
+                    continue
+
+                self._cond.wait()
+
+            self._queue.append((event, args))
+            self._pending += 1
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all pending events were handed to the handlers. Returns
+        `False` when the timeout expired first.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: float | None = CLOSE_TIMEOUT) -> None:
+        """
+        Flush the pending events and stop the thread draining them, waiting
+        at most `timeout` seconds. Events dispatched afterwards start a new
+        thread.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.flush(timeout)
+        with self._cond:
+            thread = self._thread
+            self._thread = None
+            if thread is not None:
+                # a flag rather than an item of the queue, which the
+                # overflow policies could discard
+                self._closing.set()
+                self._closing = None
+                self._cond.notify_all()
+
+        if thread is None or thread is threading.current_thread():
+            return
+
+        remaining = None
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0)
+        thread.join(remaining)
+        if thread.is_alive():
+            logger.warning(
+                "Event handlers did not complete in time, "
+                f"{self.stats()['pending']} events left pending"
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Counters of the queue and, per handler class, the number of calls,
+        failures and the total, mean and max time spent in the handler.
+        """
+        with self._cond:
+            handlers = {}
+            for name, m in self.metrics.items():
+                handlers[name] = dict(m)
+                handlers[name]["mean"] = m["total"] / m["calls"]
+
+            return {
+                "pending": self._pending,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+                "handlers": handlers,
+            }
+
+    def _coalesce(self, event: str) -> bool:
+        for index in range(len(self._queue) - 1, -1, -1):
+            if self._queue[index][0] == event:
+                del self._queue[index]
+                self._pending -= 1
+                self.coalesced += 1
+                return True
+        return False
+
+    def _drain(self, closing: threading.Event) -> None:
+        self._local.draining = True
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or closing.is_set())
+                if not self._queue:
+                    return
+                event, args = self._queue.popleft()
+                # a slot is free for the producers waiting for one
+                self._cond.notify_all()
+
+            try:
+                self._handle(event, args)
+            finally:
+                with self._cond:
+                    self._pending -= 1
+                    self._cond.notify_all()
+
+    def _handle(self, event: str, args: tuple[Any, ...]) -> None:
+        for h in self.handlers:
+            started = time.perf_counter()
+            succeeded = self.call_handler(h, event, args)
+            self._record(h, time.perf_counter() - started, succeeded)
+
+    def _record(
+        self, handler: RunEventHandler, elapsed: float, succeeded: bool
+    ) -> None:
+        name = handler.__class__.__name__
+        with self._cond:
+            m = self.metrics.get(name)
+            if m is None:
+                m = self.metrics[name] = {
+                    "calls": 0,
+                    "failures": 0,
+                    "total": 0.0,
+                    "max": 0.0,
+                }
+            m["calls"] += 1
+            m["total"] += elapsed
+            m["max"] = max(m["max"], elapsed)
+            if not succeeded:
+                m["failures"] += 1
 
 
 class Runner:
@@ -403,7 +543,35 @@ class Runner:
         self.secrets = load_secrets(
             experiment.get("secrets", {}), self.config, secret_vars
         )
-        self.config = load_dynamic_configuration(self.config, self.secrets)
+        self.dynamic_configuration = {}
+        self.config = load_dynamic_configuration(
+            self.config,
+            self.secrets,
+            max_workers=self.settings.get("runtime", {})
+            .get("configuration", {})
+            .get("max_workers", DYNAMIC_CONFIGURATION_WORKERS),
+            report=self.dynamic_configuration,
+        )
+
+        http_settings = self.settings.get("runtime", {}).get("http", {})
+        if http_settings:
+            configure_session_pool(
+                max_sessions=http_settings.get("max_sessions"),
+                pool_maxsize=http_settings.get("pool_size"),
+                idle_timeout=http_settings.get("idle_timeout"),
+            )
+
+        events_settings = self.settings.get("runtime", {}).get("events", {})
+        if events_settings.get("dispatch") == "async" and not isinstance(
+            self.event_registry, AsyncEventHandlerRegistry
+        ):
+            registry = AsyncEventHandlerRegistry(
+                queue_size=events_settings.get("queue_size", 1024),
+                overflow=events_settings.get("overflow", "block"),
+            )
+            for handler in self.event_registry.handlers:
+                registry.register(handler)
+            self.event_registry = registry
 
     def cleanup(self):
         pass
@@ -415,18 +583,39 @@ class Runner:
         experiment_vars: dict[str, Any] | None = None,
         journal: Journal = None,
     ) -> Journal:
-        self.configure(experiment, settings, experiment_vars)
-        with exit_signals():
-            journal = self._run(
-                self.strategy,
-                self.schedule,
-                experiment,
-                journal,
-                self.config,
-                self.secrets,
-                self.settings,
-                self.event_registry,
-            )
+        # the state of this run is scoped to the current context, so that
+        # runners can be used concurrently from threads or asyncio tasks:
+        # its settings, substitution plans and global controls. The latter
+        # are pinned for its duration, from those loaded by this context or
+        # else by the process, so that loading others elsewhere does not
+        # affect this run.
+        # The HTTP session pool, and its limits, the caches of resolved
+        # callables and executables, the payload logging budget and the
+        # notification dispatcher remain shared by the whole process
+        controls_token = global_controls.set(tuple(get_global_controls()))
+        plans_token = use_substitution_plans(SubstitutionPlanCache())
+        settings_token = None
+        enter_run()
+        try:
+            self.configure(experiment, settings, experiment_vars)
+            settings_token = loaded_settings.set(self.settings)
+            with exit_signals():
+                journal = self._run(
+                    self.strategy,
+                    self.schedule,
+                    experiment,
+                    journal,
+                    self.config,
+                    self.secrets,
+                    self.settings,
+                    self.event_registry,
+                )
+        finally:
+            if settings_token is not None:
+                loaded_settings.reset(settings_token)
+            run_substitution_plans.reset(plans_token)
+            global_controls.reset(controls_token)
+            leave_run()
         return journal
 
     def _run(
@@ -447,10 +636,16 @@ class Runner:
 
         started_at = time.time()
         journal = journal or initialize_run_journal(experiment)
+        dynamic_configuration = getattr(self, "dynamic_configuration", None)
+        if dynamic_configuration:
+            journal["dynamic_configuration"] = dynamic_configuration
         event_registry.started(experiment, journal)
 
         control = Control()
-        activity_pool, rollback_pool = get_background_pools(experiment)
+        activity_pool, rollback_pool = get_background_pools(
+            experiment,
+            settings.get("runtime", {}).get("method", {}).get("max_workers"),
+        )
         hypo_pool = get_hypothesis_pool()
         continuous_hypo_event = threading.Event()
 
@@ -467,6 +662,7 @@ class Runner:
         initialize_controls(
             experiment, configuration, secrets, event_registry=event_registry
         )
+        build_control_dispatch_table(experiment)
         event_registry.running(
             experiment, journal, configuration, secrets, schedule, settings
         )
@@ -481,6 +677,11 @@ class Runner:
             .get("strategy", "default")
         )
         logger.info(f"Rollbacks strategy: {rollback_strategy}")
+        hypothesis_workers = (
+            settings.get("runtime", {})
+            .get("hypothesis", {})
+            .get("max_workers", 1)
+        )
 
         exit_gracefully_with_rollbacks = True
 
@@ -510,6 +711,7 @@ class Runner:
                         secrets,
                         event_registry,
                         dry,
+                        max_workers=hypothesis_workers,
                     )
 
                 if state is not None:
@@ -525,6 +727,7 @@ class Runner:
                             secrets,
                             event_registry,
                             dry,
+                            max_workers=hypothesis_workers,
                         )
 
                     state = run_method(
@@ -552,6 +755,7 @@ class Runner:
                             secrets,
                             event_registry,
                             dry,
+                            max_workers=hypothesis_workers,
                         )
             except InterruptExecution as i:
                 journal["status"] = "interrupted"
@@ -617,6 +821,7 @@ class Runner:
                 logger.debug("Failed to close controls", exc_info=True)
         finally:
             try:
+                clear_control_dispatch_table()
                 cleanup_controls(experiment)
                 cleanup_global_controls()
             finally:
@@ -625,6 +830,29 @@ class Runner:
         return journal
 
 
+def enter_run() -> None:
+    """
+    Record that a run has started in this process.
+    """
+    global _active_runs
+    with _active_runs_lock:
+        _active_runs += 1
+
+
+def leave_run() -> None:
+    """
+    Record that a run has completed. The HTTP sessions, shared by all runs
+    of the process, are closed once the last one completes.
+    """
+    global _active_runs
+    with _active_runs_lock:
+        _active_runs -= 1
+        last = _active_runs == 0
+
+    if last:
+        close_session_pool()
+
+
 def should_run_before_method(strategy: Strategy) -> bool:
     return strategy in [
         Strategy.BEFORE_METHOD,
@@ -652,6 +880,7 @@ def run_gate_hypothesis(
     secrets: Secrets,
     event_registry: EventHandlerRegistry,
     dry: Dry,
+    max_workers: int = 1,
 ) -> dict[str, Any]:
     """
     Run the hypothesis before the method and bail the execution if it did
@@ -665,6 +894,7 @@ def run_gate_hypothesis(
         secrets,
         dry=dry,
         event_registry=event_registry,
+        max_workers=max_workers,
     )
     journal["steady_states"]["before"] = state
     event_registry.hypothesis_before_completed(experiment, state, journal)
@@ -694,6 +924,7 @@ def run_deviation_validation_hypothesis(
     secrets: Secrets,
     event_registry: EventHandlerRegistry,
     dry: Dry,
+    max_workers: int = 1,
 ) -> dict[str, Any]:
     """
     Run the hypothesis after the method and report to the journal if the
@@ -707,6 +938,7 @@ def run_deviation_validation_hypothesis(
         secrets,
         dry=dry,
         event_registry=event_registry,
+        max_workers=max_workers,
     )
     journal["steady_states"]["after"] = state
     event_registry.hypothesis_after_completed(experiment, state, journal)
@@ -738,6 +970,7 @@ def run_hypothesis_during_method(
     secrets: Secrets,
     event_registry: EventHandlerRegistry,
     dry: Dry,
+    max_workers: int = 1,
 ) -> Future:
     """
     Run the hypothesis continuously in a background thread and report the
@@ -766,6 +999,7 @@ def run_hypothesis_during_method(
         secrets,
         event_registry,
         dry=dry,
+        max_workers=max_workers,
     )
     f.add_done_callback(completed)
     return f
@@ -890,10 +1124,16 @@ def initialize_run_journal(experiment: Experiment) -> Journal:
     }
 
 
-def get_background_pools(experiment: Experiment) -> ThreadPoolExecutor:
+def get_background_pools(
+    experiment: Experiment, max_workers: int | None = None
+) -> ThreadPoolExecutor:
     """
     Create a pool for background activities. The pool is as big as the number
     of declared background activities. If none are declared, returned `None`.
+
+    When the method declares dependencies between its activities, they all
+    run from the pool which is then bounded to `max_workers` (or the Python
+    default when not set).
     """
     method = experiment.get("method", [])
     rollbacks = experiment.get("rollbacks", [])
@@ -904,11 +1144,14 @@ def get_background_pools(experiment: Experiment) -> ThreadPoolExecutor:
             activity_background_count = activity_background_count + 1
 
     activity_pool = None
-    if activity_background_count:
+    if has_activity_dependencies(experiment):
+        logger.debug("The method will be run as a graph of activities")
+        activity_pool = ContextThreadPoolExecutor(max_workers)
+    elif activity_background_count:
         logger.debug(
             f"{activity_background_count} activities will be run in the background"
         )
-        activity_pool = ThreadPoolExecutor(activity_background_count)
+        activity_pool = ContextThreadPoolExecutor(activity_background_count)
 
     rollback_background_pool = 0
     for activity in rollbacks:
@@ -920,7 +1163,7 @@ def get_background_pools(experiment: Experiment) -> ThreadPoolExecutor:
         logger.debug(
             f"{rollback_background_pool} rollbacks will be run in the background"
         )
-        rollback_pool = ThreadPoolExecutor(rollback_background_pool)
+        rollback_pool = ContextThreadPoolExecutor(rollback_background_pool)
 
     return activity_pool, rollback_pool
 
@@ -931,7 +1174,7 @@ def get_hypothesis_pool() -> ThreadPoolExecutor:
     background of the method. The pool is not bounded because we don't know
     how long it will run for.
     """
-    return ThreadPoolExecutor(max_workers=1)
+    return ContextThreadPoolExecutor(max_workers=1)
 
 
 def run_hypothesis_continuously(
@@ -943,9 +1186,9 @@ def run_hypothesis_continuously(
     secrets: Secrets,
     event_registry: EventHandlerRegistry,
     dry: Dry,
+    max_workers: int = 1,
 ):
     frequency = schedule.continuous_hypothesis_frequency
-    fail_fast_ratio = schedule.fail_fast_ratio
 
     event_registry.start_continuous_hypothesis(frequency)
     logger.info(
@@ -953,46 +1196,362 @@ def run_hypothesis_continuously(
         f"every {frequency} seconds"
     )
 
-    failed_iteration = 0
-    failed_ratio = 0
-    iteration = 1
-    while not event.is_set():
-        # already marked as terminated, let's exit now
-        if journal["status"] in ["failed", "interrupted", "aborted"]:
-            break
+    iterations = HypothesisIterations(schedule, journal, event_registry)
 
-        state = run_steady_state_hypothesis(
+    def run_iteration() -> dict[str, Any] | None:
+        return run_steady_state_hypothesis(
             experiment,
             configuration,
             secrets,
             dry=dry,
             event_registry=event_registry,
+            max_workers=max_workers,
         )
-        journal["steady_states"]["during"].append(state)
-        event_registry.continuous_hypothesis_iteration(iteration, state)
 
-        if state is not None and not state["steady_state_met"]:
-            failed_iteration += 1
-            failed_ratio = (failed_iteration * 100) / iteration
-            p = state["probes"][-1]
-            logger.warning(
-                "Continuous steady state probe '{p}' is not in the given "
-                "tolerance".format(p=p["activity"]["name"])
+    try:
+        if schedule.mode == "fixed-rate":
+            run_hypothesis_at_fixed_rate(
+                event, schedule, journal, iterations, run_iteration
             )
+            return
 
-            if schedule.fail_fast and failed_ratio >= fail_fast_ratio:
-                m = "Terminating immediately the experiment"
-                if failed_ratio != 0.0:
-                    m = f"{m} after {failed_ratio:.1f}% hypothesis deviated"
-                logger.info(m)
-                journal["status"] = "failed"
+        iteration = 1
+        while not event.is_set():
+            # already marked as terminated, let's exit now
+            if journal["status"] in ["failed", "interrupted", "aborted"]:
                 break
-        iteration += 1
 
-        # we do not adjust the frequency based on the time taken by probes
-        # above. We really want frequency seconds between two iteration
-        # not frequency as a total time of a single iteration
-        event.wait(timeout=frequency)
+            state = run_iteration()
+            if iterations.record(iteration, state):
+                break
+            iteration += 1
+
+            # we do not adjust the frequency based on the time taken by
+            # probes above. We really want frequency seconds between two
+            # iteration not frequency as a total time of a single iteration
+            event.wait(timeout=frequency)
+    finally:
+        iterations.close()
+
+
+def run_hypothesis_at_fixed_rate(
+    event: threading.Event,
+    schedule: Schedule,
+    journal: Journal,
+    iterations: "HypothesisIterations",
+    run_iteration: Callable[[], dict[str, Any] | None],
+) -> None:
+    """
+    Start an iteration of the hypothesis every period, measured against
+    `time.monotonic` deadlines so that the time taken by the probes does
+    not make the schedule drift. See :class:`Schedule` for how iterations
+    which cannot start on time are handled.
+
+    Each state is given a `"schedule"` entry telling when the iteration was
+    due and when it actually started, both as UTC ISO dates, the `"lag"`
+    between the two, in seconds, and how many iterations were `"skipped"`
+    just before it.
+    """
+    period = max(schedule.continuous_hypothesis_frequency, 0)
+    overrun = schedule.overrun
+    wall_origin = time.time()
+    origin = time.monotonic()
+
+    def as_date(deadline: float) -> str:
+        return datetime.fromtimestamp(
+            wall_origin + deadline - origin, UTC
+        ).isoformat()
+
+    def run_scheduled(iteration: int, due: float, skipped: int) -> bool:
+        started = time.monotonic()
+        state = run_iteration()
+        if state is not None:
+            state["schedule"] = {
+                "scheduled": as_date(due),
+                "started": as_date(started),
+                "lag": started - due,
+                "skipped": skipped,
+            }
+        return iterations.record(iteration, state)
+
+    def completed(f: Future) -> None:
+        # stop right away, rather than once the next iteration is due, when
+        # that iteration failed fast or raised
+        if not f.cancelled() and (f.exception() is not None or f.result()):
+            event.set()
+
+    pool = None
+    in_flight = []
+    if overrun == "concurrent":
+        pool = ContextThreadPoolExecutor(schedule.max_in_flight)
+
+    due = origin
+    skipped = 0
+    iteration = 1
+    try:
+        while not event.is_set():
+            # already marked as terminated, let's exit now
+            if journal["status"] in ["failed", "interrupted", "aborted"]:
+                break
+
+            delay = due - time.monotonic()
+            if delay > 0 and event.wait(timeout=delay):
+                break
+
+            if pool is not None:
+                for f in [f for f in in_flight if f.done()]:
+                    in_flight.remove(f)
+                    f.result()
+
+                if len(in_flight) >= schedule.max_in_flight:
+                    logger.debug(
+                        f"{len(in_flight)} hypothesis iterations still "
+                        "running, skipping this one"
+                    )
+                    skipped += 1
+                    due += period
+                    continue
+
+                f = pool.submit(run_scheduled, iteration, due, skipped)
+                f.add_done_callback(completed)
+                in_flight.append(f)
+            elif run_scheduled(iteration, due, skipped):
+                break
+
+            skipped = 0
+            iteration += 1
+            due += period
+
+            now = time.monotonic()
+            if period <= 0:
+                due = max(due, now)
+            elif overrun == "skip" and now > due:
+                missed = int((now - due) // period) + 1
+                logger.debug(
+                    f"Hypothesis iteration overran, skipping {missed} "
+                    "iterations"
+                )
+                skipped += missed
+                due += missed * period
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    # surface the errors of the iterations which were still running
+    for f in in_flight:
+        f.result()
+
+
+class HypothesisIterations:
+    """
+    Record the states of the continuous hypothesis in the journal and tell
+    when the run must stop because of fail fast. Iterations may complete
+    from several threads when they run concurrently.
+
+    States are retained as set by the `history_size`, `keep_failures` and
+    `history_path` of the schedule, see :class:`Schedule`.
+    """
+
+    def __init__(
+        self,
+        schedule: Schedule,
+        journal: Journal,
+        event_registry: EventHandlerRegistry,
+    ):
+        self.schedule = schedule
+        self.journal = journal
+        self.event_registry = event_registry
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.probes = {}
+        self._recent = None
+        self._history = None
+        self._lock = threading.Lock()
+
+        if schedule.history_size is not None:
+            self._recent = deque(maxlen=max(int(schedule.history_size), 0))
+        if schedule.history_path:
+            # kept open until the continuous hypothesis completes
+            self._history = open(  # noqa: SIM115
+                schedule.history_path, "a", encoding="utf-8"
+            )
+
+    def record(self, iteration: int, state: dict[str, Any] | None) -> bool:
+        """
+        Record the state of the given iteration and return `True` when the
+        continuous hypothesis must stop.
+        """
+        with self._lock:
+            self.completed += 1
+            self.journal["steady_states"]["during"].append(state)
+            if state is not None and not state["steady_state_met"]:
+                self.failed += 1
+            failed_ratio = (self.failed * 100) / self.completed
+            self._retain(iteration, state)
+
+        self.event_registry.continuous_hypothesis_iteration(iteration, state)
+
+        if state is None or state["steady_state_met"]:
+            return False
+
+        p = state["probes"][-1]
+        logger.warning(
+            "Continuous steady state probe '{p}' is not in the given "
+            "tolerance".format(p=p["activity"]["name"])
+        )
+
+        schedule = self.schedule
+        if schedule.fail_fast and failed_ratio >= schedule.fail_fast_ratio:
+            m = "Terminating immediately the experiment"
+            if failed_ratio != 0.0:
+                m = f"{m} after {failed_ratio:.1f}% hypothesis deviated"
+            logger.info(m)
+            self.journal["status"] = "failed"
+            return True
+        return False
+
+    def close(self) -> None:
+        """
+        Write the summary of the iterations to the journal, when states are
+        not all retained, and close the history file.
+        """
+        with self._lock:
+            if self._history is not None:
+                self._history.close()
+                self._history = None
+
+            if self._recent is None:
+                return
+
+            self.journal["continuous_hypothesis"] = {
+                "iterations": self.completed,
+                "deviations": self.failed,
+                "dropped": self.dropped,
+                "probes": {
+                    name: aggregate.summary()
+                    for name, aggregate in self.probes.items()
+                },
+            }
+
+    ###########################################################################
+    # Internals
+    ###########################################################################
+    def _retain(self, iteration: int, state: dict[str, Any] | None) -> None:
+        if self._history is not None:
+            record = {"iteration": iteration, "state": state}
+            try:
+                line = json.dumps(record, cls=PayloadEncoder)
+            except TypeError:
+                line = json.dumps(record, default=str)
+            self._history.write(f"{line}\n")
+
+        recent = self._recent
+        if recent is None:
+            return
+
+        for run in (state or {}).get("probes", []):
+            name = run.get("activity", {}).get("name")
+            aggregate = self.probes.get(name)
+            if aggregate is None:
+                aggregate = self.probes[name] = ProbeAggregate()
+            aggregate.add(run)
+
+        # the states of the window are the last ones of the journal, just
+        # before the one being recorded
+        last = len(self.journal["steady_states"]["during"]) - 1
+        if recent.maxlen == 0:
+            self._drop(last)
+            return
+
+        if len(recent) == recent.maxlen:
+            self._drop(last - len(recent))
+        recent.append(state)
+
+    def _drop(self, index: int) -> None:
+        during = self.journal["steady_states"]["during"]
+        state = during[index]
+        # iterations without any hypothesis hold nothing worth dropping
+        if state is None:
+            return
+
+        if not state["steady_state_met"] and self.schedule.keep_failures:
+            return
+
+        del during[index]
+        self.dropped += 1
+
+
+class ProbeAggregate:
+    """
+    Compact summary of the runs of a probe of the continuous hypothesis:
+    how many ran, how many met their tolerance, and the distribution of
+    their durations.
+
+    Durations are counted in buckets growing by 1%, so that percentiles are
+    computed within that precision whatever the number of runs.
+    """
+
+    precision = 0.01
+
+    def __init__(self):
+        self.count = 0
+        self.succeeded = 0
+        self.tolerance_met = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = {}
+
+    def add(self, run: Run) -> None:
+        self.count += 1
+        if run.get("status") == "succeeded":
+            self.succeeded += 1
+        if run.get("tolerance_met"):
+            self.tolerance_met += 1
+
+        duration = run.get("duration")
+        if duration is None:
+            return
+
+        self.total += duration
+        self.min = duration if self.min is None else min(self.min, duration)
+        self.max = duration if self.max is None else max(self.max, duration)
+        bucket = math.floor(
+            math.log(max(duration, 1e-6)) / math.log1p(self.precision)
+        )
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, q: float) -> float | None:
+        measured = sum(self.buckets.values())
+        if not measured:
+            return None
+
+        rank = q * measured
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                value = math.exp((bucket + 0.5) * math.log1p(self.precision))
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, Any]:
+        measured = sum(self.buckets.values())
+        return {
+            "count": self.count,
+            "succeeded": self.succeeded,
+            "tolerance_met": self.tolerance_met,
+            "pass_ratio": self.tolerance_met / self.count if self.count else 0,
+            "duration": {
+                "min": self.min,
+                "mean": self.total / measured if measured else None,
+                "max": self.max,
+                "p50": self.percentile(0.5),
+                "p90": self.percentile(0.9),
+                "p99": self.percentile(0.99),
+            },
+        }
 
 
 def apply_activities(
@@ -1015,8 +1574,12 @@ def apply_activities(
         futures = []
         wait_for_background_activities = True
 
+        activities = run_activities
+        if has_activity_dependencies(experiment):
+            activities = run_activities_graph
+
         try:
-            for activity in run_activities(
+            for activity in activities(
                 experiment,
                 configuration,
                 secrets,
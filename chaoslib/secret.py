@@ -1,20 +1,40 @@
+import hashlib
+import importlib.util
 import logging
 import os
+import threading
+import time
+from copy import deepcopy
+from types import ModuleType
 from typing import Any
 
-try:
-    import hvac
-
-    HAS_HVAC = True
-except ImportError:
-    HAS_HVAC = False
+# hvac, and the requests stack it relies on, are only imported once a
+# Vault client is created
+HAS_HVAC = importlib.util.find_spec("hvac") is not None
+hvac = None
 
+from chaoslib import ContextThreadPoolExecutor
 from chaoslib.exceptions import InvalidExperiment
 from chaoslib.types import Configuration, Secrets
 
-__all__ = ["create_vault_client", "load_secrets"]
+__all__ = [
+    "clear_vault_cache",
+    "create_vault_client",
+    "fetch_vault_secrets",
+    "load_secrets",
+]
 
 logger = logging.getLogger("chaostoolkit")
+VAULT_CLIENT_SETTINGS = (
+    "vault_addr",
+    "vault_kv_version",
+    "vault_token",
+    "vault_role_id",
+    "vault_role_secret",
+    "vault_sa_role",
+    "vault_sa_token_path",
+    "vault_k8s_mount_point",
+)
 
 
 def load_secrets(
@@ -75,9 +95,30 @@ def load_secrets(
         }
     }
     ```
+
+    Secrets read from Vault are fetched with a single authenticated client
+    and each distinct path is read once, concurrently, see
+    :func:`fetch_vault_secrets`.
     """
     logger.debug("Loading secrets...")
 
+    vault_secrets = []
+    collect_vault_secrets(secrets_info, extra_vars, vault_secrets)
+    vault_data = fetch_vault_secrets(vault_secrets, configuration)
+
+    secrets = build_secrets(secrets_info, configuration, extra_vars, vault_data)
+
+    logger.debug("Done loading secrets")
+
+    return secrets
+
+
+def build_secrets(
+    secrets_info: dict[str, dict[str, str]],
+    configuration: Configuration,
+    extra_vars: dict[str, Any] | None,
+    vault_data: dict[tuple[str, str], dict[str, Any] | None],
+) -> Secrets:
     extra_vars = extra_vars or {}
 
     secrets = {}
@@ -91,18 +132,21 @@ def load_secrets(
                 secrets[key] = load_secret_from_env(value)
 
             elif value.get("type") == "vault":
-                secrets[key] = load_secrets_from_vault(value, configuration)
+                secrets[key] = get_vault_secret(
+                    value, configuration, vault_data
+                )
 
             else:
-                secrets[key] = load_secrets(
-                    value, configuration, extra_vars.get(key, None)
+                secrets[key] = build_secrets(
+                    value,
+                    configuration,
+                    extra_vars.get(key, None),
+                    vault_data,
                 )
 
         else:
             secrets[key] = value
 
-    logger.debug("Done loading secrets")
-
     return secrets
 
 
@@ -170,61 +214,92 @@ def load_secrets_from_vault(
 
     In that case, `mykey` will be set to the value at `secret/foo/bar` under
     the Vault secret key `mypassword`.
+
+    The mount point is read from the `vault_secrets_mount_point`
+    configuration entry, `secret` by default, unless the secret declares
+    its own `"mount_point"`.
     """
+    if isinstance(secrets_info, dict) and secrets_info.get("type") == "vault":
+        vault_data = fetch_vault_secrets([secrets_info], configuration)
+        return get_vault_secret(secrets_info, configuration, vault_data)
 
-    secret = {}
 
-    client = create_vault_client(configuration)
+def fetch_vault_secrets(
+    secrets_info: list[dict[str, str]], configuration: Configuration = None
+) -> dict[tuple[str, str], dict[str, Any] | None]:
+    """
+    Read the Vault paths the given secrets point at and return their data
+    keyed by mount point and path.
+
+    A single client is authenticated for all of them and each distinct path
+    is read once, however many secrets point at it. Paths are read
+    concurrently by up to `vault_max_workers` threads, 8 by default.
+
+    When the `vault_secrets_cache_ttl` configuration entry is set to a
+    number of seconds, the authenticated client and the data read are kept
+    for that long, so that a long-lived process does not authenticate or
+    read the same paths again on every run. Keep it below the TTL of the
+    Vault token.
+    """
+    if not secrets_info:
+        return {}
 
-    if isinstance(secrets_info, dict) and secrets_info.get("type") == "vault":
-        if not HAS_HVAC:
-            logger.error(
-                "Install the `hvac` package to fetch secrets "
-                "from Vault: `pip install chaostoolkit-lib[vault]`."
-            )
-            return {}
-
-        vault_path = secrets_info.get("path")
-
-        if vault_path is None:
-            logger.warning(f"Missing Vault secret path for '{secrets_info}'")
-            return {}
-
-        # see https://github.com/chaostoolkit/chaostoolkit/issues/98
-        kv = client.secrets.kv
-        is_kv1 = kv.default_kv_version == "1"
-        if is_kv1:
-            vault_payload = kv.v1.read_secret(
-                path=vault_path,
-                mount_point=configuration.get(
-                    "vault_secrets_mount_point", "secret"
-                ),
-            )
+    if not HAS_HVAC:
+        logger.error(
+            "Install the `hvac` package to fetch secrets "
+            "from Vault: `pip install chaostoolkit-lib[vault]`."
+        )
+        return {}
+
+    configuration = configuration or {}
+    locations = sorted(
+        {
+            vault_location(info, configuration)
+            for info in secrets_info
+            if info.get("path") is not None
+        }
+    )
+    if not locations:
+        return {}
+
+    ttl = float(configuration.get("vault_secrets_cache_ttl") or 0)
+    client_key = vault_client_key(configuration)
+
+    vault_data = {}
+    missing = []
+    for location in locations:
+        found, data = vault_cache.get_secret(client_key, location, ttl)
+        if found:
+            vault_data[location] = data
         else:
-            vault_payload = kv.v2.read_secret_version(
-                path=vault_path,
-                mount_point=configuration.get(
-                    "vault_secrets_mount_point", "secret"
-                ),
-            )
+            missing.append(location)
 
-        if not vault_payload:
-            logger.warning(f"No Vault secret found at path: {vault_path}")
-            return {}
+    if not missing:
+        return vault_data
 
-        if is_kv1:
-            data = vault_payload.get("data")
-        else:
-            data = vault_payload.get("data", {}).get("data")
+    client = vault_cache.get_client(client_key, ttl)
+    if client is None:
+        client = create_vault_client(configuration)
+        vault_cache.set_client(client_key, client, ttl)
 
-        key = secrets_info.get("key")
+    max_workers = int(configuration.get("vault_max_workers", 8))
+    logger.debug(f"Reading {len(missing)} Vault secret paths")
+    with ContextThreadPoolExecutor(
+        max_workers=max(min(max_workers, len(missing)), 1)
+    ) as pool:
+        results = pool.map(lambda loc: read_vault_secret(client, *loc), missing)
+        for location, data in zip(missing, results, strict=True):
+            vault_data[location] = data
+            vault_cache.set_secret(client_key, location, data, ttl)
 
-        if key is not None:
-            secret = data[key]
-        else:
-            secret = data
+    return vault_data
 
-        return secret
+
+def clear_vault_cache() -> None:
+    """
+    Forget the Vault clients and secrets kept by :func:`fetch_vault_secrets`.
+    """
+    vault_cache.clear()
 
 
 ###############################################################################
@@ -237,7 +312,7 @@ def create_vault_client(configuration: Configuration = None):
     client = None
     if HAS_HVAC:
         url = configuration.get("vault_addr")
-        client = hvac.Client(url=url)
+        client = import_hvac().Client(url=url)
 
         client.secrets.kv.default_kv_version = str(
             configuration.get("vault_kv_version", "2")
@@ -294,3 +369,153 @@ def create_vault_client(configuration: Configuration = None):
                 )
 
     return client
+
+
+def collect_vault_secrets(
+    secrets_info: dict[str, Any],
+    extra_vars: dict[str, Any] | None,
+    vault_secrets: list[dict[str, str]],
+) -> None:
+    # same walk as `build_secrets`, so that overridden secrets are not read
+    extra_vars = extra_vars or {}
+    for key, value in secrets_info.items():
+        if not isinstance(value, dict) or extra_vars.get(key) is not None:
+            continue
+
+        if value.get("type") == "vault":
+            vault_secrets.append(value)
+        elif value.get("type") != "env":
+            collect_vault_secrets(value, extra_vars.get(key), vault_secrets)
+
+
+def vault_location(
+    secrets_info: dict[str, str], configuration: Configuration
+) -> tuple[str, str]:
+    mount_point = secrets_info.get("mount_point") or (configuration or {}).get(
+        "vault_secrets_mount_point", "secret"
+    )
+    return (mount_point, secrets_info["path"])
+
+
+def read_vault_secret(
+    client: Any, mount_point: str, path: str
+) -> dict[str, Any] | None:
+    # see https://github.com/chaostoolkit/chaostoolkit/issues/98
+    kv = client.secrets.kv
+    if kv.default_kv_version == "1":
+        vault_payload = kv.v1.read_secret(path=path, mount_point=mount_point)
+        return vault_payload.get("data") if vault_payload else None
+
+    vault_payload = kv.v2.read_secret_version(
+        path=path, mount_point=mount_point
+    )
+    return vault_payload.get("data", {}).get("data") if vault_payload else None
+
+
+def get_vault_secret(
+    secrets_info: dict[str, str],
+    configuration: Configuration,
+    vault_data: dict[tuple[str, str], dict[str, Any] | None],
+) -> Any:
+    if not HAS_HVAC:
+        return {}
+
+    vault_path = secrets_info.get("path")
+    if vault_path is None:
+        logger.warning(f"Missing Vault secret path for '{secrets_info}'")
+        return {}
+
+    data = vault_data.get(vault_location(secrets_info, configuration))
+    if not data:
+        logger.warning(f"No Vault secret found at path: {vault_path}")
+        return {}
+
+    key = secrets_info.get("key")
+    if key is not None:
+        return data[key]
+
+    # the data may be shared with other secrets and kept in the cache
+    return deepcopy(data)
+
+
+def vault_client_key(configuration: Configuration) -> str:
+    # digest of everything the client authenticates with, the cache never
+    # holds these values in clear
+    auth = [str(configuration.get(k)) for k in VAULT_CLIENT_SETTINGS]
+    return hashlib.sha256("\0".join(auth).encode("utf-8")).hexdigest()
+
+
+class VaultCache:
+    """
+    Authenticated Vault clients and the secrets they read, each kept for
+    the TTL they were stored with. Nothing is kept when that TTL is not
+    positive.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._secrets = {}
+        self._lock = threading.Lock()
+
+    def get_client(self, client_key: str, ttl: float) -> Any:
+        with self._lock:
+            return self._lookup(self._clients, client_key, ttl)[1]
+
+    def set_client(self, client_key: str, client: Any, ttl: float) -> None:
+        if ttl > 0:
+            with self._lock:
+                self._clients[client_key] = (time.monotonic() + ttl, client)
+
+    def get_secret(
+        self, client_key: str, location: tuple[str, str], ttl: float
+    ) -> tuple[bool, dict[str, Any] | None]:
+        with self._lock:
+            return self._lookup(self._secrets, (client_key, location), ttl)
+
+    def set_secret(
+        self,
+        client_key: str,
+        location: tuple[str, str],
+        data: dict[str, Any] | None,
+        ttl: float,
+    ) -> None:
+        if ttl > 0:
+            with self._lock:
+                self._secrets[(client_key, location)] = (
+                    time.monotonic() + ttl,
+                    data,
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._secrets.clear()
+
+    def _lookup(
+        self, entries: dict[Any, tuple[float, Any]], key: Any, ttl: float
+    ) -> tuple[bool, Any]:
+        if ttl <= 0:
+            return False, None
+
+        entry = entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del entries[key]
+            return False, None
+        return True, value
+
+
+# shared by all the runs of this process
+vault_cache = VaultCache()
+
+
+def import_hvac() -> ModuleType:
+    global hvac
+    if hvac is None:
+        import hvac as hvac_module
+
+        hvac = hvac_module
+    return hvac
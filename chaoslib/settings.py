@@ -5,8 +5,6 @@ import os.path
 import re
 from typing import Any
 
-import yaml
-
 from chaoslib.types import Settings
 
 __all__ = [
@@ -34,6 +32,8 @@ def load_settings(settings_path: str = CHAOSTOOLKIT_CONFIG_PATH) -> Settings:
         )
         return
 
+    import yaml
+
     with open(settings_path) as f:
         try:
             settings = yaml.safe_load(f.read())
@@ -55,6 +55,8 @@ def save_settings(
     if not os.path.isdir(settings_dir):
         os.mkdir(settings_dir)
 
+    import yaml
+
     with open(settings_path, "w") as outfile:
         yaml.dump(settings, outfile, default_flow_style=False)
 
@@ -113,12 +113,55 @@ class Dry(enum.Enum):
 
 
 class Schedule:
+    """
+    How the steady-state hypothesis runs continuously during the method.
+
+    With the `"fixed-delay"` mode, each iteration starts
+    `continuous_hypothesis_frequency` seconds after the previous one
+    completed. With the `"fixed-rate"` mode, iterations are due every
+    `continuous_hypothesis_frequency` seconds from the first one, whatever
+    the time they take. When an iteration is still running once the next
+    one is due, the `overrun` policy applies:
+
+    * `"skip"`: the iterations which are overdue are skipped and the next
+      one starts on time
+    * `"catch-up"`: overdue iterations run back to back until the schedule
+      is caught up
+    * `"concurrent"`: iterations start on time, with at most
+      `max_in_flight` running at once, and are skipped beyond that
+
+    By default, every state of the continuous hypothesis is kept in the
+    journal. When `history_size` is set, only the states of the last
+    `history_size` iterations are kept in full, as well as every state where
+    the hypothesis was not met when `keep_failures` is set. All iterations
+    are summarized, per probe, in the `"continuous_hypothesis"` entry of the
+    journal. Set `history_path` to append every state to that file, as JSON
+    lines, before it is dropped.
+    """
+
     def __init__(
         self,
         continuous_hypothesis_frequency: float = 1.0,
         fail_fast: bool = False,
         fail_fast_ratio: float = 0,
+        mode: str = "fixed-delay",
+        overrun: str = "skip",
+        max_in_flight: int = 1,
+        history_size: int | None = None,
+        keep_failures: bool = True,
+        history_path: str | None = None,
     ):
+        if mode not in ("fixed-delay", "fixed-rate"):
+            raise ValueError(f"Unknown continuous hypothesis mode '{mode}'")
+        if overrun not in ("skip", "catch-up", "concurrent"):
+            raise ValueError(f"Unknown overrun policy '{overrun}'")
+
         self.continuous_hypothesis_frequency = continuous_hypothesis_frequency
         self.fail_fast = fail_fast
         self.fail_fast_ratio = fail_fast_ratio
+        self.mode = mode
+        self.overrun = overrun
+        self.max_in_flight = max(int(max_in_flight), 1)
+        self.history_size = history_size
+        self.keep_failures = keep_failures
+        self.history_path = history_path
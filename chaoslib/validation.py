@@ -0,0 +1,182 @@
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import os.path
+import sys
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, packages_distributions
+from importlib.metadata import version as dist_version
+from typing import Any
+
+from chaoslib import __version__, experiment_hash
+from chaoslib.provider.process import resolve_executable
+from chaoslib.types import Experiment, Settings
+
+__all__ = [
+    "ValidationCache",
+    "environment_fingerprint",
+    "get_validation_cache",
+]
+logger = logging.getLogger("chaostoolkit")
+VALIDATION_CACHE_DIR = os.path.abspath(
+    os.path.expanduser("~/.chaostoolkit/cache/validation")
+)
+
+
+class ValidationCache:
+    """
+    Remember which experiments were found structurally valid, so that the
+    structure of an experiment is not validated again as long as neither the
+    experiment nor the environment it relies on have changed.
+
+    Only the structure is covered: the configuration, secrets and controls
+    are validated on every call, since they depend on state a fingerprint
+    cannot capture, such as a Vault server.
+
+    A verdict is keyed by the `experiment_hash` of the experiment and the
+    :func:`environment_fingerprint` of what it references. Only successful
+    validations are stored, an invalid experiment is always validated
+    again so that the error is reported.
+    """
+
+    def __init__(self, directory: str = VALIDATION_CACHE_DIR):
+        self.directory = directory
+
+    def key(self, experiment: Experiment) -> str:
+        h = hashlib.sha256()
+        h.update(experiment_hash(experiment).encode("utf-8"))
+        h.update(environment_fingerprint(experiment).encode("utf-8"))
+        return h.hexdigest()
+
+    def is_valid(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def mark_valid(self, key: str) -> None:
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            with open(path, "w"):
+                pass
+        except OSError:
+            logger.debug(f"Failed to write cache '{path}'", exc_info=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.valid")
+
+
+def get_validation_cache(settings: Settings = None) -> ValidationCache | None:
+    """
+    Cache of validation verdicts, as set by the `runtime.validation.cache`
+    settings, or `None` when it is disabled.
+
+    That entry may be `true` to use the default directory or the path to
+    a directory.
+    """
+    if not settings:
+        return None
+
+    cache = settings.get("runtime", {}).get("validation", {}).get("cache")
+    if not cache:
+        return None
+
+    if cache is True:
+        return ValidationCache()
+
+    return ValidationCache(os.path.abspath(os.path.expanduser(cache)))
+
+
+def environment_fingerprint(experiment: Experiment) -> str:
+    """
+    Digest of the parts of the environment the validation of the experiment
+    depends on:
+
+    * the Python and chaostoolkit-lib versions
+    * for each Python module referenced by a provider or a control, the
+      file it would be loaded from, its modification time and size, and
+      the versions of the distributions providing it
+    * for each process provider, the resolved executable and its
+      modification time
+
+    Only the file of a referenced module is looked at. Changing another
+    module it imports from, or re-exports, does not change the fingerprint:
+    clear the cache directory after editing such modules in place.
+    """
+    modules = set()
+    paths = set()
+    collect_references(experiment, modules, paths)
+
+    fingerprint = {
+        "python": sys.version,
+        "chaoslib": __version__,
+        "modules": [module_fingerprint(m) for m in sorted(modules)],
+        "paths": [executable_fingerprint(p) for p in sorted(paths)],
+    }
+    return hashlib.sha256(
+        json.dumps(fingerprint, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+###############################################################################
+# Internals
+###############################################################################
+def collect_references(data: Any, modules: set[str], paths: set[str]) -> None:
+    if isinstance(data, dict):
+        kind = data.get("type")
+        if kind == "python" and isinstance(data.get("module"), str):
+            modules.add(data["module"])
+        elif kind == "process" and isinstance(data.get("path"), str):
+            paths.add(data["path"])
+
+        for value in data.values():
+            collect_references(value, modules, paths)
+    elif isinstance(data, list):
+        for value in data:
+            collect_references(value, modules, paths)
+
+
+def module_fingerprint(mod_name: str) -> list[Any]:
+    try:
+        spec = importlib.util.find_spec(mod_name)
+    except (ImportError, ValueError):
+        spec = None
+
+    if spec is None:
+        return [mod_name, None]
+
+    origin = spec.origin
+    stat = None
+    if origin and os.path.isfile(origin):
+        st = os.stat(origin)
+        stat = [st.st_mtime_ns, st.st_size]
+
+    top_level = mod_name.split(".", 1)[0]
+    return [mod_name, origin, stat, distribution_versions(top_level)]
+
+
+def executable_fingerprint(path: str) -> list[Any]:
+    resolved = resolve_executable(os.path.expanduser(path))
+    if not resolved:
+        return [path, None]
+
+    try:
+        st = os.stat(resolved)
+    except OSError:
+        return [path, None]
+    return [path, resolved, st.st_mtime_ns, st.st_mode]
+
+
+@lru_cache(maxsize=1)
+def get_packages_distributions() -> dict[str, list[str]]:
+    return packages_distributions()
+
+
+def distribution_versions(top_level: str) -> list[list[str]]:
+    versions = []
+    for dist in sorted(set(get_packages_distributions().get(top_level, []))):
+        try:
+            versions.append([dist, dist_version(dist)])
+        except PackageNotFoundError:
+            versions.append([dist, None])
+    return versions
@@ -0,0 +1,79 @@
+"""
+Compare the throughput of `decode_bytes` against detecting the encoding of
+the whole payload, as was done before, on outputs of 1KB, 1MB and 100MB.
+
+Run it from the root of the repository with:
+
+    $ PYTHONPATH=. python tests/benchmarks/bench_decode.py [--skip-legacy]
+"""
+
+import argparse
+import time
+
+from charset_normalizer import detect
+
+from chaoslib import clear_encoding_cache, decode_bytes
+
+SIZES = {"1KB": 1024, "1MB": 1024 * 1024, "100MB": 100 * 1024 * 1024}
+SAMPLES = {
+    "utf-8": "Le chat noir dort près de la fenêtre. ".encode(),
+    "cp1252": "Le chat noir dort près de la fenêtre. ".encode("cp1252"),
+}
+
+
+def legacy_decode_bytes(data: bytes) -> str:
+    encoding = "utf-8"
+    detected = detect(data) or {}
+    if (detected.get("confidence") or 0) >= 0.5:
+        encoding = detected["encoding"]
+    return data.decode(encoding)
+
+
+def measure(func, data: bytes, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        clear_encoding_cache()
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--skip-legacy",
+        action="store_true",
+        help="do not measure the whole payload detection, which is slow",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    candidates = {
+        "decode_bytes": decode_bytes,
+        "cached": lambda d: decode_bytes(d, cache_key="bench"),
+    }
+    if not args.skip_legacy:
+        candidates["legacy"] = legacy_decode_bytes
+
+    print(f"{'encoding':<8} {'size':>6} {'strategy':<14} {'MB/s':>10}")
+    for encoding, sample in SAMPLES.items():
+        for label, size in SIZES.items():
+            data = (sample * (size // len(sample) + 1))[:size]
+            for name, func in candidates.items():
+                if name == "cached":
+                    # warm the cache once, then measure the cached path
+                    decode_bytes(data, cache_key="bench")
+                    start = time.perf_counter()
+                    func(data)
+                    elapsed = time.perf_counter() - start
+                else:
+                    elapsed = measure(func, data, args.repeat)
+                throughput = size / (1024 * 1024) / max(elapsed, 1e-9)
+                print(
+                    f"{encoding:<8} {label:>6} {name:<14} {throughput:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
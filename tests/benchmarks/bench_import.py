@@ -0,0 +1,109 @@
+"""
+Check that importing `chaoslib.experiment`, as `chaos validate` does, stays
+within its recorded budget and does not import the heavy dependencies only
+needed by some experiments: the HTTP stack, YAML, charset detection, JSON
+logging, Vault and JSON path.
+
+Run it from the root of the repository with:
+
+    $ PYTHONPATH=. python tests/benchmarks/bench_import.py [--budget MS]
+
+Exits with a non-zero status when the budget is exceeded or when one of
+those dependencies was imported.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULE = "chaoslib.experiment"
+# measured between 55ms and 90ms, against 180ms when the dependencies were
+# imported eagerly, the margin absorbs slower machines
+BUDGET_MS = 150.0
+LAZY_MODULES = [
+    "charset_normalizer",
+    "hvac",
+    "jsonpath2",
+    "pythonjsonlogger",
+    "requests",
+    "urllib3",
+    "yaml",
+]
+
+
+def import_time(
+    module: str,
+) -> tuple[float, dict[str, float], dict[str, float]]:
+    """
+    Import `module` in a fresh interpreter and return its cumulative import
+    time and the cumulative time of each module it directly imported, in ms.
+    """
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {}
+    direct = {}
+    entries = []
+    for line in p.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            # the header line
+            continue
+        # a module is listed after its own imports, indented by two spaces
+        # per level, so the subtree of a top-level import is what precedes it
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, name.strip(), int(cumulative) / 1000))
+        if depth > 0:
+            continue
+
+        if name.strip() == module:
+            for d, n, ms in entries:
+                imported[n] = ms
+                if d == 1:
+                    direct[n] = ms
+        entries = []
+    return imported[module], imported, direct
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget", type=float, default=BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    durations = []
+    imported = direct = {}
+    for _ in range(args.repeat):
+        duration, imported, direct = import_time(MODULE)
+        durations.append(duration)
+
+    median = statistics.median(durations)
+    print(
+        f"{MODULE}: median {median:.1f}ms, min {min(durations):.1f}ms, "
+        f"budget {args.budget:.1f}ms"
+    )
+
+    print("\nslowest imports of the last run:")
+    slowest = sorted(direct.items(), key=lambda t: -t[1])[: args.top]
+    for name, ms in slowest:
+        print(f"  {name:<40} {ms:>8.1f}ms")
+
+    eager = [m for m in LAZY_MODULES if m in imported]
+    failed = False
+    if eager:
+        print(f"\nimported eagerly: {', '.join(eager)}")
+        failed = True
+    if median > args.budget:
+        print(f"\nover budget by {median - args.budget:.1f}ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compare the time it takes to load a large YAML experiment with the pure
+Python `yaml.safe_load`, with libyaml and from the parsed experiments cache.
+
+Run it from the root of the repository with:
+
+    $ PYTHONPATH=. python tests/benchmarks/bench_loader.py [--activities N]
+"""
+
+import argparse
+import os.path
+import tempfile
+import time
+
+import yaml
+
+from chaoslib.loader import parse_experiment_from_file
+
+
+def build_experiment(activities: int) -> dict:
+    method = []
+    for index in range(activities):
+        method.append(
+            {
+                "type": "action",
+                "name": f"action-{index}",
+                "provider": {
+                    "type": "python",
+                    "module": "os.path",
+                    "func": "exists",
+                    "arguments": {
+                        "path": f"/tmp/file-{index}",
+                        "labels": {f"key-{i}": f"value-{i}" for i in range(10)},
+                    },
+                },
+                "pauses": {"after": 1},
+            }
+        )
+    return {
+        "title": "a large experiment",
+        "description": "n/a",
+        "steady-state-hypothesis": {"title": "n/a", "probes": []},
+        "method": method,
+    }
+
+
+def measure(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--activities", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "experiment.yaml")
+        with open(path, "w") as f:
+            yaml.safe_dump(build_experiment(args.activities), f)
+        cache_dir = os.path.join(tmp, "cache")
+
+        def pure_python():
+            with open(path) as f:
+                yaml.safe_load(f)
+
+        def libyaml():
+            parse_experiment_from_file(path)
+
+        def cached():
+            parse_experiment_from_file(path, cache_dir)
+
+        # populate the cache
+        cached()
+
+        size = os.path.getsize(path) / (1024 * 1024)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader).__name__
+        print(f"experiment of {size:.1f}MB, loader {loader}")
+        for name, func in (
+            ("yaml.safe_load", pure_python),
+            ("loader", libyaml),
+            ("loader+cache", cached),
+        ):
+            elapsed = measure(func, args.repeat)
+            print(f"{name:<16} {elapsed * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Measure the logging overhead per activity, as seen by the thread running
+it, when the logger writes to the console and a log file directly and
+when records go through a queue handled by a background thread.
+
+Run it from the root of the repository with:
+
+    $ PYTHONPATH=. python tests/benchmarks/bench_logging.py [--activities N]
+
+The console output is written to a file in a temporary directory, once as
+fast as the disk allows and once with `--latency` added to every write, as
+a slow terminal or a console piped to a busy collector would. Activities
+are spaced by `--interval`, which is not measured, so that the queue has a
+chance to drain as it would during a real run.
+"""
+
+import argparse
+import logging
+import os.path
+import sys
+import tempfile
+import time
+from typing import TextIO
+
+from chaoslib.activity import execute_activity
+from chaoslib.log import configure_logger, flush_logger, stop_queue_listeners
+from chaoslib.types import Activity
+
+ACTIVITY: Activity = {
+    "type": "action",
+    "name": "exists",
+    "provider": {
+        "type": "python",
+        "module": "os.path",
+        "func": "exists",
+        "arguments": {"path": "/tmp"},
+    },
+}
+
+
+class SlowStream:
+    def __init__(self, stream: TextIO, latency: float):
+        self.stream = stream
+        self.latency = latency
+
+    def write(self, data: str) -> int:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.stream.write(data)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def reset_logger() -> None:
+    stop_queue_listeners()
+    logger = logging.getLogger("chaostoolkit")
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.addHandler(logging.NullHandler())
+
+
+def measure(activities: int, interval: float) -> float:
+    # warm the function lookup caches first
+    execute_activity({}, ACTIVITY, {}, {}, None)
+
+    elapsed = 0.0
+    for _ in range(activities):
+        start = time.perf_counter()
+        execute_activity({}, ACTIVITY, {}, {}, None)
+        elapsed += time.perf_counter() - start
+        time.sleep(interval)
+    return elapsed / activities
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--activities", type=int, default=1000)
+    parser.add_argument("--interval", type=float, default=0.002)
+    parser.add_argument("--latency", type=float, default=0.0002)
+    parser.add_argument("--queue-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    results = {}
+    stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as d:
+        for console_name, latency in (("fast", 0.0), ("slow", args.latency)):
+            with open(os.path.join(d, f"{console_name}.out"), "w") as console:
+                sys.stderr = SlowStream(console, latency)
+                try:
+                    reset_logger()
+                    results[(console_name, "no handlers")] = measure(
+                        args.activities, args.interval
+                    )
+                    for name, queue_size in (
+                        ("direct", None),
+                        ("queued", args.queue_size),
+                    ):
+                        reset_logger()
+                        configure_logger(
+                            verbose=True,
+                            log_file=os.path.join(d, f"{name}.log"),
+                            override_logzero_if_present=False,
+                            queue_size=queue_size,
+                        )
+                        results[(console_name, name)] = measure(
+                            args.activities, args.interval
+                        )
+                        flush_logger()
+                    reset_logger()
+                finally:
+                    sys.stderr = stderr
+
+    print(
+        f"{'console':<8} {'logger':<12} {'per activity':>14} {'overhead':>12}"
+    )
+    for console_name in ("fast", "slow"):
+        baseline = results[(console_name, "no handlers")]
+        for name in ("no handlers", "direct", "queued"):
+            per_activity = results[(console_name, name)]
+            overhead = per_activity - baseline
+            print(
+                f"{console_name:<8} {name:<12} {per_activity * 1e6:>12.1f}us "
+                f"{overhead * 1e6:>10.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from tempfile import NamedTemporaryFile
 import pytest
 from fixtures import experiments
 
+from chaoslib.control import unload_global_controls
 from chaoslib.log import configure_logger
 from chaoslib.settings import load_settings
 from chaoslib.types import Settings
@@ -48,3 +49,11 @@ def reset_env() -> None:
     finally:
         os.environ.clear()
         os.environ.update(e)
+
+
+@pytest.fixture(autouse=True)
+def reset_global_controls() -> None:
+    try:
+        yield
+    finally:
+        unload_global_controls()
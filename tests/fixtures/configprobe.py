@@ -1,2 +1,14 @@
+import time
+
+
 def raise_exception():
     raise RuntimeError("booom")
+
+
+def slow(seconds: float, value: str = "done"):
+    time.sleep(seconds)
+    return value
+
+
+def lookup(key: str, configuration=None):
+    return configuration[key]
@@ -1010,3 +1010,45 @@ ExperimentWithOnlyTopLevelControls["controls"] = [
         },
     },
 ]
+
+
+def _long_action(name: str, after: list[str] | None = None) -> dict:
+    action = {
+        "type": "action",
+        "name": name,
+        "provider": {
+            "type": "python",
+            "module": "fixtures.longpythonfunc",
+            "func": "be_long",
+            "arguments": {"howlong": 0.3},
+        },
+    }
+    if after is not None:
+        action["after"] = after
+    return action
+
+
+ExperimentWithActivityDependencies = {
+    "title": "do cats live in the Internet?",
+    "description": "an experiment of importance",
+    "method": [
+        _long_action("first"),
+        _long_action("second"),
+        _long_action("third", after=["first", "second"]),
+    ],
+}
+
+ExperimentWithCircularActivityDependencies = {
+    "title": "do cats live in the Internet?",
+    "description": "an experiment of importance",
+    "method": [
+        _long_action("first", after=["second"]),
+        _long_action("second", after=["first"]),
+    ],
+}
+
+ExperimentWithUnknownActivityDependency = {
+    "title": "do cats live in the Internet?",
+    "description": "an experiment of importance",
+    "method": [_long_action("first", after=["nope"])],
+}
@@ -0,0 +1,90 @@
+import os
+import sys
+
+from chaoslib.batch import BatchJob, run_batch, warm_worker
+
+
+def echo_experiment(title: str, value: str):
+    return {
+        "title": title,
+        "description": "n/a",
+        "method": [
+            {
+                "type": "probe",
+                "name": "echo",
+                "provider": {
+                    "type": "python",
+                    "module": "os.path",
+                    "func": "join",
+                    "arguments": {"a": value},
+                },
+            }
+        ],
+    }
+
+
+def settings_experiment():
+    return {
+        "title": "settings",
+        "description": "n/a",
+        "method": [
+            {
+                "type": "probe",
+                "name": "whoami",
+                "provider": {
+                    "type": "python",
+                    "module": "chaoslib.settings",
+                    "func": "get_loaded_settings",
+                },
+            }
+        ],
+    }
+
+
+def test_run_batch_aggregates_results_in_order():
+    received = []
+    summary = run_batch(
+        [
+            echo_experiment("first", "one"),
+            "/does/not/exist.json",
+            BatchJob(echo_experiment("third", "three")),
+        ],
+        max_workers=2,
+        on_result=received.append,
+    )
+
+    assert summary["total"] == 3
+    assert summary["statuses"] == {"completed": 2, "error": 1}
+    assert summary["deviated"] == 0
+    assert len(received) == 3
+    assert summary["durations"]["max"] >= summary["durations"]["min"]
+
+    first, missing, third = summary["results"]
+    assert first["source"] == "first"
+    assert first["journal"]["run"][0]["output"] == "one"
+    assert first["pid"] != os.getpid()
+    assert third["journal"]["run"][0]["output"] == "three"
+
+    assert missing["status"] == "error"
+    assert missing["journal"] is None
+    assert missing["error"]["type"] == "InvalidSource"
+
+
+def test_each_job_runs_with_its_own_settings():
+    summary = run_batch(
+        [
+            BatchJob(settings_experiment(), settings={"worker": "a"}),
+            BatchJob(settings_experiment()),
+        ],
+        settings={"worker": "default"},
+        max_workers=1,
+    )
+
+    outputs = [r["journal"]["run"][0]["output"] for r in summary["results"]]
+    assert outputs == [{"worker": "a"}, {"worker": "default"}]
+
+
+def test_warm_worker_imports_modules_and_ignores_failures():
+    sys.modules.pop("fixtures.keepempty", None)
+    warm_worker(["fixtures.keepempty", "fixtures.does_not_exist"])
+    assert "fixtures.keepempty" in sys.modules
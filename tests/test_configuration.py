@@ -1,6 +1,8 @@
 import json
 import os
+import sys
 import tempfile
+import time
 from unittest.mock import patch
 
 import pytest
@@ -372,6 +374,120 @@ def test_dynamic_configuration_can_be_used_next_key():
     assert config["shorten"] == "Hello [...]"
 
 
+def slow_probe(seconds: float, **arguments):
+    return {
+        "type": "probe",
+        "provider": {
+            "type": "python",
+            "module": "fixtures.configprobe",
+            "func": "slow",
+            "arguments": {"seconds": seconds, **arguments},
+        },
+    }
+
+
+def test_dynamic_configuration_probes_run_concurrently():
+    started = time.monotonic()
+    config = load_dynamic_configuration(
+        {f"slow{i}": slow_probe(0.3) for i in range(4)}, max_workers=4
+    )
+    elapsed = time.monotonic() - started
+
+    assert list(config) == ["slow0", "slow1", "slow2", "slow3"]
+    assert elapsed < 1.0
+
+
+def test_dynamic_configuration_waits_for_referenced_keys():
+    report = {}
+    config = load_dynamic_configuration(
+        {
+            "text": "hello world from earth",
+            "slow": slow_probe(0.2),
+            "capped": {
+                "type": "probe",
+                "provider": {
+                    "type": "python",
+                    "module": "string",
+                    "func": "capwords",
+                    "arguments": {"s": "${text}"},
+                },
+            },
+            "shorten": {
+                "type": "probe",
+                "provider": {
+                    "type": "python",
+                    "module": "textwrap",
+                    "func": "shorten",
+                    "arguments": {"text": "${capped}", "width": 12},
+                },
+            },
+        },
+        report=report,
+    )
+
+    assert list(config) == ["text", "slow", "capped", "shorten"]
+    assert config["shorten"] == "Hello [...]"
+    assert report["capped"]["depends_on"] == []
+    assert report["shorten"]["depends_on"] == ["capped"]
+    assert report["shorten"]["start"] >= report["capped"]["end"]
+    # not held back by the unrelated slow probe
+    assert report["shorten"]["end"] < report["slow"]["end"]
+
+
+def test_dynamic_configuration_probes_reading_the_configuration_wait():
+    report = {}
+    config = load_dynamic_configuration(
+        {
+            "slow": slow_probe(0.2, value="loaded"),
+            "static": "declared",
+            "read": {
+                "type": "probe",
+                "provider": {
+                    "type": "python",
+                    "module": "fixtures.configprobe",
+                    "func": "lookup",
+                    "arguments": {"key": "slow"},
+                },
+            },
+        },
+        report=report,
+    )
+
+    assert config["read"] == "loaded"
+    assert report["read"]["depends_on"] == ["slow"]
+
+
+def test_dynamic_configuration_reports_failures():
+    report = {}
+    config = load_dynamic_configuration(
+        {
+            "token": {
+                "type": "probe",
+                "provider": {
+                    "type": "python",
+                    "module": "fixtures.configprobe",
+                    "func": "raise_exception",
+                },
+            },
+            "status": {
+                "type": "probe",
+                "provider": {
+                    "type": "process",
+                    "path": sys.executable,
+                    "arguments": ["-c", "import sys; sys.exit(3)"],
+                },
+            },
+        },
+        report=report,
+    )
+
+    assert config == {}
+    assert report["token"]["status"] == "failed"
+    assert report["token"]["error"]
+    assert report["status"]["status"] == "failed"
+    assert report["token"]["duration"] >= 0
+
+
 def test_env_var_can_be_used_with_loading_dynamic_config(fixtures_dir: str):
     env_file = os.path.join(fixtures_dir, "env_vars_issue252.json")
     cfg_vars, _ = merge_vars(None, [env_file])
@@ -1,5 +1,6 @@
 import json
 import tempfile
+import threading
 from copy import deepcopy
 from unittest.mock import patch
 
@@ -8,17 +9,23 @@ from fixtures import experiments
 
 from chaoslib.activity import execute_activity
 from chaoslib.control import (
+    build_control_dispatch_table,
     cleanup_controls,
     cleanup_global_controls,
+    clear_control_dispatch_table,
     controls,
     get_all_activities,
     get_context_controls,
     get_global_controls,
+    global_controls,
     initialize_controls,
     initialize_global_controls,
     load_global_controls,
 )
-from chaoslib.control.python import validate_python_control
+from chaoslib.control.python import (
+    resolve_python_control,
+    validate_python_control,
+)
 from chaoslib.exceptions import InterruptExecution, InvalidActivity
 from chaoslib.experiment import ensure_experiment_is_valid, run_experiment
 from chaoslib.loader import load_experiment
@@ -297,7 +304,8 @@ def test_load_global_controls_from_settings():
     }
     load_global_controls(settings)
     run_experiment(exp, settings)
-    assert get_global_controls() == []
+    # still loaded for the runs to come
+    assert [c["name"] for c in get_global_controls()] == ["dummy"]
     assert exp["control-value"] == "hello there"
 
     for activity in activities:
@@ -307,6 +315,54 @@ def test_load_global_controls_from_settings():
         assert activity["after_activity_control"] is True
 
 
+def test_global_controls_loaded_on_one_thread_apply_to_runs_on_another():
+    settings = {
+        "dummy-key": "hello there",
+        "controls": {
+            "dummy": {
+                "provider": {
+                    "type": "python",
+                    "module": "fixtures.controls.dummy",
+                }
+            }
+        },
+    }
+    load_global_controls(settings)
+    for _ in range(2):
+        exp = deepcopy(experiments.ExperimentNoControls)
+        t = threading.Thread(target=run_experiment, args=(exp, settings))
+        t.start()
+        t.join()
+
+        # a run does not consume the controls loaded by the process
+        assert exp["control-value"] == "hello there"
+        for activity in get_all_activities(exp):
+            assert activity["before_activity_control"] is True
+            assert activity["after_activity_control"] is True
+
+
+def test_runs_do_not_pin_global_controls_in_the_caller_context():
+    settings = {
+        "dummy-key": "hello there",
+        "controls": {
+            "dummy": {
+                "provider": {
+                    "type": "python",
+                    "module": "fixtures.controls.dummy",
+                }
+            }
+        },
+    }
+    t = threading.Thread(target=load_global_controls, args=(settings,))
+    t.start()
+    t.join()
+
+    exp = deepcopy(experiments.ExperimentNoControls)
+    run_experiment(exp, settings)
+    assert exp["control-value"] == "hello there"
+    assert global_controls.get() is None
+
+
 def test_get_globally_loaded_controls_from_settings():
     assert get_global_controls() == []
 
@@ -355,7 +411,8 @@ def test_load_global_controls_from_settings_configured_via_exp_config():
     }
     load_global_controls(settings)
     run_experiment(exp, settings)
-    assert get_global_controls() == []
+    # still loaded for the runs to come
+    assert [c["name"] for c in get_global_controls()] == ["dummy"]
     assert exp["control-value"] == "blah blah"
 
     for activity in activities:
@@ -389,7 +446,8 @@ def test_apply_controls_even_on_background_activity():
     }
     load_global_controls(settings)
     run_experiment(exp, settings)
-    assert get_global_controls() == []
+    # still loaded for the runs to come
+    assert [c["name"] for c in get_global_controls()] == ["dummy"]
     assert exp["control-value"] == "hello there"
 
     for activity in activities:
@@ -724,3 +782,37 @@ def test_running_in_order():
             assert exp["position"] == [1, 2, 3]
     finally:
         cleanup_global_controls()
+
+
+def test_controls_are_resolved_once_per_run():
+    exp = deepcopy(experiments.ExperimentWithControls)
+    exp["dry"] = Dry.ACTIVITIES
+
+    with patch(
+        "chaoslib.control.resolve_python_control",
+        wraps=resolve_python_control,
+    ) as resolve:
+        run_experiment(exp)
+
+    # each level is resolved once per module, however many activities
+    # the controls are applied to
+    resolved = [c.args[1] for c in resolve.call_args_list]
+    assert "activity-before" in resolved
+    assert len(resolved) == len(set(resolved))
+    assert exp["after_experiment_control"] is True
+    for activity in get_all_activities(exp):
+        assert activity["after_activity_control"] is True
+
+
+def test_dispatch_table_applies_controls_of_unknown_contexts():
+    exp = deepcopy(experiments.ExperimentWithControls)
+    activity = deepcopy(get_all_activities(exp)[0])
+
+    build_control_dispatch_table(exp)
+    try:
+        with controls("activity", exp, context=activity):
+            assert activity["before_activity_control"] is True
+    finally:
+        clear_control_dispatch_table()
+
+    assert activity["after_activity_control"] is True
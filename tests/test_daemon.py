@@ -0,0 +1,115 @@
+import os
+import socket
+import stat
+import threading
+
+import pytest
+
+from chaoslib.daemon import RunnerDaemon, submit_experiment
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    path = str(tmp_path / "ctk.sock")
+    server = RunnerDaemon(path, settings={"worker": "daemon"})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(5)
+
+
+def echo_experiment(value: str):
+    return {
+        "title": "echo",
+        "description": "n/a",
+        "configuration": {"value": value},
+        "method": [
+            {
+                "type": "probe",
+                "name": "echo",
+                "provider": {
+                    "type": "python",
+                    "module": "os.path",
+                    "func": "join",
+                    "arguments": {"a": "${value}"},
+                },
+            }
+        ],
+    }
+
+
+def test_daemon_streams_events_and_journal(daemon):
+    records = list(
+        submit_experiment(
+            daemon.path,
+            echo_experiment("hello"),
+            experiment_vars={"configuration": {"value": "overridden"}},
+            timeout=10,
+        )
+    )
+
+    events = [r["event"] for r in records if r["type"] == "event"]
+    assert events[0] == "started"
+    assert "activity_completed" in events
+
+    last = records[-1]
+    assert last["type"] == "journal"
+    assert last["journal"]["status"] == "completed"
+    assert last["journal"]["run"][0]["output"] == "overridden"
+
+
+def test_daemon_runs_concurrent_requests(daemon):
+    results = {}
+
+    def submit(value: str) -> None:
+        records = list(
+            submit_experiment(daemon.path, echo_experiment(value), timeout=10)
+        )
+        results[value] = records[-1]["journal"]["run"][0]["output"]
+
+    threads = [
+        threading.Thread(target=submit, args=(str(i),)) for i in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+    assert results == {str(i): str(i) for i in range(4)}
+
+
+def test_daemon_reports_errors(daemon):
+    records = list(
+        submit_experiment(
+            daemon.path, source="/does/not/exist.json", timeout=10
+        )
+    )
+
+    assert len(records) == 1
+    assert records[0]["type"] == "error"
+    assert records[0]["error"]["type"] == "InvalidSource"
+
+
+def test_daemon_socket_is_private(daemon):
+    mode = stat.S_IMODE(os.stat(daemon.path).st_mode)
+    assert mode & 0o077 == 0
+
+
+def test_daemon_refuses_a_socket_in_use(daemon):
+    with pytest.raises(FileExistsError):
+        RunnerDaemon(daemon.path)
+
+
+def test_daemon_replaces_a_stale_socket(tmp_path):
+    path = str(tmp_path / "ctk.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    server = RunnerDaemon(path)
+    server.server_close()
+    assert not os.path.exists(path)
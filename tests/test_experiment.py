@@ -1,6 +1,8 @@
 import json
 import os
 import signal
+import subprocess
+import sys
 import tempfile
 import types
 from datetime import UTC, datetime
@@ -574,3 +576,68 @@ def test_pauses_must_be_numbers_or_substitution_pattern():
                 },
             }
         )
+
+
+def test_activity_dependencies_are_valid():
+    ensure_experiment_is_valid(experiments.ExperimentWithActivityDependencies)
+
+
+def test_activity_dependencies_cannot_be_circular():
+    with pytest.raises(InvalidExperiment) as exc:
+        ensure_experiment_is_valid(
+            experiments.ExperimentWithCircularActivityDependencies
+        )
+    assert "circular dependencies: first, second" in str(exc.value)
+
+
+def test_activity_dependencies_must_exist():
+    with pytest.raises(InvalidExperiment) as exc:
+        ensure_experiment_is_valid(
+            experiments.ExperimentWithUnknownActivityDependency
+        )
+    assert "'nope'" in str(exc.value)
+
+
+def test_activity_after_must_be_a_list_of_names():
+    with pytest.raises(InvalidActivity):
+        ensure_activity_is_valid(
+            {
+                "type": "action",
+                "name": "a",
+                "after": "b",
+                "provider": {
+                    "type": "python",
+                    "module": "os",
+                    "func": "getcwd",
+                },
+            }
+        )
+
+
+def test_validating_a_python_experiment_does_not_import_heavy_dependencies():
+    code = """
+import json, sys
+from chaoslib.experiment import ensure_experiment_is_valid
+ensure_experiment_is_valid({
+    "title": "python only",
+    "description": "n/a",
+    "method": [{
+        "type": "action",
+        "name": "join",
+        "provider": {"type": "python", "module": "os.path", "func": "join",
+                     "arguments": {"a": "b"}},
+    }],
+})
+heavy = ["charset_normalizer", "hvac", "jsonpath2", "pythonjsonlogger",
+         "requests", "urllib3", "yaml"]
+print(json.dumps([m for m in heavy if m in sys.modules]))
+"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    p = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=root,
+    )
+    assert json.loads(p.stdout.splitlines()[-1]) == []
@@ -0,0 +1,140 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests_mock
+
+from chaoslib.provider.http import (
+    SessionPool,
+    get_session_pool,
+    run_http_activity,
+)
+
+
+def get(pool: SessionPool, url: str, **kwargs):
+    with pool.session(url, **kwargs) as s:
+        return s
+
+
+def test_session_is_reused_for_same_host():
+    pool = SessionPool()
+    s1 = get(pool, "http://example.com/a")
+    s2 = get(pool, "http://example.com/b?q=1")
+    assert s1 is s2
+    assert pool.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "sessions": 1,
+    }
+
+
+def test_session_differs_per_host_tls_and_retries():
+    pool = SessionPool()
+    s = get(pool, "http://example.com")
+    assert get(pool, "https://example.com") is not s
+    assert get(pool, "http://example.com:8080") is not s
+    assert get(pool, "http://example.com", verify_tls=False) is not s
+    assert get(pool, "http://example.com", max_retries=2) is not s
+    assert pool.stats()["misses"] == 5
+
+
+def test_least_recently_used_session_is_evicted():
+    pool = SessionPool(max_sessions=2)
+    a = get(pool, "http://a.com")
+    get(pool, "http://b.com")
+    get(pool, "http://a.com")
+    get(pool, "http://c.com")
+    assert pool.stats()["evictions"] == 1
+    assert pool.stats()["sessions"] == 2
+    assert get(pool, "http://a.com") is a
+
+
+def test_idle_sessions_are_evicted():
+    pool = SessionPool(idle_timeout=0.000001)
+    a = get(pool, "http://a.com")
+    assert get(pool, "http://a.com") is not a
+    assert pool.stats()["evictions"] == 1
+
+
+def test_sessions_in_use_are_not_evicted():
+    pool = SessionPool(max_sessions=1, idle_timeout=0.000001)
+    with pool.session("http://a.com") as a:
+        with pool.session("http://a.com") as again:
+            assert again is a
+        get(pool, "http://b.com")
+        assert pool.stats()["evictions"] == 0
+        assert pool.stats()["sessions"] == 2
+
+    # released, it may go now
+    get(pool, "http://c.com")
+    assert pool.stats()["evictions"] == 2
+    assert pool.stats()["sessions"] == 1
+
+
+def test_close_drops_all_sessions():
+    pool = SessionPool()
+    get(pool, "http://a.com")
+    get(pool, "http://b.com")
+    pool.close()
+    assert pool.stats()["sessions"] == 0
+
+
+class CookieHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        if self.path == "/login":
+            self.send_header("Set-Cookie", "session=secret; Path=/")
+        body = (self.headers.get("Cookie") or "anonymous").encode("utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_cookies_are_not_shared_between_activities():
+    pool = get_session_pool()
+    pool.close()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CookieHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        run_http_activity(
+            {"type": "action", "provider": {"url": f"{url}/login"}},
+            None,
+            None,
+        )
+        result = run_http_activity(
+            {"type": "probe", "provider": {"url": f"{url}/whoami"}},
+            None,
+            None,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+        pool.close()
+
+    assert result["body"] == "anonymous"
+
+
+def test_http_activity_uses_the_session_pool():
+    pool = get_session_pool()
+    pool.close()
+    before = pool.stats()
+
+    activity = {
+        "type": "probe",
+        "name": "get",
+        "provider": {"type": "http", "url": "http://example.com"},
+    }
+    with requests_mock.mock() as m:
+        m.get("http://example.com", status_code=200, text="hello")
+        run_http_activity(activity, None, None)
+        run_http_activity(activity, None, None)
+
+    after = pool.stats()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+    pool.close()
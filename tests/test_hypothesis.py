@@ -0,0 +1,89 @@
+from chaoslib.hypothesis import run_steady_state_hypothesis
+from chaoslib.run import EventHandlerRegistry
+
+
+def slow_probe(name: str, howlong: float = 0.3):
+    return {
+        "name": name,
+        "type": "probe",
+        "tolerance": {"type": "range", "range": [0, 1000]},
+        "provider": {
+            "type": "python",
+            "module": "fixtures.longpythonfunc",
+            "func": "be_long",
+            "arguments": {"howlong": howlong},
+        },
+    }
+
+
+def failing_probe(name: str):
+    return {
+        "name": name,
+        "type": "probe",
+        "tolerance": 10,
+        "provider": {
+            "type": "python",
+            "module": "statistics",
+            "func": "mean",
+            "arguments": {"data": [1, 3]},
+        },
+    }
+
+
+def test_probes_can_run_concurrently():
+    probes = [slow_probe(f"probe-{i}") for i in range(4)]
+    experiment = {
+        "steady-state-hypothesis": {"title": "hello", "probes": probes}
+    }
+
+    state = run_steady_state_hypothesis(
+        experiment, {}, {}, None, EventHandlerRegistry(), max_workers=4
+    )
+
+    assert state["steady_state_met"] is True
+    # all of them were running at once
+    runs = state["probes"]
+    assert max(r["start"] for r in runs) < min(r["end"] for r in runs)
+    assert [r["activity"]["name"] for r in state["probes"]] == [
+        "probe-0",
+        "probe-1",
+        "probe-2",
+        "probe-3",
+    ]
+
+
+def test_pending_probes_are_cancelled_when_one_deviates():
+    probes = [
+        slow_probe("slow-0", 0.5),
+        failing_probe("failing"),
+        slow_probe("slow-1"),
+        slow_probe("slow-2"),
+    ]
+    experiment = {
+        "steady-state-hypothesis": {"title": "hello", "probes": probes}
+    }
+
+    state = run_steady_state_hypothesis(
+        experiment, {}, {}, None, EventHandlerRegistry(), max_workers=2
+    )
+
+    assert state["steady_state_met"] is False
+    assert [r["activity"]["name"] for r in state["probes"]] == [
+        "slow-0",
+        "failing",
+    ]
+    assert state["probes"][-1]["tolerance_met"] is False
+
+
+def test_probes_run_sequentially_by_default():
+    probes = [failing_probe("failing"), slow_probe("slow-0")]
+    experiment = {
+        "steady-state-hypothesis": {"title": "hello", "probes": probes}
+    }
+
+    state = run_steady_state_hypothesis(
+        experiment, {}, {}, None, EventHandlerRegistry()
+    )
+
+    assert state["steady_state_met"] is False
+    assert len(state["probes"]) == 1
@@ -0,0 +1,145 @@
+import json
+import os.path
+from copy import deepcopy
+from tempfile import TemporaryDirectory
+
+import pytest
+from fixtures import experiments
+
+from chaoslib.experiment import run_experiment
+from chaoslib.journal import JournalStreamWriter, rebuild_journal
+from chaoslib.run import Runner
+from chaoslib.types import Schedule, Strategy
+
+
+def run_with_writer(
+    strategy: Strategy,
+    schedule: Schedule | None = None,
+    experiment: dict | None = None,
+    settings: dict | None = None,
+    **kwargs,
+) -> tuple:
+    if schedule is None:
+        schedule = Schedule(continuous_hypothesis_frequency=0.1)
+    if experiment is None:
+        experiment = deepcopy(experiments.SimpleExperiment)
+
+    with TemporaryDirectory() as d:
+        path = os.path.join(d, "journal.jsonl")
+        writer = JournalStreamWriter(path, **kwargs)
+        with Runner(strategy, schedule) as runner:
+            runner.register_event_handler(writer)
+            journal = runner.run(experiment, settings=settings or {})
+
+        with open(path) as f:
+            records = [json.loads(line) for line in f]
+
+        return journal, writer, records, rebuild_journal(path)
+
+
+def test_stream_records_runs_and_states():
+    _, writer, records, _ = run_with_writer(Strategy.DEFAULT)
+
+    types = [r["type"] for r in records]
+    assert types[0] == "started"
+    assert types[-1] == "finished"
+    assert types.count("run") == 3
+    phases = [r["phase"] for r in records if r["type"] == "hypothesis"]
+    assert phases == ["before", "after"]
+    assert writer.summary["status"] == "completed"
+    assert writer.summary["runs"] == {"succeeded": 3}
+
+
+def test_rebuild_journal_from_stream():
+    journal, _, _, rebuilt = run_with_writer(Strategy.DEFAULT)
+
+    assert rebuilt["status"] == journal["status"]
+    assert rebuilt["deviated"] == journal["deviated"]
+    assert rebuilt["duration"] == journal["duration"]
+    assert [r["activity"]["name"] for r in rebuilt["run"]] == [
+        r["activity"]["name"] for r in journal["run"]
+    ]
+    assert rebuilt["steady_states"]["before"] == json.loads(
+        json.dumps(journal["steady_states"]["before"])
+    )
+
+
+def test_continuous_hypothesis_states_are_not_kept_in_memory():
+    journal, writer, _, rebuilt = run_with_writer(
+        Strategy.CONTINUOUS,
+        Schedule(continuous_hypothesis_frequency=0.1, history_size=0),
+    )
+
+    assert journal["steady_states"]["during"] == []
+    iterations = writer.summary["hypothesis_iterations"]
+    assert iterations > 0
+    assert len(rebuilt["steady_states"]["during"]) == iterations
+
+
+def test_continuous_hypothesis_states_are_kept_in_memory_by_default():
+    journal, _, _, rebuilt = run_with_writer(
+        Strategy.CONTINUOUS, fsync=True, batch_size=1
+    )
+
+    assert len(journal["steady_states"]["during"]) == len(
+        rebuilt["steady_states"]["during"]
+    )
+
+
+@pytest.mark.parametrize(
+    "schedule,settings",
+    [
+        (
+            Schedule(continuous_hypothesis_frequency=0.1),
+            {"runtime": {"events": {"dispatch": "async"}}},
+        ),
+        (
+            Schedule(
+                continuous_hypothesis_frequency=0.1,
+                mode="fixed-rate",
+                overrun="concurrent",
+                max_in_flight=2,
+            ),
+            {},
+        ),
+    ],
+)
+def test_runs_of_probes_shared_with_the_method_are_told_apart(
+    schedule: Schedule, settings: dict
+):
+    # the very same probe is declared in the hypothesis and the method
+    experiment = deepcopy(experiments.SimpleExperiment)
+    probe = experiment["steady-state-hypothesis"]["probes"][0]
+    experiment["method"].insert(0, probe)
+
+    journal, writer, records, _ = run_with_writer(
+        Strategy.CONTINUOUS, schedule, experiment, settings
+    )
+
+    runs = [r for r in records if r["type"] == "run"]
+    method = [r["run"] for r in runs if r["phase"] == "method"]
+    assert [r["activity"]["name"] for r in method] == [
+        r["activity"]["name"] for r in journal["run"]
+    ]
+    iterations = writer.summary["hypothesis_iterations"]
+    assert iterations > 0
+    hypothesis = [r for r in runs if r["phase"] == "hypothesis"]
+    # the states before and after, and those of each iteration
+    assert len(hypothesis) == iterations + 2
+
+
+def test_method_steps_referring_to_hypothesis_probes_are_method_runs():
+    experiment = deepcopy(experiments.SimpleExperiment)
+    probe = experiment["steady-state-hypothesis"]["probes"][0]
+    experiment["method"].append({"ref": probe["name"]})
+
+    with TemporaryDirectory() as d:
+        path = os.path.join(d, "journal.jsonl")
+        journal = run_experiment(
+            experiment, {}, event_handlers=[JournalStreamWriter(path)]
+        )
+        rebuilt = rebuild_journal(path)
+
+    names = [r["activity"]["name"] for r in journal["run"]]
+    assert names == ["say-hello", probe["name"]]
+    assert [r["activity"]["name"] for r in rebuilt["run"]] == names
@@ -1,6 +1,7 @@
 import json
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -174,3 +175,105 @@ def test_load_from_http_with_auth_from_env(
                 pytest.fail(str(x))
     finally:
         os.environ.pop("CHAOSTOOLKIT_LOADER_AUTH_BEARER_TOKEN", None)
+
+
+def test_parsed_experiments_can_be_cached(tmp_path):
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "experiment.yaml"
+    path.write_text(experiments.YamlExperiment)
+
+    parsed = parse_experiment_from_file(str(path), str(cache_dir))
+    assert len(os.listdir(cache_dir)) == 1
+
+    with patch("chaoslib.loader.yaml_safe_load") as load:
+        assert parse_experiment_from_file(str(path), str(cache_dir)) == parsed
+    load.assert_not_called()
+
+
+def test_cached_experiment_is_ignored_once_the_file_changed(tmp_path):
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "experiment.json"
+    path.write_text(json.dumps({"title": "before"}))
+    parse_experiment_from_file(str(path), str(cache_dir))
+
+    path.write_text(json.dumps({"title": "after"}))
+    parsed = parse_experiment_from_file(str(path), str(cache_dir))
+    assert parsed == {"title": "after"}
+
+
+def test_load_experiment_uses_the_cache_from_settings(
+    tmp_path, generic_experiment: str
+):
+    settings = {"runtime": {"loader": {"cache": str(tmp_path)}}}
+    load_experiment(generic_experiment, settings)
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_experiments_which_cannot_be_marshalled_are_not_cached(tmp_path):
+    path = tmp_path / "experiment.yaml"
+    path.write_text("title: hello\ndate: 2024-01-01\n")
+
+    parsed = parse_experiment_from_file(str(path), str(tmp_path / "cache"))
+    assert parsed["title"] == "hello"
+    assert not (tmp_path / "cache").exists()
+
+
+def test_http_cache_sends_conditional_requests(tmp_path):
+    url = "http://example.com/cached.json"
+    settings = {"runtime": {"loader": {"http_cache": str(tmp_path)}}}
+    with requests_mock.mock() as m:
+        m.get(
+            url,
+            status_code=200,
+            headers={"Content-Type": "application/json", "ETag": '"v1"'},
+            text=json.dumps({"title": "cached"}),
+        )
+        assert load_experiment(url, settings) == {"title": "cached"}
+
+        m.get(
+            url,
+            status_code=304,
+            request_headers={"If-None-Match": '"v1"'},
+        )
+        assert load_experiment(url, settings) == {"title": "cached"}
+        assert m.call_count == 2
+
+
+def test_http_cache_serves_fresh_entries_without_requests(tmp_path):
+    url = "http://example.com/fresh.json"
+    settings = {
+        "runtime": {
+            "loader": {"http_cache": {"path": str(tmp_path), "max_age": 60}}
+        }
+    }
+    with requests_mock.mock() as m:
+        m.get(
+            url,
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            text=json.dumps({"title": "fresh"}),
+        )
+        load_experiment(url, settings)
+        assert load_experiment(url, settings) == {"title": "fresh"}
+        assert m.call_count == 1
+
+
+def test_http_cache_is_keyed_by_credentials(tmp_path):
+    url = "http://example.com/private.json"
+    cache = {"path": str(tmp_path), "max_age": 60}
+    with requests_mock.mock() as m:
+        m.get(
+            url,
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            text=json.dumps({"title": "private"}),
+        )
+        for token in ("abc", "xyz"):
+            settings = {
+                "auths": {"example.com": {"type": "bearer", "value": token}},
+                "runtime": {"loader": {"http_cache": cache}},
+            }
+            load_experiment(url, settings)
+
+        assert m.call_count == 2
+        assert len(os.listdir(tmp_path)) == 2
@@ -0,0 +1,134 @@
+import logging
+import os
+import subprocess
+import sys
+import threading
+from logging.handlers import QueueHandler
+
+import pytest
+
+from chaoslib.log import configure_logger, flush_logger, stop_queue_listeners
+from chaoslib.payload import log_payload
+
+
+@pytest.fixture
+def queued_logger(tmp_path):
+    name = "chaostoolkit-queued"
+    log_file = str(tmp_path / "chaostoolkit.log")
+    configure_logger(
+        log_file=log_file,
+        logger_name=name,
+        override_logzero_if_present=False,
+        queue_size=8,
+    )
+    logger = logging.getLogger(name)
+    try:
+        yield logger, log_file
+    finally:
+        stop_queue_listeners()
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.filters.clear()
+
+
+def test_queued_logger_writes_every_record(queued_logger):
+    logger, log_file = queued_logger
+
+    def log(index: int) -> None:
+        for i in range(50):
+            logger.debug("thread %d record %d", index, i)
+
+    threads = [threading.Thread(target=log, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+
+    flush_logger(logger.name)
+    with open(log_file) as f:
+        content = f.read()
+
+    assert content.count(" record ") == 200
+    assert "thread 3 record 49" in content
+    assert "ValueError: boom" in content
+
+
+def test_queued_logger_is_flushed_and_detached_when_stopped(queued_logger):
+    logger, log_file = queued_logger
+    for i in range(20):
+        logger.info("record %d", i)
+
+    stop_queue_listeners()
+
+    with open(log_file) as f:
+        assert f.read().count(" record ") == 20
+    assert not [h for h in logger.handlers if isinstance(h, QueueHandler)]
+
+
+class CountedRepr:
+    def __init__(self):
+        self.threads = []
+
+    def __repr__(self) -> str:
+        self.threads.append(threading.get_ident())
+        return "counted"
+
+
+def test_queued_logger_renders_payloads_as_they_are_logged(tmp_path):
+    name = "chaostoolkit-queued-payload"
+    log_file = str(tmp_path / "chaostoolkit.log")
+    configure_logger(
+        log_file=log_file,
+        log_file_level="info",
+        logger_name=name,
+        override_logzero_if_present=False,
+        queue_size=8,
+    )
+    logger = logging.getLogger(name)
+    try:
+        skipped = CountedRepr()
+        logger.debug("payload %s", log_payload([skipped]))
+        written = CountedRepr()
+        state = {"status": "before"}
+        logger.info("payload %s %s", log_payload([written]), log_payload(state))
+        # the run keeps going and changes what it logged
+        state["status"] = "after"
+        flush_logger(name)
+    finally:
+        stop_queue_listeners()
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+
+    assert skipped.threads == []
+    assert written.threads == [threading.get_ident()]
+    with open(log_file) as f:
+        assert "payload [counted] {'status': 'before'}" in f.read()
+
+
+@pytest.mark.parametrize("ending", ["sys.exit(3)", "raise KeyboardInterrupt()"])
+def test_queued_logger_is_flushed_on_exit(tmp_path, ending: str):
+    log_file = str(tmp_path / "chaostoolkit.log")
+    code = f"""
+import sys
+import logging
+from chaoslib.log import configure_logger
+configure_logger(log_file={log_file!r}, queue_size=4)
+logger = logging.getLogger("chaostoolkit")
+for i in range(500):
+    logger.info("record %d", i)
+{ending}
+"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, cwd=root, check=False
+    )
+
+    with open(log_file) as f:
+        content = f.read()
+    assert content.count(" record ") == 500
+    assert "record 499" in content
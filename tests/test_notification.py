@@ -1,3 +1,5 @@
+import json
+import time
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
@@ -10,8 +12,11 @@ from chaoslib.exceptions import ChaosException
 from chaoslib.notification import (
     DiscoverFlowEvent,
     InitFlowEvent,
+    NotificationDispatcher,
     RunFlowEvent,
     ValidateFlowEvent,
+    close_notification_dispatcher,
+    get_notification_dispatcher,
     notify,
     notify_with_http,
 )
@@ -397,3 +402,131 @@ def test_notify_via_plugin_gracefully_handles_failure_in_invoked_func(
         "failed calling notification plugin",
         exc_info=callee.InstanceOf(Exception),
     )
+
+
+@responses.activate
+def test_notify_async_encodes_payload_once_for_all_channels() -> None:
+    responses.add(method=responses.POST, url="http://first.com")
+    responses.add(method=responses.POST, url="http://second.com")
+    settings = {
+        "runtime": {"notifications": {"dispatch": "async"}},
+        "notifications": [
+            {"type": "http", "url": "http://first.com"},
+            {"type": "http", "url": "http://second.com"},
+        ],
+    }
+
+    try:
+        with patch(
+            "chaoslib.notification.json.dumps", wraps=json.dumps
+        ) as dumps:
+            notify(settings, RunFlowEvent.RunStarted, {"key": "value"})
+        assert dumps.call_count == 1
+    finally:
+        close_notification_dispatcher()
+
+    assert len(responses.calls) == 2
+    for call in responses.calls:
+        body = json.loads(call.request.body)
+        assert body["name"] == "run-started"
+        assert body["payload"] == {"key": "value"}
+
+
+@responses.activate
+def test_notification_dispatcher_batches_events_per_channel() -> None:
+    responses.add(method=responses.POST, url="http://batch.com")
+    channel = {"type": "http", "url": "http://batch.com", "batch_size": 10}
+
+    dispatcher = NotificationDispatcher(batch_interval=0.2)
+    for index in range(3):
+        dispatcher.submit([channel], {"name": "run-started", "index": index})
+    dispatcher.close()
+
+    assert len(responses.calls) == 1
+    body = json.loads(responses.calls[0].request.body)
+    assert [e["index"] for e in body] == [0, 1, 2]
+    assert dispatcher.stats()["sent"] == 3
+
+
+@responses.activate
+def test_notification_dispatcher_batches_events_until_the_interval_elapsed():
+    responses.add(method=responses.POST, url="http://batch.com")
+    channel = {"type": "http", "url": "http://batch.com", "batch_size": 10}
+
+    dispatcher = NotificationDispatcher(batch_interval=1)
+    try:
+        for index in range(3):
+            # the background thread is waiting on the batch meanwhile
+            dispatcher.submit(
+                [channel], {"name": "run-started", "index": index}
+            )
+            time.sleep(0.1)
+
+        deadline = time.monotonic() + 10
+        while dispatcher.stats()["sent"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        dispatcher.close()
+
+    assert len(responses.calls) == 1
+    body = json.loads(responses.calls[0].request.body)
+    assert [e["index"] for e in body] == [0, 1, 2]
+
+
+def test_notification_dispatcher_warns_about_ignored_settings() -> None:
+    try:
+        dispatcher = get_notification_dispatcher({"retries": 2})
+        with patch("chaoslib.notification.logger") as logger:
+            assert get_notification_dispatcher({"retries": 2}) is dispatcher
+            logger.warning.assert_not_called()
+
+            assert get_notification_dispatcher({"retries": 5}) is dispatcher
+            assert get_notification_dispatcher({"retries": 5}) is dispatcher
+            logger.warning.assert_called_once()
+    finally:
+        close_notification_dispatcher()
+
+
+@responses.activate
+def test_notification_dispatcher_retries_with_backoff() -> None:
+    url = "http://flaky.com"
+    responses.add(method=responses.POST, url=url, status=503)
+    responses.add(method=responses.POST, url=url, status=200)
+
+    dispatcher = NotificationDispatcher(retries=2, backoff=0.01)
+    dispatcher.submit([{"type": "http", "url": url}], {"name": "run-failed"})
+    dispatcher.close()
+
+    assert len(responses.calls) == 2
+    assert dispatcher.stats() == {
+        "pending": 0,
+        "sent": 1,
+        "failed": 0,
+        "dropped": 0,
+    }
+
+
+@responses.activate
+def test_notification_dispatcher_drains_within_its_deadline() -> None:
+    url = "http://slow.com"
+
+    def slow(request):
+        time.sleep(0.3)
+        return (200, {}, "")
+
+    responses.add_callback(method=responses.POST, url=url, callback=slow)
+
+    dispatcher = NotificationDispatcher(drain_timeout=0.5)
+    channel = {"type": "http", "url": url}
+    for _ in range(5):
+        dispatcher.submit([channel], {"name": "run-completed"})
+
+    start = time.monotonic()
+    dispatcher.close()
+
+    assert time.monotonic() - start < 1.0
+    # what is left is dropped by the background thread once its current
+    # request completes
+    stats = dispatcher.stats()
+    assert stats["sent"] < 5
+    assert stats["sent"] + stats["dropped"] + stats["pending"] == 5
@@ -0,0 +1,105 @@
+import logging
+
+from chaoslib.activity import execute_activity
+from chaoslib.payload import (
+    get_payload_log_budget,
+    log_payload,
+    render_payload,
+    set_payload_log_budget,
+)
+
+
+class CountedRepr:
+    def __init__(self):
+        self.calls = 0
+
+    def __repr__(self) -> str:
+        self.calls += 1
+        return "counted"
+
+
+def test_small_payloads_render_as_str():
+    assert render_payload("hello", 64) == "hello"
+    assert render_payload(None, 64) == "None"
+    value = {"a": [1, "b", (2,)], "c": b"d", "e": None}
+    assert render_payload(value, 64) == str(value)
+
+
+def test_large_strings_are_truncated_with_a_marker():
+    rendered = render_payload("x" * 1_000_000, 16)
+    assert rendered == "x" * 16 + "... [truncated, 1000000 characters]"
+
+
+def test_budget_is_counted_in_bytes():
+    rendered = render_payload("é" * 100, 9)
+    assert rendered.startswith("éééé...")
+    assert len(rendered.split("...")[0].encode("utf-8")) <= 9
+
+
+def test_large_containers_are_truncated_with_a_marker():
+    output = {"status": 0, "stdout": "a" * 10_000_000, "stderr": ""}
+    rendered = render_payload(output, 32)
+    assert rendered.startswith("{'status': 0, 'stdout': 'aaa")
+    assert rendered.endswith("... [truncated]")
+    assert len(rendered) < 64
+
+    rendered = render_payload(list(range(1_000_000)), 16)
+    assert rendered == "[0, 1, 2, 3, 4, ... [truncated]"
+
+
+def test_containers_holding_themselves_render_as_str():
+    items = []
+    items.append(items)
+    mapping = {"items": items}
+    mapping["self"] = mapping
+    assert render_payload(items, 64) == str(items)
+    assert render_payload(mapping, 64) == str(mapping)
+    # the same container twice, but not within itself, is rendered twice
+    assert render_payload([mapping, mapping], 128) == str([mapping, mapping])
+
+
+def test_budget_of_zero_disables_truncation():
+    assert render_payload("x" * 1000, 0) == "x" * 1000
+
+
+def test_payload_is_not_rendered_when_not_logged():
+    logger = logging.getLogger("chaostoolkit-payload")
+    logger.setLevel(logging.INFO)
+    value = CountedRepr()
+    logger.debug("payload %s", log_payload([value]))
+    assert value.calls == 0
+
+
+def test_payload_budget_can_be_changed():
+    try:
+        set_payload_log_budget(4)
+        assert get_payload_log_budget() == 4
+        assert str(log_payload("abcdefgh")) == (
+            "abcd... [truncated, 8 characters]"
+        )
+        assert str(log_payload("abcdefgh", budget=8)) == "abcdefgh"
+    finally:
+        set_payload_log_budget(None)
+    assert get_payload_log_budget() == 4096
+
+
+def test_activity_output_is_logged_within_budget(caplog):
+    activity = {
+        "type": "probe",
+        "name": "large-output",
+        "provider": {
+            "type": "python",
+            "module": "fixtures.configprobe",
+            "func": "slow",
+            "arguments": {"seconds": 0, "value": "x" * 1_000_000},
+        },
+    }
+    with caplog.at_level(logging.DEBUG, logger="chaostoolkit"):
+        run = execute_activity({}, activity, {}, {}, None)
+
+    assert len(run["output"]) == 1_000_000
+    messages = [r.getMessage() for r in caplog.records]
+    logged = [m for m in messages if "succeeded with" in m]
+    assert len(logged) == 1
+    assert "[truncated, 1000000 characters]" in logged[0]
+    assert len(logged[0]) < 4096 + 100
@@ -1,12 +1,25 @@
 import locale
 import os.path
+import signal
 import stat
+import subprocess
 import sys
+import time
 from unittest.mock import patch
 
 import pytest
 
-from chaoslib.provider.process import run_process_activity
+from chaoslib.exceptions import (
+    ActivityFailed,
+    InterruptExecution,
+    InvalidActivity,
+)
+from chaoslib.provider.process import (
+    clear_executable_cache,
+    resolve_executable,
+    run_process_activity,
+    validate_process_activity,
+)
 
 pytestmark = pytest.mark.skipif(
     sys.platform != "linux", reason="only run these on Linux"
@@ -126,3 +139,226 @@ def test_process_non_exit_zero_warning(logger):
         "This process returned a non-zero exit code."
         in logger.warning.call_args[0][0]
     )
+
+
+def test_process_capture_keeps_head_and_tail():
+    result = run_process_activity(
+        {
+            "provider": {
+                "type": "process",
+                "path": sys.executable,
+                "arguments": [
+                    "-c",
+                    (
+                        "import sys; sys.stdout.write('a' * 10 + 'b' * 5000 + "
+                        "'c' * 10); sys.stderr.write('oops')"
+                    ),
+                ],
+                "capture": {"max_bytes": 20},
+            }
+        },
+        None,
+        None,
+    )
+
+    assert result["status"] == 0
+    assert result["stdout"] == (
+        "a" * 10 + "\n[... 5000 bytes truncated ...]\n" + "c" * 10
+    )
+    assert result["stdout_truncated"] is True
+    assert result["stdout_file"] is None
+    assert result["stderr"] == "oops"
+    assert result["stderr_truncated"] is False
+
+
+def test_process_capture_spills_truncated_output_to_disk():
+    result = run_process_activity(
+        {
+            "provider": {
+                "type": "process",
+                "path": sys.executable,
+                "arguments": [
+                    "-c",
+                    (
+                        "import sys; sys.stdout.write('x' * 200000); "
+                        "sys.stderr.write('oops')"
+                    ),
+                ],
+                "capture": {"spill": True, "stdout": {"max_bytes": 100}},
+            }
+        },
+        None,
+        None,
+    )
+
+    try:
+        assert result["stdout_truncated"] is True
+        assert len(result["stdout"]) < 200
+        with open(result["stdout_file"]) as f:
+            assert f.read() == "x" * 200000
+
+        # the whole stderr fits in memory so there is nothing to keep
+        assert result["stderr"] == "oops"
+        assert result["stderr_file"] is None
+    finally:
+        os.remove(result["stdout_file"])
+
+
+def test_process_capture_timeout_removes_spill_files(tmp_path):
+    with (
+        patch("tempfile.tempdir", str(tmp_path)),
+        pytest.raises(ActivityFailed),
+    ):
+        run_process_activity(
+            {
+                "provider": {
+                    "type": "process",
+                    "path": sys.executable,
+                    "arguments": ["-c", "import time; time.sleep(5)"],
+                    "timeout": 0.2,
+                    "capture": {"spill": True},
+                }
+            },
+            None,
+            None,
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_process_capture_interrupted_kills_the_process(tmp_path):
+    procs = []
+    wait = subprocess.Popen.wait
+
+    def interrupted_wait(proc, timeout=None):
+        if not procs:
+            procs.append(proc)
+            raise InterruptExecution("interrupted")
+        return wait(proc, timeout)
+
+    with (
+        patch("tempfile.tempdir", str(tmp_path)),
+        patch.object(subprocess.Popen, "wait", interrupted_wait),
+        pytest.raises(InterruptExecution),
+    ):
+        run_process_activity(
+            {
+                "provider": {
+                    "type": "process",
+                    "path": sys.executable,
+                    "arguments": ["-c", "import time; time.sleep(30)"],
+                    "capture": {"spill": True},
+                }
+            },
+            None,
+            None,
+        )
+
+    assert procs[0].returncode == -signal.SIGKILL
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_process_capture_does_not_wait_for_children_holding_the_output():
+    # the child outlives the process and keeps its stdout and stderr open
+    code = (
+        "import subprocess; "
+        "p = subprocess.Popen(['sleep', '30']); "
+        "print(p.pid, flush=True)"
+    )
+    start = time.monotonic()
+    result = run_process_activity(
+        {
+            "provider": {
+                "type": "process",
+                "path": sys.executable,
+                "arguments": ["-c", code],
+                "capture": {"max_bytes": 1024},
+            }
+        },
+        None,
+        None,
+    )
+    os.kill(int(result["stdout"].split()[0]), signal.SIGKILL)
+
+    assert time.monotonic() - start < 10
+    assert result["status"] == 0
+    assert result["stdout_truncated"] is True
+    assert "still open" in result["stdout"]
+
+
+def test_process_capture_timeout_does_not_wait_for_children():
+    start = time.monotonic()
+    with pytest.raises(ActivityFailed):
+        run_process_activity(
+            {
+                "provider": {
+                    "type": "process",
+                    "path": "sh",
+                    "arguments": "-c 'sleep 10 & sleep 10'",
+                    "timeout": 0.2,
+                    "capture": {"max_bytes": 1024},
+                }
+            },
+            None,
+            None,
+        )
+    assert time.monotonic() - start < 8
+
+
+@pytest.mark.parametrize("max_bytes", [-1, 0])
+def test_process_capture_max_bytes_must_be_positive(max_bytes: int):
+    with pytest.raises(InvalidActivity):
+        validate_process_activity(
+            {
+                "name": "run",
+                "provider": {
+                    "type": "process",
+                    "path": sys.executable,
+                    "capture": {"stdout": {"max_bytes": max_bytes}},
+                },
+            }
+        )
+
+
+@pytest.mark.parametrize(
+    "capture", [{"maxbytes": 1}, {"stdout": {"maxbytes": 1}}]
+)
+def test_process_capture_rejects_unknown_keys(capture: dict):
+    with pytest.raises(InvalidActivity):
+        validate_process_activity(
+            {
+                "name": "run",
+                "provider": {
+                    "type": "process",
+                    "path": sys.executable,
+                    "capture": capture,
+                },
+            }
+        )
+
+
+def test_process_capture_must_be_a_mapping():
+    with pytest.raises(InvalidActivity):
+        validate_process_activity(
+            {
+                "name": "run",
+                "provider": {
+                    "type": "process",
+                    "path": sys.executable,
+                    "capture": {"stdout": {"max_bytes": -1}},
+                },
+            }
+        )
+
+
+def test_executables_are_resolved_once():
+    clear_executable_cache()
+    try:
+        with patch(
+            "chaoslib.provider.process.shutil.which", return_value="/bin/ls"
+        ) as which:
+            assert resolve_executable("ls") == "/bin/ls"
+            assert resolve_executable("ls") == "/bin/ls"
+        which.assert_called_once_with("ls")
+    finally:
+        clear_executable_cache()
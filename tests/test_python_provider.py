@@ -0,0 +1,80 @@
+import pytest
+
+from chaoslib.exceptions import InvalidActivity
+from chaoslib.provider.python import (
+    clear_callable_cache,
+    resolve_callable,
+    run_python_activity,
+    validate_python_activity,
+)
+
+
+def test_resolved_callable_is_cached():
+    clear_callable_cache()
+    resolved = resolve_callable("os.path", "join")
+    assert resolve_callable("os.path", "join") is resolved
+    assert resolved.is_function
+
+
+def test_resolved_callable_knows_its_injected_parameters():
+    resolved = resolve_callable("fixtures.configprobe", "raise_exception")
+    assert not resolved.accepts_configuration
+    assert not resolved.accepts_secrets
+
+    resolved = resolve_callable("fixtures.controls.dummy", "configure_control")
+    assert resolved.accepts_configuration
+    assert resolved.accepts_secrets
+
+
+def test_clear_callable_cache_by_module():
+    a = resolve_callable("os.path", "join")
+    b = resolve_callable("os.path", "exists")
+    c = resolve_callable("statistics", "mean")
+
+    clear_callable_cache("os.path", "join")
+    assert resolve_callable("os.path", "join") is not a
+    assert resolve_callable("os.path", "exists") is b
+
+    clear_callable_cache("os.path")
+    assert resolve_callable("os.path", "exists") is not b
+    assert resolve_callable("statistics", "mean") is c
+
+
+def test_validation_and_execution_share_the_cache():
+    clear_callable_cache()
+    activity = {
+        "type": "probe",
+        "name": "mean",
+        "provider": {
+            "type": "python",
+            "module": "statistics",
+            "func": "mean",
+            "arguments": {"data": [1, 3]},
+        },
+    }
+    validate_python_activity(activity)
+    resolved = resolve_callable("statistics", "mean")
+    assert run_python_activity(activity, None, None) == 2
+    assert resolve_callable("statistics", "mean") is resolved
+
+
+def test_validation_rejects_non_function_attributes():
+    activity = {
+        "type": "probe",
+        "name": "sep",
+        "provider": {"type": "python", "module": "os", "func": "sep"},
+    }
+    with pytest.raises(InvalidActivity):
+        validate_python_activity(activity)
+
+
+def test_validation_rejects_functions_without_signature():
+    clear_callable_cache()
+    activity = {
+        "type": "probe",
+        "name": "getattr",
+        "provider": {"type": "python", "module": "builtins", "func": "getattr"},
+    }
+    assert resolve_callable("builtins", "getattr").signature is None
+    with pytest.raises(InvalidActivity):
+        validate_python_activity(activity)
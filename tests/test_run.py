@@ -1,13 +1,26 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import datetime
 from typing import NoReturn
+from unittest.mock import patch
 
+import pytest
 from fixtures import experiments, run_handlers
 
+from chaoslib.control import global_controls, load_global_controls
 from chaoslib.experiment import run_experiment
 from chaoslib.run import (
+    AsyncEventHandlerRegistry,
     EventHandlerRegistry,
+    HypothesisIterations,
+    ProbeAggregate,
     RunEventHandler,
     Schedule,
     Strategy,
+    run_hypothesis_at_fixed_rate,
 )
 from chaoslib.types import Experiment, Journal
 
@@ -58,6 +71,22 @@ def test_run_ssh_continuous():
     assert journal["steady_states"]["during"] is not None
 
 
+def test_run_ssh_continuous_at_fixed_rate():
+    experiment = experiments.SimpleExperiment.copy()
+    journal = run_experiment(
+        experiment,
+        strategy=Strategy.CONTINUOUS,
+        schedule=Schedule(
+            continuous_hypothesis_frequency=0.1, mode="fixed-rate"
+        ),
+    )
+    assert journal["status"] == "completed"
+    during = journal["steady_states"]["during"]
+    assert len(during) > 0
+    for state in during:
+        assert state["schedule"]["started"] >= state["schedule"]["scheduled"]
+
+
 def test_exit_continuous_ssh_continuous_when_experiment_is_interrupted():
     handlers_called = []
 
@@ -295,3 +324,585 @@ def test_do_not_ruin_method_on_failing_before_ssh():
     assert journal["status"] == "completed"
     assert journal["deviated"] is False
     assert len(journal["run"]) == 0
+
+
+def test_run_method_as_a_graph_of_activities():
+    experiment = deepcopy(experiments.ExperimentWithActivityDependencies)
+    journal = run_experiment(experiment)
+
+    assert journal["status"] == "completed"
+
+    runs = {r["activity"]["name"]: r for r in journal["run"]}
+    assert len(runs) == 3
+    # independent activities run side by side
+    first, second = runs["first"], runs["second"]
+    assert first["start"] < second["end"]
+    assert second["start"] < first["end"]
+    third_start = runs["third"]["start"]
+    assert third_start >= runs["first"]["end"]
+    assert third_start >= runs["second"]["end"]
+
+
+def test_dynamic_configuration_is_reported_in_the_journal():
+    experiment = deepcopy(experiments.SimpleExperiment)
+    experiment["configuration"] = {
+        "value": {
+            "type": "probe",
+            "provider": {
+                "type": "python",
+                "module": "fixtures.configprobe",
+                "func": "slow",
+                "arguments": {"seconds": 0},
+            },
+        },
+    }
+    journal = run_experiment(
+        experiment,
+        settings={"runtime": {"configuration": {"max_workers": 2}}},
+    )
+
+    report = journal["dynamic_configuration"]
+    assert report["value"]["status"] == "succeeded"
+    assert report["value"]["depends_on"] == []
+
+
+def test_async_registry_calls_handlers_in_order_from_another_thread():
+    registry = AsyncEventHandlerRegistry()
+    h = run_handlers.FullRunEventHandler()
+    registry.register(h)
+
+    registry.started(None, None)
+    registry.start_method(None)
+    registry.start_activity(None)
+    registry.activity_completed(None, None)
+    registry.method_completed(None, None)
+    registry.finish(None)
+
+    assert h.calls == [
+        "started",
+        "start_method",
+        "start_activity",
+        "activity_completed",
+        "method_completed",
+        "finish",
+    ]
+    stats = registry.stats()
+    assert stats["pending"] == 0
+    assert stats["handlers"]["FullRunEventHandler"]["calls"] == 6
+
+
+def test_async_registry_does_not_wait_for_slow_handlers():
+    class SlowHandler(RunEventHandler):
+        def __init__(self):
+            self.runs = []
+            self.threads = set()
+
+        def activity_completed(self, activity, run) -> None:
+            time.sleep(0.3)
+            self.threads.add(threading.get_ident())
+            self.runs.append(run)
+
+    handler = SlowHandler()
+    settings = {"runtime": {"events": {"dispatch": "async"}}}
+    experiment = deepcopy(experiments.SimpleExperiment)
+
+    journal = run_experiment(
+        experiment, settings=settings, event_handlers=[handler]
+    )
+
+    # the journal is complete once all events were handled, off the run
+    assert len(handler.runs) == len(journal["run"]) + 2
+    assert threading.get_ident() not in handler.threads
+
+
+def test_async_registry_can_drop_oldest_events():
+    release = threading.Event()
+    h = run_handlers.FullRunEventHandler()
+
+    class BlockingHandler(RunEventHandler):
+        def started(self, experiment, journal) -> None:
+            release.wait(5)
+
+    registry = AsyncEventHandlerRegistry(queue_size=2, overflow="drop-oldest")
+    registry.register(BlockingHandler())
+    registry.register(h)
+
+    registry.started(None, None)
+    registry.flush(0.1)
+    registry.start_method(None)
+    registry.start_activity(None)
+    registry.activity_completed(None, None)
+    registry.method_completed(None, None)
+    release.set()
+    registry.finish(None)
+
+    assert registry.dropped == 3
+    assert h.calls == ["started", "method_completed", "finish"]
+
+
+def test_async_registry_can_coalesce_iterations():
+    release = threading.Event()
+    states = []
+
+    class Handler(RunEventHandler):
+        def started(self, experiment, journal) -> None:
+            release.wait(5)
+
+        def continuous_hypothesis_iteration(self, iteration_index, state):
+            states.append(state)
+
+    registry = AsyncEventHandlerRegistry(queue_size=2, overflow="coalesce")
+    registry.register(Handler())
+
+    registry.started(None, None)
+    registry.flush(0.1)
+    for index in range(10):
+        registry.continuous_hypothesis_iteration(index, index)
+    release.set()
+    registry.finish(None)
+
+    # the most recent pending iteration is replaced by the new one
+    assert registry.coalesced == 8
+    assert states == [0, 9]
+
+
+def test_async_registry_handles_events_dispatched_by_a_handler_inline():
+    registry = AsyncEventHandlerRegistry(queue_size=1, overflow="block")
+    calls = []
+
+    class Handler(RunEventHandler):
+        def started(self, experiment, journal) -> None:
+            # the queue is full, waiting for room would never end
+            for _ in range(3):
+                registry.start_method(None)
+
+        def start_method(self, experiment) -> None:
+            calls.append(threading.current_thread().name)
+
+    registry.register(Handler())
+    registry.started(None, None)
+    registry.start_activity(None)
+    assert registry.flush(5)
+    registry.close()
+
+    assert calls == ["chaostoolkit-events"] * 3
+
+
+def test_async_registry_closes_while_events_are_dropped():
+    registry = AsyncEventHandlerRegistry(queue_size=1, overflow="drop-oldest")
+    registry.register(run_handlers.FullRunEventHandler())
+    stop = threading.Event()
+
+    def dispatch() -> None:
+        while not stop.is_set():
+            registry.start_activity(None)
+
+    threads = [threading.Thread(target=dispatch) for _ in range(4)]
+    for t in threads:
+        t.start()
+    try:
+        for _ in range(20):
+            thread = registry._thread
+            registry.close(timeout=5)
+            assert thread is None or not thread.is_alive()
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+    registry.close(timeout=5)
+
+
+def test_async_registry_rejects_unknown_overflow_policy():
+    with pytest.raises(ValueError):
+        AsyncEventHandlerRegistry(overflow="ignore")
+
+
+def run_isolated_worker(worker: int, barrier: threading.Barrier):
+    settings = {
+        "worker": worker,
+        "controls": {
+            "dummy": {
+                "provider": {
+                    "type": "python",
+                    "module": "fixtures.controls.dummy",
+                }
+            }
+        },
+    }
+    experiment = {
+        "title": f"worker {worker}",
+        "description": "n/a",
+        "configuration": {"dummy-key": f"worker-{worker}"},
+        "method": [
+            {
+                "type": "probe",
+                "name": "whoami",
+                "background": True,
+                "provider": {
+                    "type": "python",
+                    "module": "chaoslib.settings",
+                    "func": "get_loaded_settings",
+                },
+            },
+            {
+                "type": "probe",
+                "name": "echo",
+                "provider": {
+                    "type": "python",
+                    "module": "os.path",
+                    "func": "join",
+                    "arguments": {"a": f"worker-{worker}"},
+                },
+                "pauses": {"after": 0.01},
+            },
+            {"ref": "echo"},
+        ],
+    }
+
+    barrier.wait(5)
+    load_global_controls(settings)
+    journal = run_experiment(experiment, settings=settings)
+    return experiment, journal
+
+
+def assert_worker_is_isolated(worker: int, experiment, journal):
+    assert journal["status"] == "completed"
+    assert experiment["control-value"] == f"worker-{worker}"
+
+    # the dummy control also appends a marker to the runs
+    runs = [r for r in journal["run"] if isinstance(r, dict)]
+    assert len(runs) == 3
+    for run in runs:
+        assert run["status"] == "succeeded"
+        assert run["after_activity_control"] is True
+        if run["activity"]["name"] == "whoami":
+            assert run["output"]["worker"] == worker
+        else:
+            assert run["output"] == f"worker-{worker}"
+
+
+def test_concurrent_runs_in_threads_do_not_share_their_state():
+    workers = 8
+    barrier = threading.Barrier(workers)
+    results = {}
+
+    def target(worker: int) -> None:
+        results[worker] = run_isolated_worker(worker, barrier)
+
+    threads = [
+        threading.Thread(target=target, args=(w,)) for w in range(workers)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(30)
+
+    assert sorted(results) == list(range(workers))
+    for worker, (experiment, journal) in results.items():
+        assert_worker_is_isolated(worker, experiment, journal)
+
+    # nothing leaked into the context of the caller
+    assert global_controls.get() is None
+
+
+def test_concurrent_runs_in_asyncio_tasks_do_not_share_their_state():
+    workers = 8
+    barrier = threading.Barrier(workers)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(workers))
+        return await asyncio.gather(
+            *[
+                asyncio.to_thread(run_isolated_worker, w, barrier)
+                for w in range(workers)
+            ]
+        )
+
+    results = asyncio.run(main())
+
+    for worker, (experiment, journal) in enumerate(results):
+        assert_worker_is_isolated(worker, experiment, journal)
+    assert global_controls.get() is None
+
+
+class FakeClock:
+    """
+    Stands in for the `time` module and the stop event of the schedule: time
+    only passes while sleeping or waiting, and the event is set at `stop`.
+    """
+
+    def __init__(self, stop: float):
+        self.now = 0.0
+        self.stop = stop
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return 1_700_000_000.0 + self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def is_set(self) -> bool:
+        return self.now >= self.stop
+
+    def set(self) -> None:
+        self.stop = min(self.stop, self.now)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        if timeout is None or self.now + timeout >= self.stop:
+            self.now = max(self.now, self.stop)
+            return True
+        self.now += timeout
+        return False
+
+
+def run_at_fixed_rate(schedule: Schedule, latency: float, duration: float):
+    clock = FakeClock(stop=duration)
+    journal = {"status": None, "steady_states": {"during": []}}
+    iterations = HypothesisIterations(schedule, journal, EventHandlerRegistry())
+
+    def run_iteration():
+        clock.sleep(latency)
+        return {"steady_state_met": True, "probes": []}
+
+    with patch("chaoslib.run.time", clock):
+        run_hypothesis_at_fixed_rate(
+            clock, schedule, journal, iterations, run_iteration
+        )
+    return [s["schedule"] for s in journal["steady_states"]["during"]]
+
+
+def scheduled_offsets(schedules):
+    first = datetime.fromisoformat(schedules[0]["scheduled"])
+    return [
+        (datetime.fromisoformat(s["scheduled"]) - first).total_seconds()
+        for s in schedules
+    ]
+
+
+def test_fixed_rate_does_not_drift_with_probe_latency():
+    schedule = Schedule(continuous_hypothesis_frequency=0.1, mode="fixed-rate")
+    schedules = run_at_fixed_rate(schedule, latency=0.04, duration=0.58)
+
+    # fixed delay would only fit 4 iterations in that time
+    assert len(schedules) == 6
+    offsets = scheduled_offsets(schedules)
+    assert offsets == pytest.approx([i * 0.1 for i in range(6)], abs=0.001)
+    assert all(s["skipped"] == 0 for s in schedules)
+    assert all(s["lag"] == pytest.approx(0) for s in schedules)
+
+
+def test_fixed_rate_skips_overdue_iterations():
+    schedule = Schedule(
+        continuous_hypothesis_frequency=0.1, mode="fixed-rate", overrun="skip"
+    )
+    schedules = run_at_fixed_rate(schedule, latency=0.15, duration=0.58)
+
+    offsets = scheduled_offsets(schedules)
+    assert offsets == pytest.approx([0, 0.2, 0.4], abs=0.001)
+    assert [s["skipped"] for s in schedules] == [0, 1, 1]
+
+
+def test_fixed_rate_catches_up_with_overdue_iterations():
+    schedule = Schedule(
+        continuous_hypothesis_frequency=0.1,
+        mode="fixed-rate",
+        overrun="catch-up",
+    )
+    schedules = run_at_fixed_rate(schedule, latency=0.15, duration=0.58)
+
+    offsets = scheduled_offsets(schedules)
+    assert offsets == pytest.approx([0, 0.1, 0.2, 0.3], abs=0.001)
+    assert all(s["skipped"] == 0 for s in schedules)
+    # late iterations start straight away but the lag grows
+    lags = [s["lag"] for s in schedules]
+    assert lags == pytest.approx([0, 0.05, 0.1, 0.15])
+
+
+def test_fixed_rate_runs_overdue_iterations_concurrently():
+    schedule = Schedule(
+        continuous_hypothesis_frequency=0.1,
+        mode="fixed-rate",
+        overrun="concurrent",
+        max_in_flight=2,
+    )
+    event = threading.Event()
+    journal = {"status": None, "steady_states": {"during": []}}
+    iterations = HypothesisIterations(schedule, journal, EventHandlerRegistry())
+    lock = threading.Lock()
+    running = []
+    overlapped = []
+
+    def run_iteration():
+        with lock:
+            running.append(None)
+            overlapped.append(len(running))
+        # outlasts the period, so the next iteration is due meanwhile
+        time.sleep(0.3)
+        with lock:
+            running.pop()
+        return {"steady_state_met": True, "probes": []}
+
+    timer = threading.Timer(1, event.set)
+    timer.start()
+    try:
+        run_hypothesis_at_fixed_rate(
+            event, schedule, journal, iterations, run_iteration
+        )
+    finally:
+        timer.cancel()
+
+    assert max(overlapped) == 2
+    schedules = [s["schedule"] for s in journal["steady_states"]["during"]]
+    schedules.sort(key=lambda s: s["scheduled"])
+    assert len(schedules) >= 2
+    # still due on the fixed rate, whatever the iterations skipped meanwhile
+    steps = [round(o / 0.1) for o in scheduled_offsets(schedules)]
+    assert scheduled_offsets(schedules) == pytest.approx(
+        [i * 0.1 for i in steps], abs=0.001
+    )
+    assert steps == sorted(set(steps))
+
+
+def test_fixed_rate_concurrent_iterations_fail_fast_right_away():
+    schedule = Schedule(
+        continuous_hypothesis_frequency=60,
+        mode="fixed-rate",
+        overrun="concurrent",
+        max_in_flight=2,
+        fail_fast=True,
+    )
+    event = threading.Event()
+    journal = {"status": None, "steady_states": {"during": []}}
+    iterations = HypothesisIterations(schedule, journal, EventHandlerRegistry())
+
+    def run_iteration():
+        # still running once the loop waits for the next iteration
+        time.sleep(0.1)
+        return {
+            "steady_state_met": False,
+            "probes": [{"activity": {"name": "deviates"}}],
+        }
+
+    started = time.monotonic()
+    timer = threading.Timer(120, event.set)
+    timer.start()
+    try:
+        run_hypothesis_at_fixed_rate(
+            event, schedule, journal, iterations, run_iteration
+        )
+    finally:
+        timer.cancel()
+
+    # not waiting for the next iteration, due in a minute
+    assert time.monotonic() - started < 30
+    assert journal["status"] == "failed"
+    assert len(journal["steady_states"]["during"]) == 1
+
+
+def test_schedule_rejects_unknown_policies():
+    with pytest.raises(ValueError):
+        Schedule(mode="whenever")
+    with pytest.raises(ValueError):
+        Schedule(overrun="ignore")
+
+
+def hypothesis_state(met: bool, duration: float):
+    return {
+        "steady_state_met": met,
+        "probes": [
+            {
+                "activity": {"name": "probe"},
+                "status": "succeeded",
+                "tolerance_met": met,
+                "duration": duration,
+            }
+        ],
+    }
+
+
+def test_continuous_hypothesis_retains_last_states_and_failures(tmp_path):
+    history = tmp_path / "history.jsonl"
+    schedule = Schedule(history_size=3, history_path=str(history))
+    journal = {"status": None, "steady_states": {"during": []}}
+    iterations = HypothesisIterations(schedule, journal, EventHandlerRegistry())
+
+    states = [hypothesis_state(i not in (2, 5), 0.01 * i) for i in range(10)]
+    for index, state in enumerate(states):
+        iterations.record(index + 1, state)
+    iterations.close()
+
+    during = journal["steady_states"]["during"]
+    assert during == [states[2], states[5], states[7], states[8], states[9]]
+    assert len(history.read_text().splitlines()) == 10
+
+    summary = journal["continuous_hypothesis"]
+    assert summary["iterations"] == 10
+    assert summary["deviations"] == 2
+    assert summary["dropped"] == 5
+    probe = summary["probes"]["probe"]
+    assert probe["count"] == 10
+    assert probe["tolerance_met"] == 8
+    assert probe["pass_ratio"] == 0.8
+    assert probe["duration"]["min"] == 0
+    assert probe["duration"]["max"] == 0.09
+    assert probe["duration"]["mean"] == pytest.approx(0.045)
+
+
+def test_continuous_hypothesis_can_drop_every_state():
+    schedule = Schedule(history_size=0, keep_failures=False)
+    journal = {"status": None, "steady_states": {"during": []}}
+    iterations = HypothesisIterations(schedule, journal, EventHandlerRegistry())
+
+    for index in range(5):
+        iterations.record(index + 1, hypothesis_state(index % 2 == 0, 0.1))
+    iterations.close()
+
+    assert journal["steady_states"]["during"] == []
+    assert journal["continuous_hypothesis"]["dropped"] == 5
+
+
+def test_continuous_hypothesis_drops_states_by_position():
+    schedule = Schedule(history_size=1, keep_failures=False)
+    journal = {"status": None, "steady_states": {"during": []}}
+    iterations = HypothesisIterations(schedule, journal, EventHandlerRegistry())
+
+    # equal states, and iterations without any hypothesis to run
+    states = [None, hypothesis_state(True, 0.1), hypothesis_state(True, 0.1)]
+    for index, state in enumerate(states):
+        iterations.record(index + 1, state)
+    iterations.close()
+
+    during = journal["steady_states"]["during"]
+    assert len(during) == 2
+    assert during[0] is None
+    assert during[1] is states[2]
+    assert journal["continuous_hypothesis"]["dropped"] == 1
+
+
+def test_continuous_hypothesis_keeps_every_state_by_default():
+    journal = {"status": None, "steady_states": {"during": []}}
+    iterations = HypothesisIterations(
+        Schedule(), journal, EventHandlerRegistry()
+    )
+
+    for index in range(5):
+        iterations.record(index + 1, hypothesis_state(True, 0.1))
+    iterations.close()
+
+    assert len(journal["steady_states"]["during"]) == 5
+    assert "continuous_hypothesis" not in journal
+
+
+def test_probe_aggregate_percentiles_are_within_precision():
+    aggregate = ProbeAggregate()
+    for i in range(1, 1001):
+        aggregate.add({"status": "succeeded", "duration": i / 1000})
+
+    assert aggregate.percentile(0.5) == pytest.approx(0.5, rel=0.01)
+    assert aggregate.percentile(0.9) == pytest.approx(0.9, rel=0.01)
+    assert aggregate.percentile(0.99) == pytest.approx(0.99, rel=0.01)
+    assert len(aggregate.buckets) < 1000
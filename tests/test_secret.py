@@ -6,7 +6,7 @@ from fixtures import config
 from hvac.exceptions import InvalidRequest
 
 from chaoslib.exceptions import InvalidExperiment
-from chaoslib.secret import create_vault_client, load_secrets
+from chaoslib.secret import clear_vault_cache, create_vault_client, load_secrets
 
 
 @patch.dict(os.environ, {"KUBE_API_URL": "http://1.2.3.4"})
@@ -397,3 +397,93 @@ def test_override_vault_with_vars(hvac):
         {"myapp": {"token": "baz"}},
     )
     assert secrets["myapp"]["token"] == "baz"
+
+
+def kv2_payload(data):
+    return {"data": {"data": data, "metadata": {}}}
+
+
+@patch("chaoslib.secret.hvac")
+def test_vault_authenticates_once_and_reads_each_path_once(hvac):
+    config = {
+        "vault_addr": "http://someaddr.com",
+        "vault_role_id": "mighty_id",
+        "vault_role_secret": "secret_secret",
+    }
+
+    fake_client = MagicMock()
+    fake_client.auth_approle.return_value = {"auth": {"client_token": "tk"}}
+    hvac.Client.return_value = fake_client
+    payloads = {
+        ("secret", "app/db"): kv2_payload({"user": "jane", "pwd": "shhh"}),
+        ("other", "app/api"): kv2_payload({"token": "abc"}),
+    }
+    fake_client.secrets.kv.v2.read_secret_version.side_effect = (
+        lambda path, mount_point: payloads[(mount_point, path)]
+    )
+
+    secrets = load_secrets(
+        {
+            "db": {
+                "user": {"type": "vault", "path": "app/db", "key": "user"},
+                "pwd": {"type": "vault", "path": "app/db", "key": "pwd"},
+                "all": {"type": "vault", "path": "app/db"},
+            },
+            "api": {
+                "token": {
+                    "type": "vault",
+                    "path": "app/api",
+                    "key": "token",
+                    "mount_point": "other",
+                },
+            },
+            "overridden": {
+                "token": {"type": "vault", "path": "app/overridden"},
+            },
+        },
+        config,
+        {"overridden": {"token": "abc"}},
+    )
+
+    assert secrets == {
+        "db": {
+            "user": "jane",
+            "pwd": "shhh",
+            "all": {"user": "jane", "pwd": "shhh"},
+        },
+        "api": {"token": "abc"},
+        "overridden": {"token": "abc"},
+    }
+    assert hvac.Client.call_count == 1
+    assert fake_client.auth_approle.call_count == 1
+    assert fake_client.secrets.kv.v2.read_secret_version.call_count == 2
+
+
+@patch("chaoslib.secret.hvac")
+def test_vault_client_and_secrets_are_cached_for_their_ttl(hvac):
+    config = {
+        "vault_addr": "http://someaddr.com",
+        "vault_token": "not_awesome_token",
+        "vault_secrets_cache_ttl": 60,
+    }
+    secrets_info = {"app": {"token": {"type": "vault", "path": "app/api"}}}
+
+    fake_client = MagicMock()
+    hvac.Client.return_value = fake_client
+    fake_client.secrets.kv.v2.read_secret_version.return_value = kv2_payload(
+        {"token": "abc"}
+    )
+
+    clear_vault_cache()
+    try:
+        first = load_secrets(secrets_info, config)
+        second = load_secrets(secrets_info, config)
+
+        assert first == second == {"app": {"token": {"token": "abc"}}}
+        assert hvac.Client.call_count == 1
+        assert fake_client.secrets.kv.v2.read_secret_version.call_count == 1
+
+        load_secrets(secrets_info, dict(config, vault_token="another"))
+        assert hvac.Client.call_count == 2
+    finally:
+        clear_vault_cache()
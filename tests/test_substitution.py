@@ -1,6 +1,11 @@
 from fixtures import config
 
-from chaoslib import substitute
+from chaoslib import (
+    compile_substitution,
+    substitute,
+    substitute_with_plan,
+    substitution_plans,
+)
 from chaoslib.configuration import load_configuration
 from chaoslib.hypothesis import run_steady_state_hypothesis, within_tolerance
 from chaoslib.provider.http import run_http_activity
@@ -160,3 +165,81 @@ def test_tolerance_substitution_is_noop_on_non_var() -> None:
     )
 
     assert state["steady_state_met"] is False
+
+
+def test_plan_only_records_leaves_with_patterns():
+    args = {
+        "message": "hello ${name}",
+        "static": {"a": "b", "c": [1, 2, "d"]},
+        "items": ["x", "$age", {"price": "$$5"}],
+    }
+
+    plan = compile_substitution(args)
+
+    assert set(plan.templates) == {
+        ("message",),
+        ("items", 1),
+        ("items", 2, "price"),
+    }
+
+
+def test_plan_applies_like_substitute():
+    args = {
+        "message": "hello ${name}",
+        "age": "${age}",
+        "static": {"a": "b", "c": [1, 2, "d"]},
+        "items": ["x", "$name", {"price": "$$5"}],
+    }
+    secrets = {"ident": {"other": "Joe"}}
+
+    plan = compile_substitution(args)
+
+    assert plan.apply(config.SomeConfig, secrets) == substitute(
+        args, config.SomeConfig, secrets
+    )
+
+
+def test_plan_copies_every_container():
+    args = {"message": "hello ${name}", "static": {"a": ["b"]}, "n": ["$x"]}
+    plan = compile_substitution(args)
+
+    new_args = plan.apply(config.SomeConfig, None)
+    new_args["static"]["a"].append("c")
+
+    assert args == {
+        "message": "hello ${name}",
+        "static": {"a": ["b"]},
+        "n": ["$x"],
+    }
+    assert plan.apply(config.SomeConfig, None)["static"] == {"a": ["b"]}
+
+
+def test_plan_of_static_payload_returns_a_copy():
+    args = {"static": {"a": "b"}}
+
+    plan = compile_substitution(args)
+    new_args = plan.apply(config.SomeConfig, None)
+
+    assert plan.is_static
+    assert new_args == args
+    assert new_args is not args
+    assert new_args["static"] is not args["static"]
+
+
+def test_plans_are_cached_whatever_the_configuration():
+    substitution_plans.clear()
+    args = {"message": "hello ${name}"}
+    configuration = {"name": "Jane"}
+
+    first = substitution_plans.get(args)
+    assert substitution_plans.get(args) is first
+
+    configuration["name"] = "Joe"
+    assert substitute_with_plan(args, configuration, None) == {
+        "message": "hello Joe"
+    }
+    assert substitute_with_plan(args, {"name": "Jane"}, None) == {
+        "message": "hello Jane"
+    }
+    assert substitution_plans.get(args) is first
+    substitution_plans.clear()
@@ -1,6 +1,14 @@
+from unittest.mock import patch
+
 import pytest
 
-from chaoslib import convert_to_type, decode_bytes
+import chaoslib
+from chaoslib import (
+    clear_encoding_cache,
+    convert_to_type,
+    decode_bytes,
+    detect_encoding,
+)
 
 
 def test_can_convert_to_bool():
@@ -51,3 +59,33 @@ def test_can_convert_to_json_is_silent_when_no_value_given():
 
 def test_decode_bytes():
     assert decode_bytes("noël".encode()) == "noël"
+
+
+def test_decode_bytes_does_not_detect_utf8():
+    with patch("chaoslib.detect") as detect:
+        assert decode_bytes("noël".encode()) == "noël"
+    detect.assert_not_called()
+
+
+def test_decode_bytes_detects_on_a_sample_only():
+    data = "noël ".encode("cp1252") * 100000
+    with patch("chaoslib.detect", return_value={}) as detect:
+        detect_encoding(data)
+    assert len(detect.call_args[0][0]) == chaoslib.DETECTION_SAMPLE_SIZE
+
+
+def test_decode_bytes_caches_detected_encoding_per_key():
+    clear_encoding_cache()
+    data = "Les élèves étaient à l'école très tôt.".encode("cp1252")
+    try:
+        expected = decode_bytes(data, cache_key=("probe", "stdout"))
+        with patch("chaoslib.detect") as detect:
+            assert decode_bytes(data, cache_key=("probe", "stdout")) == expected
+        detect.assert_not_called()
+
+        detected = {"encoding": "cp1252", "confidence": 1.0}
+        with patch("chaoslib.detect", return_value=detected) as detect:
+            decode_bytes(data, cache_key=("other", "stdout"))
+        detect.assert_called_once()
+    finally:
+        clear_encoding_cache()
@@ -0,0 +1,132 @@
+import os
+import stat
+from copy import deepcopy
+from unittest.mock import patch
+
+import pytest
+from fixtures import experiments
+
+from chaoslib.exceptions import InvalidExperiment
+from chaoslib.experiment import (
+    ensure_experiment_is_valid,
+    validate_experiments,
+)
+from chaoslib.validation import ValidationCache, environment_fingerprint
+
+
+@pytest.fixture
+def settings(tmp_path) -> dict:
+    return {"runtime": {"validation": {"cache": str(tmp_path)}}}
+
+
+def test_valid_experiment_is_not_validated_again(settings):
+    experiment = deepcopy(experiments.Experiment)
+    ensure_experiment_is_valid(experiment, settings)
+
+    with patch("chaoslib.experiment.ensure_activity_is_valid") as validate:
+        ensure_experiment_is_valid(experiment, settings)
+    validate.assert_not_called()
+
+
+@pytest.mark.parametrize("check", ["validate_controls", "load_secrets"])
+def test_controls_and_secrets_are_always_validated(settings, check: str):
+    experiment = deepcopy(experiments.Experiment)
+    ensure_experiment_is_valid(experiment, settings)
+
+    # broken since the experiment was cached, such as a control module gone
+    with (
+        patch(
+            f"chaoslib.experiment.{check}",
+            side_effect=InvalidExperiment("broken"),
+        ),
+        pytest.raises(InvalidExperiment),
+    ):
+        ensure_experiment_is_valid(experiment, settings)
+
+
+def test_changed_experiment_is_validated_again(settings):
+    experiment = deepcopy(experiments.Experiment)
+    ensure_experiment_is_valid(experiment, settings)
+
+    experiment["title"] = "another title"
+    with patch("chaoslib.experiment.ensure_activity_is_valid") as validate:
+        ensure_experiment_is_valid(experiment, settings)
+    assert validate.call_count > 0
+
+
+def test_invalid_experiment_is_not_cached(settings, tmp_path):
+    experiment = deepcopy(
+        experiments.ExperimentWithConfigurationCallingMissingEnvKey
+    )
+    for _ in range(2):
+        with pytest.raises(InvalidExperiment):
+            ensure_experiment_is_valid(experiment, settings)
+    assert os.listdir(tmp_path) == []
+
+
+def test_fingerprint_ignores_environment_variables(monkeypatch):
+    # the configuration reading them is validated on every call anyway
+    experiment = deepcopy(
+        experiments.ExperimentWithConfigurationCallingMissingEnvKey
+    )
+    before = environment_fingerprint(experiment)
+    monkeypatch.setenv("DOES_NOT_EXIST", "now it does")
+    assert environment_fingerprint(experiment) == before
+
+
+def test_fingerprint_changes_with_executables(tmp_path):
+    script = tmp_path / "probe.sh"
+    script.write_text("#!/bin/sh\nexit 0\n")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    experiment = {
+        "method": [
+            {
+                "type": "probe",
+                "name": "run-script",
+                "provider": {"type": "process", "path": str(script)},
+            }
+        ]
+    }
+
+    before = environment_fingerprint(experiment)
+    os.utime(script, ns=(0, 0))
+    assert environment_fingerprint(experiment) != before
+
+
+def test_cache_key_combines_experiment_and_environment(tmp_path):
+    cache = ValidationCache(str(tmp_path))
+    experiment = deepcopy(experiments.Experiment)
+    key = cache.key(experiment)
+
+    assert not cache.is_valid(key)
+    cache.mark_valid(key)
+    assert cache.is_valid(key)
+    assert cache.key(deepcopy(experiment)) == key
+
+
+def test_validate_many_experiments(generic_experiment):
+    invalid = deepcopy(experiments.Experiment)
+    invalid["method"] = [{"ref": "does-not-exist"}]
+
+    results = validate_experiments(
+        [generic_experiment, invalid, "/tmp/does/not/exist.json"],
+        max_workers=3,
+    )
+
+    assert [r["valid"] for r in results] == [True, False, False]
+    assert results[0]["source"] == generic_experiment
+    assert results[0]["error"] is None
+    assert results[1]["error"]["type"] == "InvalidActivity"
+    assert results[2]["error"]["type"] == "InvalidSource"
+    for r in results:
+        assert r["duration"] >= r["load_duration"] + r["validation_duration"]
+        assert r["start"] <= r["end"]
+
+
+def test_concurrent_validations_resolve_their_own_references():
+    valid = deepcopy(experiments.Experiment)
+    invalid = deepcopy(experiments.Experiment)
+    invalid["method"] = [{"ref": "does-not-exist"}]
+
+    results = validate_experiments([valid, invalid] * 10, max_workers=8)
+    assert [r["valid"] for r in results] == [True, False] * 10